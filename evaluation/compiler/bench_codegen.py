@@ -0,0 +1,143 @@
+"""Micro-benchmarks for the CUDA-Q code generator.
+
+Broadcast argument construction
+===============================
+Compares how the generated ``compute_tensor`` builds its broadcast argument
+arrays: the legacy code built ``list(itertools.product(...))`` and one list
+comprehension per ISwitch, the current code uses ``np.indices``. Shapes are
+taken from the quantum tensors of ``rand_regular_heinsum`` networks, so the
+index spaces match what the runtime evaluates (up to 4^8 = 65k entries).
+
+Generation time scaling
+=======================
+Times ``quantum_tensor_to_cudaq`` on wide fragments (100-400 qubits) of
+layered ry/cx circuits with ISwitches on a few qubits. Circuit analysis is a
+single pass with a qubit -> index dict, so the generation time per gate
+should stay flat as the qubit and gate counts grow.
+
+Usage:
+    python -m evaluation.compiler.bench_codegen broadcast
+    python -m evaluation.compiler.bench_codegen scaling
+"""
+
+import itertools
+from time import perf_counter
+
+import numpy as np
+from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.circuit.library import HGate, SdgGate, XGate
+
+import benchkit as bk
+from qtpu.compiler.codegen import quantum_tensor_to_cudaq
+from qtpu.core import ISwitch, QuantumTensor, rand_regular_heinsum
+
+
+REPEATS = 5
+
+
+def legacy_broadcast_args(shape: tuple[int, ...]) -> list[list[int]]:
+    """Broadcast arguments as built by the legacy generated code."""
+    ranges = [list(range(size)) for size in shape]
+    all_combos = list(itertools.product(*ranges))
+    return [[c[i] for c in all_combos] for i in range(len(shape))]
+
+
+def vectorized_broadcast_args(shape: tuple[int, ...]) -> np.ndarray:
+    """Broadcast arguments as built by the current generated code."""
+    n = int(np.prod(shape))
+    return np.indices(shape, dtype=np.int64).reshape(len(shape), n)
+
+
+def _best_time(fn, *args) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = perf_counter()
+        fn(*args)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+@bk.foreach(reg=[4, 6, 8])
+@bk.foreach(q_bond_dim=[2, 4])
+@bk.log("logs/compiler/codegen_broadcast.jsonl")
+def bench_broadcast(reg: int, q_bond_dim: int) -> dict:
+    heinsum = rand_regular_heinsum(16, 16, reg=reg, q_bond_dim=q_bond_dim, seed=0)
+
+    shapes = [qt.shape for qt in heinsum.quantum_tensors]
+    legacy_times = [_best_time(legacy_broadcast_args, shape) for shape in shapes]
+    vectorized_times = [_best_time(vectorized_broadcast_args, shape) for shape in shapes]
+
+    for shape in shapes:
+        legacy = legacy_broadcast_args(shape)
+        vectorized = vectorized_broadcast_args(shape)
+        assert np.array_equal(np.asarray(legacy), vectorized)
+
+    legacy_total = sum(legacy_times)
+    vectorized_total = sum(vectorized_times)
+    print(
+        f"reg={reg} q_bond_dim={q_bond_dim}: legacy={legacy_total*1000:.2f}ms "
+        f"vectorized={vectorized_total*1000:.2f}ms "
+        f"speedup={legacy_total / max(vectorized_total, 1e-12):.1f}x"
+    )
+
+    return {
+        "num_elements": [int(np.prod(shape)) for shape in shapes],
+        "legacy_time": legacy_total,
+        "vectorized_time": vectorized_total,
+        "speedup": legacy_total / max(vectorized_total, 1e-12),
+    }
+
+
+def build_wide_fragment(num_qubits: int, num_layers: int, num_iswitches: int = 4) -> QuantumTensor:
+    """Layered ry/cx circuit with ISwitches spread over the qubits."""
+    qc = QuantumCircuit(num_qubits)
+    for layer in range(num_layers):
+        for q in range(num_qubits):
+            qc.ry(0.1 * (layer + 1) * (q + 1), q)
+        for q in range(num_qubits - 1):
+            qc.cx(q, q + 1)
+    for k in range(num_iswitches):
+        iswitch = ISwitch.from_1q_instructions(
+            Parameter(f"i{k}"), [[], [HGate()], [SdgGate(), HGate()], [XGate()]]
+        )
+        qc.append(iswitch, [(k * num_qubits) // num_iswitches])
+    qc.measure_all()
+    return QuantumTensor(qc)
+
+
+@bk.foreach(num_qubits=[100, 200, 400])
+@bk.foreach(num_layers=[2, 4, 8])
+@bk.log("logs/compiler/codegen_scaling.jsonl")
+def bench_scaling(num_qubits: int, num_layers: int) -> dict:
+    qtensor = build_wide_fragment(num_qubits, num_layers)
+    num_gates = len(qtensor.circuit)
+
+    gen_time = _best_time(quantum_tensor_to_cudaq, qtensor.circuit, qtensor.shape)
+    print(
+        f"qubits={num_qubits} layers={num_layers} gates={num_gates}: "
+        f"{gen_time*1000:.1f}ms ({gen_time / num_gates * 1e6:.2f}us/gate)"
+    )
+
+    return {
+        "num_gates": num_gates,
+        "generation_time": gen_time,
+        "time_per_gate": gen_time / num_gates,
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m evaluation.compiler.bench_codegen [broadcast|scaling]")
+        sys.exit(1)
+
+    cmd = sys.argv[1]
+
+    if cmd == "broadcast":
+        bench_broadcast()
+    elif cmd == "scaling":
+        bench_scaling()
+    else:
+        print(f"Unknown command: {cmd}")
+        sys.exit(1)
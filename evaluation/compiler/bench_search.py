@@ -0,0 +1,164 @@
+"""Micro-benchmarks for the cut search (``get_pareto_frontier``).
+
+Per-trial overhead
+==================
+Trials of the search run in worker processes. The legacy search sent the
+full circuit with every trial, and every trial removed the barriers and
+rebuilt the ``HybridCircuitIR``. Now each worker receives a compact payload
+of the IR once (see ``HybridCircuitIR.to_payload``) and trials only carry
+their hyperparameters. This compares the bytes shipped and the setup time
+per trial on 100-qubit circuits, next to the time of a trial itself.
+
+Adaptive sampling
+=================
+Compares the frontiers found with random hyperparameters (30 and 100 trials)
+and with the experimental TPE sampler (30 trials, not exposed by the public
+API until it pays off) on 30 and 40-qubit qnn and vqe_su2 circuits. Frontier quality is the hypervolume
+dominated in (log10(1 + c_cost), max_error), with a reference point shared
+by all runs of a circuit.
+
+Usage:
+    python -m evaluation.compiler.bench_search overhead
+    python -m evaluation.compiler.bench_search sampler
+"""
+
+import math
+import pickle
+from time import perf_counter
+
+import numpy as np
+
+import benchkit as bk
+from evaluation.benchmarks import get_benchmark
+from qtpu.compiler.opt._ir import HybridCircuitIR
+from qtpu.compiler.opt._opt import (
+    _get_pareto_frontier,
+    _hypervolume,
+    _run_trial,
+    _sample_params,
+)
+from qtpu.transforms import remove_operations_by_name
+
+
+REPEATS = 5
+NUM_TRIALS = 4
+MAX_SAMPLING_COST = 120
+
+
+def _best_time(fn, *args) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = perf_counter()
+        fn(*args)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def legacy_trial_setup(blob: bytes) -> HybridCircuitIR:
+    """Per-trial setup of the legacy search: unpickle the circuit, rebuild the IR."""
+    circuit, _, _, _ = pickle.loads(blob)
+    circuit = remove_operations_by_name(circuit, {"barrier"}, inplace=False)
+    return HybridCircuitIR(circuit)
+
+
+def worker_setup(blob: bytes) -> HybridCircuitIR:
+    """Once-per-worker setup: unpickle the payload, rebuild the IR."""
+    return HybridCircuitIR.from_payload(pickle.loads(blob))
+
+
+@bk.foreach(bench=["qnn", "wstate", "vqe_su2"])
+@bk.foreach(circuit_size=[100])
+@bk.log("logs/compiler/search_overhead.jsonl")
+def bench_overhead(bench: str, circuit_size: int) -> dict:
+    circuit = get_benchmark(bench, circuit_size)
+    ir = HybridCircuitIR(remove_operations_by_name(circuit, {"barrier"}, inplace=False))
+    params = _sample_params(np.random.default_rng(0))
+
+    legacy_blob = pickle.dumps((circuit, MAX_SAMPLING_COST, params, 0))
+    trial_blob = pickle.dumps((MAX_SAMPLING_COST, params, 0))
+    payload_blob = pickle.dumps(ir.to_payload())
+
+    legacy_setup = _best_time(legacy_trial_setup, legacy_blob)
+    init_time = _best_time(worker_setup, payload_blob)
+
+    start = perf_counter()
+    for trial_id in range(NUM_TRIALS):
+        _run_trial(ir, MAX_SAMPLING_COST, params, trial_id)
+    trial_time = (perf_counter() - start) / NUM_TRIALS
+
+    print(
+        f"{bench} {circuit_size}q: legacy {len(legacy_blob)/1024:.1f}KiB + "
+        f"{legacy_setup*1000:.1f}ms per trial, now {len(trial_blob)}B per trial + "
+        f"{len(payload_blob)/1024:.1f}KiB / {init_time*1000:.1f}ms per worker "
+        f"(trial: {trial_time*1000:.1f}ms)"
+    )
+
+    return {
+        "num_gates": len(circuit),
+        "legacy_bytes_per_trial": len(legacy_blob),
+        "legacy_setup_per_trial": legacy_setup,
+        "bytes_per_trial": len(trial_blob),
+        "payload_bytes_per_worker": len(payload_blob),
+        "setup_per_worker": init_time,
+        "trial_time": trial_time,
+    }
+
+
+SAMPLER_RUNS = [("random", 100), ("random", 30), ("tpe", 30)]
+
+
+@bk.foreach(bench=["qnn", "vqe_su2"])
+@bk.foreach(circuit_size=[30, 40])
+@bk.foreach(seed=[0, 1, 2])
+@bk.log("logs/compiler/search_sampler.jsonl")
+def bench_sampler(bench: str, circuit_size: int, seed: int) -> dict:
+    circuit = get_benchmark(bench, circuit_size)
+
+    frontiers = {}
+    times = {}
+    for sampler, n_trials in SAMPLER_RUNS:
+        start = perf_counter()
+        result = _get_pareto_frontier(
+            circuit, n_trials=n_trials, seed=seed, sampler=sampler, num_workers=1
+        )
+        times[f"{sampler}_{n_trials}"] = perf_counter() - start
+        frontiers[f"{sampler}_{n_trials}"] = [
+            (math.log10(1 + p.c_cost), p.max_error) for p in result.pareto_frontier
+        ]
+
+    all_coords = [c for frontier in frontiers.values() for c in frontier]
+    reference = (
+        max(cost for cost, _ in all_coords) + 1.0,
+        max(error for _, error in all_coords),
+    )
+    hypervolumes = {
+        name: _hypervolume(frontier, reference) for name, frontier in frontiers.items()
+    }
+    print(
+        f"{bench} {circuit_size}q seed={seed}: "
+        + ", ".join(f"{name}={hv:.3f} ({times[name]:.1f}s)" for name, hv in hypervolumes.items())
+    )
+
+    return {
+        "hypervolume": hypervolumes,
+        "search_time": times,
+        "frontier_size": {name: len(frontier) for name, frontier in frontiers.items()},
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m evaluation.compiler.bench_search [overhead|sampler]")
+        sys.exit(1)
+
+    cmd = sys.argv[1]
+
+    if cmd == "overhead":
+        bench_overhead()
+    elif cmd == "sampler":
+        bench_sampler()
+    else:
+        print(f"Unknown command: {cmd}")
+        sys.exit(1)
@@ -81,7 +81,7 @@ def mono_exp(qc, shots, seed):
 def cut_exp(cut_circuit, shots, seed):
     """Run a pre-cut circuit through the Pauli-noise backend (sim_seed controls shot noise)."""
     htn = circuit_to_heinsum(cut_circuit)
-    n_flats = sum(len(list(qt.flat())) for qt in htn.quantum_tensors)
+    n_flats = sum(len(qt) for qt in htn.quantum_tensors)
     backend = AerStabilizerNoisyQNN(shots=shots)
     # Reseed the simulator run via a per-run counter — backend doesn't take seed directly,
     # but it threads seed_ctr through each flat; we nudge by monkey-patching _shots unused
@@ -144,7 +144,7 @@ def mono_exp(qc, shots, seed):
 def cut_exp(qc, qpu_size, shots, cut_seed):
     cut = qtpu.cut(qc, max_size=qpu_size, cost_weight=1000, n_trials=20, seed=cut_seed, num_workers=1)
     htn = qtpu.circuit_to_heinsum(cut)
-    n_flats = sum(len(list(qt.flat())) for qt in htn.quantum_tensors)
+    n_flats = sum(len(qt) for qt in htn.quantum_tensors)
     rt = HEinsumRuntime(
         htn, backend=AerStabilizerNoisyQNN(shots=shots),
         dtype=torch.float64, device=torch.device("cpu"),
@@ -163,7 +163,7 @@ def _submit_cut(qc, device, shots: int, qpu_size: int) -> dict:
     htn = circuit_to_heinsum(cut)
     compile_time = perf_counter() - t0
 
-    n_flats = sum(len(list(qt.flat())) for qt in htn.quantum_tensors)
+    n_flats = sum(len(qt) for qt in htn.quantum_tensors)
 
     # Pre-submission estimate: transpile ONE representative flat per partition
     # on FakeMarrakesh (local, fast) — all flats within a partition share gate
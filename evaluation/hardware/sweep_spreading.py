@@ -176,7 +176,7 @@ def mono_run(qc, shots: int) -> float:
 def cut_run(qc, qpu_size: int, shots: int):
     cut = qtpu.cut(qc, max_size=qpu_size, cost_weight=1000, n_trials=20, seed=1, num_workers=1)
     htn = qtpu.circuit_to_heinsum(cut)
-    n_flats = sum(len(list(qt.flat())) for qt in htn.quantum_tensors)
+    n_flats = sum(len(qt) for qt in htn.quantum_tensors)
     rt = HEinsumRuntime(
         htn,
         backend=AerStabilizerNoisy(shots=shots),
@@ -443,8 +443,6 @@ def bench_qtpu(circuit_size: int) -> dict | None:
     W = np.random.randn(NUM_SUPPORT) * 0.1
 
     try:
-        import math
-
         start = perf_counter()
         heinsum, compile_time = build_e2e_qtpu(
             circuit_size, X_batch, X_support, W, QPU_SIZE, ZNE_NOISE_LEVELS
@@ -458,15 +456,11 @@ def bench_qtpu(circuit_size: int) -> dict | None:
         total_flat_circuits = 0
         est_qpu_time = 0.0
         for qt in heinsum.quantum_tensors:
-            n_flat = math.prod(qt.shape) if qt.shape else 1
+            n_flat = qt.size
             total_flat_circuits += n_flat
             # Estimate from first flat circuit only
-            rep_circuits = qt.flat()[:1]
-            if rep_circuits:
-                rep_time = estimate_runtime(
-                    [c.decompose() for c in rep_circuits]
-                )
-                est_qpu_time += rep_time * n_flat
+            rep_time = estimate_runtime([qt.get_one().decompose()])
+            est_qpu_time += rep_time * n_flat
 
         # Classical contraction cost
         tree, arrays = heinsum.to_dummy_tn()
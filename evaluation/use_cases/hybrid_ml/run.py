@@ -15,6 +15,9 @@ Compares three approaches for quantum kernel inference in hybrid ML:
 3. HEINSUM (QTPU):
    Define HEinsum with ISwitches → Compile once → Broadcast execute.
    Single circuit with ISwitches, compiled once to CUDA-Q.
+   The "parametric" variant compiles the feature-map ISwitches to one gate
+   sequence reading the angles from tables, so the kernel size does not
+   grow with the batch size.
 
 All three approaches start from the same HEinsum definition, ensuring
 a fair comparison of the execution strategies.
@@ -28,10 +31,24 @@ Sweeps:
 - Circuit sizes (qubits): 20, 50, 100
 - Feature dimensions: 2, 4, 8
 - Batch sizes: 10, 50, 100, 200
+
+Re-batching Benchmark
+=====================
+Runs two different data batches through the same (simulating) backend. With
+parametric ISwitches the second batch reuses the kernel of the first, since
+the feature-map angles are passed to the kernel at call time.
+
+Gradient Benchmark
+==================
+Backward cost of a trainable quantum kernel versus the number of trainable
+parameters P. The legacy parameter-shift loop issues 2P separate
+evaluations; the runtime batches all 2P shifted points into one broadcast.
 """
 
 from __future__ import annotations
 
+from time import perf_counter
+
 import numpy as np
 import torch
 from qiskit import QuantumCircuit
@@ -40,6 +57,7 @@ from qiskit.circuit import Parameter, ClassicalRegister
 import benchkit as bk
 
 from qtpu.core import HEinsum, QuantumTensor, CTensor, ISwitch
+from qtpu.runtime import CudaQBackend, HEinsumRuntime
 from qtpu.runtime.baseline import run_naive, run_batch, run_heinsum
 
 
@@ -57,6 +75,16 @@ NUM_SUPPORT = 20
 # Number of ansatz layers
 NUM_LAYERS = 2
 
+# Gradient benchmark: small circuits, since every point is simulated
+GRAD_CIRCUIT_SIZES = [6, 10]
+GRAD_NUM_PARAMS = [1, 2, 4, 8, 16]
+GRAD_BATCH_SIZE = 10
+GRAD_NUM_SUPPORT = 4
+
+# Re-batching benchmark: two data batches through one backend, simulated
+REBATCH_CIRCUIT_SIZES = [6, 10]
+REBATCH_BATCH_SIZES = [10, 50]
+
 
 # =============================================================================
 # Circuit Construction Helpers
@@ -152,6 +180,61 @@ def build_heinsum(
     return heinsum
 
 
+def build_trainable_heinsum(
+    X_batch: np.ndarray,
+    X_support: np.ndarray,
+    W: np.ndarray,
+    num_qubits: int,
+    num_params: int,
+    layers: int = 2,
+) -> HEinsum:
+    """Build a HEinsum for a quantum kernel with a trainable layer.
+
+    Same as :func:`build_heinsum`, with ``num_params`` trainable RY rotations
+    ``theta_k`` (cycling over the qubits) between the batch and the support
+    feature maps.
+    """
+    qc = QuantumCircuit(num_qubits)
+    qc.add_register(ClassicalRegister(num_qubits))
+
+    batch_param = Parameter("batch")
+    support_param = Parameter("support")
+
+    def make_batch_circuit(idx: int) -> QuantumCircuit:
+        return create_feature_map(num_qubits, X_batch[idx], layers)
+
+    def make_support_circuit(idx: int) -> QuantumCircuit:
+        return create_feature_map(num_qubits, X_support[idx], layers).inverse()
+
+    qc.append(ISwitch(batch_param, num_qubits, len(X_batch), make_batch_circuit), range(num_qubits))
+    for k in range(num_params):
+        qc.ry(Parameter(f"theta_{k}"), k % num_qubits)
+    qc.append(
+        ISwitch(support_param, num_qubits, len(X_support), make_support_circuit),
+        range(num_qubits),
+    )
+    qc.measure(range(num_qubits), range(num_qubits))
+
+    W_tensor = CTensor(torch.tensor(W, dtype=torch.float64), inds=("support",))
+    return HEinsum(
+        qtensors=[QuantumTensor(qc)],
+        ctensors=[W_tensor],
+        input_tensors=[],
+        output_inds=("batch",),
+    )
+
+
+def _loop_param_shift(backend, qtensor, params: dict[str, float]) -> float:
+    """Time the legacy parameter-shift loop: 2 evaluations per parameter."""
+    start = perf_counter()
+    for name in params:
+        for sign in (1.0, -1.0):
+            shifted = dict(params)
+            shifted[name] += sign * np.pi / 2
+            backend.evaluate(qtensor, shifted, torch.float64, torch.device("cpu"))
+    return perf_counter() - start
+
+
 # =============================================================================
 # Benchmark Functions with BenchKit Logging
 # =============================================================================
@@ -265,6 +348,144 @@ def bench_heinsum(circuit_size: int, feature_dim: int, batch_size: int) -> dict
         return None
 
 
+@bk.foreach(circuit_size=CIRCUIT_SIZES)
+@bk.foreach(feature_dim=FEATURE_DIMS)
+@bk.foreach(batch_size=BATCH_SIZES)
+@bk.log("logs/hybrid_ml/heinsum_parametric_breakdown.jsonl")
+def bench_heinsum_parametric(circuit_size: int, feature_dim: int, batch_size: int) -> dict | None:
+    """Benchmark HEinsum (QTPU) with the feature maps compiled to angle tables."""
+    print(f"HEinsum (parametric): qubits={circuit_size}, features={feature_dim}, batch={batch_size}")
+
+    np.random.seed(42)
+    X_batch = np.random.randn(batch_size, feature_dim) * np.pi
+    X_support = np.random.randn(NUM_SUPPORT, feature_dim) * np.pi
+    W = np.random.randn(NUM_SUPPORT) * 0.1
+
+    try:
+        heinsum = build_heinsum(X_batch, X_support, W, circuit_size, NUM_LAYERS)
+        _, timing = run_heinsum(
+            heinsum,
+            skip_execution=True,
+            parametric_iswitches=True,
+        )
+
+        return {
+            "preparation_time": timing.circuit_compilation_time,
+            "quantum_time": timing.quantum_estimated_qpu_time,
+            "num_circuits": timing.num_circuits,
+            "total_code_lines": timing.total_code_lines,
+            "classical_time": timing.classical_contraction_time,
+            "total_time": timing.total_time,
+            "num_support": NUM_SUPPORT,
+            "num_layers": NUM_LAYERS,
+        }
+    except Exception as e:
+        print(f"  Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
+@bk.foreach(circuit_size=REBATCH_CIRCUIT_SIZES)
+@bk.foreach(batch_size=REBATCH_BATCH_SIZES)
+@bk.foreach(parametric=[False, True])
+@bk.log("logs/hybrid_ml/rebatch_breakdown.jsonl")
+def bench_rebatch(circuit_size: int, batch_size: int, parametric: bool) -> dict | None:
+    """Benchmark two data batches run through the same backend."""
+    print(f"Re-batch: qubits={circuit_size}, batch={batch_size}, parametric={parametric}")
+
+    np.random.seed(42)
+    X_batches = [np.random.randn(batch_size, 2) * np.pi for _ in range(2)]
+    X_support = np.random.randn(NUM_SUPPORT, 2) * np.pi
+    W = np.random.randn(NUM_SUPPORT) * 0.1
+
+    try:
+        backend = CudaQBackend(estimate_qpu_time=False, parametric_iswitches=parametric)
+        result = {"num_support": NUM_SUPPORT, "num_layers": NUM_LAYERS}
+        for k, X_batch in enumerate(X_batches):
+            heinsum = build_heinsum(X_batch, X_support, W, circuit_size, NUM_LAYERS)
+            runtime = HEinsumRuntime(heinsum, backend=backend, device="cpu")
+
+            prepare_start = perf_counter()
+            runtime.prepare(optimize=False)
+            prepare_time = perf_counter() - prepare_start
+
+            execute_start = perf_counter()
+            runtime.execute()
+            execute_time = perf_counter() - execute_start
+
+            print(f"  batch {k}: prepare={prepare_time*1000:.1f}ms execute={execute_time*1000:.1f}ms")
+            result[f"batch{k}_preparation_time"] = prepare_time
+            result[f"batch{k}_execution_time"] = execute_time
+
+        result["kernel_cache_hits"] = backend.kernel_cache_hits
+        result["total_code_lines"] = backend.total_code_lines
+        return result
+    except Exception as e:
+        print(f"  Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
+@bk.foreach(circuit_size=GRAD_CIRCUIT_SIZES)
+@bk.foreach(num_params=GRAD_NUM_PARAMS)
+@bk.log("logs/hybrid_ml/gradient_breakdown.jsonl")
+def bench_gradient(circuit_size: int, num_params: int) -> dict | None:
+    """Benchmark backward cost versus the number of trainable parameters."""
+    print(f"Gradient: qubits={circuit_size}, params={num_params}")
+
+    np.random.seed(42)
+    X_batch = np.random.randn(GRAD_BATCH_SIZE, 2) * np.pi
+    X_support = np.random.randn(GRAD_NUM_SUPPORT, 2) * np.pi
+    W = np.random.randn(GRAD_NUM_SUPPORT) * 0.1
+    theta = np.random.randn(num_params)
+
+    try:
+        heinsum = build_trainable_heinsum(
+            X_batch, X_support, W, circuit_size, num_params, NUM_LAYERS
+        )
+        backend = CudaQBackend(estimate_qpu_time=False)
+        runtime = HEinsumRuntime(heinsum, backend=backend, device="cpu").prepare()
+
+        params = {
+            f"theta_{k}": torch.tensor(theta[k], dtype=torch.float64, requires_grad=True)
+            for k in range(num_params)
+        }
+        forward_start = perf_counter()
+        result, _ = runtime.execute(circuit_params=params)
+        forward_time = perf_counter() - forward_start
+
+        backward_start = perf_counter()
+        result.sum().backward()
+        backward_time = perf_counter() - backward_start
+
+        loop_time = _loop_param_shift(
+            backend,
+            heinsum.quantum_tensors[0],
+            {name: float(value) for name, value in params.items()},
+        )
+        print(
+            f"  forward={forward_time*1000:.1f}ms backward={backward_time*1000:.1f}ms "
+            f"loop={loop_time*1000:.1f}ms"
+        )
+
+        return {
+            "forward_time": forward_time,
+            "backward_time": backward_time,
+            "loop_backward_time": loop_time,
+            "num_shifted_evaluations": 2 * num_params,
+            "batch_size": GRAD_BATCH_SIZE,
+            "num_support": GRAD_NUM_SUPPORT,
+            "num_layers": NUM_LAYERS,
+        }
+    except Exception as e:
+        print(f"  Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
 # =============================================================================
 # Main
 # =============================================================================
@@ -282,6 +503,9 @@ Commands:
     naive       Run naive (sequential) benchmark
     batch       Run batch benchmark
     heinsum     Run HEinsum (QTPU) benchmark
+    parametric  Run HEinsum (QTPU) benchmark with ISwitch angle tables
+    rebatch     Run two data batches through one backend (kernel reuse)
+    gradient    Run backward cost vs. number of trainable parameters
     all         Run all benchmarks
 
 Configuration:
@@ -310,6 +534,12 @@ Configuration:
         bench_batch()
     elif cmd == "heinsum":
         bench_heinsum()
+    elif cmd == "parametric":
+        bench_heinsum_parametric()
+    elif cmd == "rebatch":
+        bench_rebatch()
+    elif cmd == "gradient":
+        bench_gradient()
     elif cmd == "all":
         print("Running all benchmarks...")
         bench_naive()
@@ -36,6 +36,8 @@ def compile_to_heinsum(
     num_workers: int | None = None,
     n_trials: int = 100,
     seed: int | None = None,
+    time_budget: float | None = None,
+    patience: int | None = None,
 ) -> HEinsum:
     """Compile a quantum circuit into a hybrid tensor network (hTN).
 
@@ -47,8 +49,11 @@ def compile_to_heinsum(
         max_c_cost: Maximum classical cost.
         cost_weight: Weight for classical cost vs error reduction.
         num_workers: Number of parallel workers.
-        n_trials: Number of optimization trials.
+        n_trials: Maximum number of optimization trials.
         seed: Random seed.
+        time_budget: Wall-clock limit of the cut search in seconds.
+        patience: Stop the cut search after this many trials without
+            improvement of the Pareto frontier.
 
     Returns:
         The compiled HEinsum (hybrid tensor network).
@@ -61,6 +66,8 @@ def compile_to_heinsum(
         num_workers=num_workers,
         n_trials=n_trials,
         seed=seed,
+        time_budget=time_budget,
+        patience=patience,
     )
     return circuit_to_heinsum(cut_circuit)
 
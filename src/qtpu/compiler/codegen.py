@@ -2,7 +2,9 @@
 
 This generates CUDA-Q Python kernel code from circuits containing ISwitch
 instructions, where ISwitches become conditional statements (if/elif chains)
-over the parameter indices.
+over the parameter indices. Optionally, variants that differ only in angles
+share one gate sequence reading the angles from tables passed at call time,
+so circuits differing only in these angles share one kernel.
 
 The generated kernel can be:
 1. Executed directly via cudaq.sample() or cudaq.observe()
@@ -19,7 +21,13 @@ for the 'iswitch' instruction name.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import linecache
+import threading
+import types
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, replace
+from typing import Iterator, NamedTuple
+
 import numpy as np
 
 from qiskit.circuit import QuantumCircuit
@@ -44,6 +52,35 @@ class QPDMeasureInfo:
     qubit: int  # The qubit being "measured"
 
 
+# Map Qiskit gate names to CUDA-Q
+_CUDAQ_GATE_NAMES = {
+    "h": "h",
+    "x": "x",
+    "y": "y",
+    "z": "z",
+    "s": "s",
+    "t": "t",
+    "sdg": "s.adj",
+    "tdg": "t.adj",
+    "sx": "rx",  # sqrt(X) = rx(pi/2)
+    "sxdg": "rx",  # sqrt(X)^dag = rx(-pi/2)
+    "rx": "rx",
+    "ry": "ry",
+    "rz": "rz",
+    "p": "r1",
+    "u": "u3",
+    "u3": "u3",
+    "cx": "x.ctrl",
+    "cz": "z.ctrl",
+    "swap": "swap",
+}
+
+# Operations without an effect on the simulated expectation values. Resets are
+# handled implicitly by the wire cut decomposition (only the ancilla qubits are
+# measured, not the main qubit after a reset).
+_NOOP_GATE_NAMES = frozenset({"id", "delay", "barrier", "measure", "reset", "global_phase"})
+
+
 def extract_gate_info(
     circuit, include_qpd_measures: bool = False
 ) -> list:
@@ -65,89 +102,68 @@ def extract_gate_info(
         CNOT must be emitted at the correct position.
     """
     items: list = []
+    qubit_index = {q: i for i, q in enumerate(circuit.qubits)}
 
     for instr in circuit:
-        op = instr.operation
-        qubits = [circuit.qubits.index(q) for q in instr.qubits]
+        qubits = [qubit_index[q] for q in instr.qubits]
+        items.extend(gate_info(instr.operation, qubits, include_qpd_measures))
 
-        name = op.name.lower()
-        params = list(op.params) if op.params else None
-
-        # Handle QPD measures specially - these become deferred measurements
-        # using an ancilla qubit: CNOT(target, ancilla) + measure(ancilla)
-        if name == "qpd_measure":
-            if include_qpd_measures:
-                items.append(QPDMeasureInfo(qubit=qubits[0]))
-            # Skip adding as a gate - will be handled separately
-            continue
+    return items
 
-        # Skip reset operations - they are handled implicitly in wire cut decomposition
-        # by only measuring ancilla qubits, not the main qubit after reset
-        if name == "reset":
-            continue
 
-        # Map Qiskit gate names to CUDA-Q
-        name_map = {
-            "h": "h",
-            "x": "x",
-            "y": "y",
-            "z": "z",
-            "s": "s",
-            "t": "t",
-            "sdg": "s.adj",
-            "tdg": "t.adj",
-            "sx": "rx",  # sqrt(X) = rx(pi/2)
-            "sxdg": "rx",  # sqrt(X)^dag = rx(-pi/2)
-            "rx": "rx",
-            "ry": "ry",
-            "rz": "rz",
-            "cx": "x.ctrl",
-            "cz": "z.ctrl",
-            "swap": "swap",
-        }
+def gate_info(operation, qubits: list[int], include_qpd_measures: bool = False) -> list:
+    """Gates and QPD measures of a single operation (see :func:`extract_gate_info`).
 
-        if name in name_map:
-            cudaq_name = name_map[name]
-
-            # Handle sx and sxdg: they become rx(pi/2) and rx(-pi/2)
-            if name == "sx":
-                import math
-                items.append(
-                    CudaQGate(
-                        name="rx",
-                        qubits=qubits,
-                        params=[math.pi / 2],
-                    )
-                )
-            elif name == "sxdg":
-                import math
-                items.append(
-                    CudaQGate(
-                        name="rx",
-                        qubits=qubits,
-                        params=[-math.pi / 2],
-                    )
-                )
-            elif name in ("cx", "cz"):
-                # Control gate
-                items.append(
-                    CudaQGate(
-                        name=cudaq_name,
-                        qubits=[qubits[1]],  # target
-                        ctrl_qubits=[qubits[0]],  # control
-                        params=params,
-                    )
-                )
-            else:
-                items.append(
-                    CudaQGate(
-                        name=cudaq_name,
-                        qubits=qubits,
-                        params=params,
-                    )
-                )
+    Args:
+        operation: Qiskit operation.
+        qubits: Indices of the qubits the operation acts on.
+        include_qpd_measures: If True, return a QPD measure as a
+            :class:`QPDMeasureInfo`, else skip it.
 
-    return items
+    Returns:
+        The :class:`CudaQGate` and :class:`QPDMeasureInfo` items of the
+        operation; empty for no-op operations (identities, delays, barriers,
+        measures, resets) and skipped QPD measures.
+
+    Raises:
+        NotImplementedError: If the operation has no CUDA-Q equivalent.
+    """
+    name = operation.name.lower()
+    params = list(operation.params) if operation.params else None
+
+    # Handle QPD measures specially - these become deferred measurements
+    # using an ancilla qubit: CNOT(target, ancilla) + measure(ancilla)
+    if name == "qpd_measure":
+        if include_qpd_measures:
+            return [QPDMeasureInfo(qubit=qubits[0])]
+        # Skip adding as a gate - will be handled separately
+        return []
+
+    if name in _NOOP_GATE_NAMES:
+        return []
+    if name not in _CUDAQ_GATE_NAMES:
+        raise NotImplementedError(f"Gate '{operation.name}' has no CUDA-Q equivalent")
+
+    cudaq_name = _CUDAQ_GATE_NAMES[name]
+
+    # Handle sx and sxdg: they become rx(pi/2) and rx(-pi/2)
+    if name == "sx":
+        import math
+        return [CudaQGate(name="rx", qubits=qubits, params=[math.pi / 2])]
+    if name == "sxdg":
+        import math
+        return [CudaQGate(name="rx", qubits=qubits, params=[-math.pi / 2])]
+    if name in ("cx", "cz"):
+        # Control gate
+        return [
+            CudaQGate(
+                name=cudaq_name,
+                qubits=[qubits[1]],  # target
+                ctrl_qubits=[qubits[0]],  # control
+                params=params,
+            )
+        ]
+    return [CudaQGate(name=cudaq_name, qubits=qubits, params=params)]
 
 
 def gates_to_cudaq_code(
@@ -188,6 +204,132 @@ def gates_to_cudaq_code(
     return lines
 
 
+def _is_numeric_param(p) -> bool:
+    """Whether a gate parameter is a literal number."""
+    return isinstance(p, (int, float, np.integer, np.floating))
+
+
+def _variant_structure(items: list) -> tuple:
+    """Gate structure of an ISwitch variant, ignoring the values of numeric angles.
+
+    Variants with equal structure differ only in numeric gate parameters,
+    which the parametric code generator reads from angle tables.
+    """
+    structure = []
+    for item in items:
+        if isinstance(item, QPDMeasureInfo):
+            structure.append(("qpd_measure", item.qubit))
+            continue
+        params = tuple(None if _is_numeric_param(p) else str(p) for p in item.params or ())
+        structure.append((item.name, tuple(item.qubits), tuple(item.ctrl_qubits or ()), params))
+    return tuple(structure)
+
+
+def _group_variants(variants: list[list]) -> tuple[list[list[int]], np.ndarray | None]:
+    """Group ISwitch variants by gate structure and build their angle table.
+
+    Variants sharing their structure (see :func:`_variant_structure`) are
+    emitted as one gate sequence that reads all numeric gate parameters from
+    the angle table, so the kernel does not depend on their values.
+
+    Args:
+        variants: Items (see :func:`extract_gate_info`) of the variants.
+
+    Returns:
+        Tuple of (groups, table): the ISwitch indices of the variants of each
+        structure, in order of first appearance, and the angle table with one
+        row per ISwitch index. The row of a variant in a shared group holds
+        its numeric gate parameters in order of appearance, all other entries
+        are 0.0. The table is None if no shared group has numeric parameters.
+    """
+    groups: dict[tuple, list[int]] = {}
+    for i, items in enumerate(variants):
+        groups.setdefault(_variant_structure(items), []).append(i)
+
+    rows = {
+        i: [
+            float(p)
+            for item in variants[i]
+            if isinstance(item, CudaQGate)
+            for p in item.params or ()
+            if _is_numeric_param(p)
+        ]
+        for members in groups.values()
+        if len(members) > 1
+        for i in members
+    }
+    width = max((len(row) for row in rows.values()), default=0)
+    if width == 0:
+        return list(groups.values()), None
+
+    table = np.zeros((len(variants), width), dtype=np.float64)
+    for i, row in rows.items():
+        table[i, : len(row)] = row
+    return list(groups.values()), table
+
+
+def _variant_angle_params(
+    items: list,
+    table_arg: str | None,
+    param_formatter: callable,
+) -> list[list[str] | None]:
+    """Formatted gate parameters of a variant whose angles come from a table.
+
+    Numeric parameters are read from the kernel argument ``table_arg`` (the
+    angle table row of the ISwitch value, see :func:`_group_variants`); all
+    others are formatted with ``param_formatter``.
+
+    Returns:
+        For each item, its formatted parameters (None for QPD measures and
+        gates without parameters).
+    """
+    gate_params: list[list[str] | None] = []
+    slot = 0
+    for item in items:
+        if isinstance(item, QPDMeasureInfo) or not item.params:
+            gate_params.append(None)
+            continue
+        formatted = []
+        for p in item.params:
+            if _is_numeric_param(p):
+                formatted.append(f"{table_arg}[{slot}]")
+                slot += 1
+            else:
+                formatted.append(param_formatter(p))
+        gate_params.append(formatted)
+    return gate_params
+
+
+def iswitch_angle_tables(circuit: QuantumCircuit) -> list[np.ndarray]:
+    """Angle tables of a circuit for its parametric kernel.
+
+    Kernels generated with ``parametric_iswitches=True`` read the numeric
+    angles of structurally equal ISwitch variants from tables passed at call
+    time (the ``qtpu_angle_tables`` argument of the generated functions), so
+    circuits differing only in these angles share one kernel.
+
+    Args:
+        circuit: The QuantumCircuit containing ISwitch instructions.
+
+    Returns:
+        One table per ISwitch with table-routed angles, in circuit order,
+        each of shape (ISwitch size, number of angles).
+    """
+    tables = []
+    for instr in circuit:
+        op = instr.operation
+        if op.name != "iswitch":
+            continue
+        variants = [
+            extract_gate_info(op.variant(i), include_qpd_measures=True)
+            for i in range(op.size)
+        ]
+        _, table = _group_variants(variants)
+        if table is not None:
+            tables.append(table)
+    return tables
+
+
 def qpd_measures_to_cudaq_code(
     qpd_measures: list[QPDMeasureInfo],
     qubit_var: str = "q",
@@ -254,11 +396,150 @@ def _sanitize_param_name(name: str) -> str:
     return sanitized
 
 
+@dataclass
+class CircuitLayout:
+    """Qubit layout of the CUDA-Q kernel generated for a circuit.
+
+    Attributes:
+        measured_qubits: Measured main qubits (all qubits if none is measured).
+        iswitch_params: ISwitch index parameter name -> size, in order of
+            first appearance (the order of the kernel's index arguments).
+        iswitch_instances: ISwitch operations in circuit order.
+        iswitch_qubit_mapping: id(iswitch) -> main circuit qubit indices.
+        total_ancillas: Number of ancillas for deferred QPD measures.
+        n_total_qubits: Main qubits plus ancillas.
+        ancilla_offset: id(iswitch) -> index of its first ancilla.
+        traced_out_qubits: Main qubits with an I (instead of Z) observable.
+        instruction_qubits: Main circuit qubit indices of every top-level
+            instruction, in circuit order.
+        parameter_names: Names of all circuit parameters, including those
+            inside ISwitch variants and the ISwitch index parameters.
+    """
+
+    measured_qubits: list[int]
+    iswitch_params: dict[str, int]
+    iswitch_instances: list
+    iswitch_qubit_mapping: dict[int, list[int]]
+    total_ancillas: int
+    n_total_qubits: int
+    ancilla_offset: dict[int, int]
+    traced_out_qubits: set[int]
+    instruction_qubits: list[list[int]]
+    parameter_names: set[str]
+
+    @property
+    def z_qubits(self) -> list[int]:
+        """Qubits carrying a Z in the observable (others carry I)."""
+        main = [q for q in self.measured_qubits if q not in self.traced_out_qubits]
+        ancillas = range(self.n_total_qubits - self.total_ancillas, self.n_total_qubits)
+        return sorted(set(main) | set(ancillas))
+
+
+def analyze_circuit_layout(circuit: QuantumCircuit) -> CircuitLayout:
+    """Determine the qubit layout and observable of the generated kernel.
+
+    Args:
+        circuit: The QuantumCircuit containing ISwitch instructions.
+
+    Returns:
+        The CircuitLayout shared by the code generator and other evaluators
+        that must match the generated kernel's semantics.
+    """
+    n_qubits = circuit.num_qubits
+    qubit_index = {q: i for i, q in enumerate(circuit.qubits)}
+
+    # Single pass over the circuit:
+    # - measured qubits
+    # - ISwitch parameter info (these become int args), using duck-typing:
+    #   check for 'iswitch' instruction name
+    # - last non-barrier op per qubit
+    # - qubit indices of every instruction
+    measured_qubits = []
+    iswitch_params = {}  # param_name -> size (ordered)
+    iswitch_instances = []  # Keep track of ISwitches for sub-circuit scanning
+    iswitch_qubit_mapping = {}  # iswitch_id -> list of qubit indices in main circuit
+    last_op_per_qubit: dict[int, str] = {}
+    instruction_qubits = []
+    for instr in circuit:
+        op = instr.operation
+        name = op.name.lower()
+        qubits = [qubit_index[q] for q in instr.qubits]
+        instruction_qubits.append(qubits)
+
+        if name == "measure":
+            if qubits[0] not in measured_qubits:
+                measured_qubits.append(qubits[0])
+        elif op.name == "iswitch":
+            iswitch_instances.append(op)
+            iswitch_qubit_mapping[id(op)] = qubits
+            if op.param.name not in iswitch_params:
+                iswitch_params[op.param.name] = op.size
+
+        if name != "barrier":
+            for q in qubits:
+                last_op_per_qubit[q] = name
+
+    if not measured_qubits:
+        measured_qubits = list(range(n_qubits))
+
+    # Scan the variant summaries of all ISwitches in one pass:
+    # - max QPD measures across variants, to allocate enough ancilla qubits
+    #   for the worst case
+    # - whether ALL variants end with reset, in which case the ISwitch qubits
+    #   should be traced out (I observable); this is the wire cut prep side
+    #   scenario
+    # - parameters of the variants
+    parameter_names = {p.name for p in circuit.parameters}
+    max_qpd_measures_per_iswitch = {}  # iswitch_id -> max count across variants
+    traced_out_qubits = set()
+    for iswitch in iswitch_instances:
+        summaries = [iswitch.summary(i) for i in range(iswitch.size)]
+        max_qpd_measures_per_iswitch[id(iswitch)] = max(
+            (summary.num_qpd_measures for summary in summaries), default=0
+        )
+        if summaries and all(summary.ends_with_reset for summary in summaries):
+            traced_out_qubits.update(iswitch_qubit_mapping[id(iswitch)])
+        for summary in summaries:
+            parameter_names.update(summary.parameter_names)
+
+    total_ancillas = sum(max_qpd_measures_per_iswitch.values())
+    n_total_qubits = n_qubits + total_ancillas
+
+    # Build ancilla offset map: iswitch_id -> starting ancilla index
+    ancilla_offset = {}
+    offset = n_qubits
+    for iswitch in iswitch_instances:
+        ancilla_offset[id(iswitch)] = offset
+        offset += max_qpd_measures_per_iswitch[id(iswitch)]
+
+    # Also trace out any top-level qubit whose last non-barrier op is a
+    # `reset`. This lets callers bake "I observable on this qubit" into
+    # the pre-cut circuit by appending a reset — matches the wire-cut
+    # reset semantic above but at the top level.
+    for qi, nm in last_op_per_qubit.items():
+        if nm == "reset":
+            traced_out_qubits.add(qi)
+
+    return CircuitLayout(
+        measured_qubits=measured_qubits,
+        iswitch_params=iswitch_params,
+        iswitch_instances=iswitch_instances,
+        iswitch_qubit_mapping=iswitch_qubit_mapping,
+        total_ancillas=total_ancillas,
+        n_total_qubits=n_total_qubits,
+        ancilla_offset=ancilla_offset,
+        traced_out_qubits=traced_out_qubits,
+        instruction_qubits=instruction_qubits,
+        parameter_names=parameter_names,
+    )
+
+
 def quantum_tensor_to_cudaq(
     circuit: QuantumCircuit,
     shape: tuple[int, ...],
     kernel_name: str = "qtpu_kernel",
     param_values: dict[str, float] | None = None,
+    parametric_iswitches: bool = False,
 ) -> str:
     """Generate complete CUDA-Q program that computes the full tensor.
 
@@ -282,6 +563,15 @@ def quantum_tensor_to_cudaq(
             free parameters become kernel arguments that can be passed
             via command line. Keys can use original param names (e.g., 'theta[0]')
             or sanitized names (e.g., 'theta_0').
+        parametric_iswitches: If True, ISwitch variants that share their gate
+            structure are emitted as one gate sequence reading their numeric
+            angles from angle tables, which the generated functions take as
+            the keyword argument ``qtpu_angle_tables`` (see
+            :func:`iswitch_angle_tables`). The kernel size and JIT time then
+            no longer grow with the number of such variants (e.g. one
+            feature map per data row), and circuits differing only in these
+            angles share one kernel. If False, every variant gets its own
+            if-block.
 
     Returns:
         String containing complete executable CUDA-Q Python code.
@@ -299,106 +589,21 @@ def quantum_tensor_to_cudaq(
         # Also map sanitized version back
         normalized_param_values[_sanitize_param_name(k)] = v
 
-    # Find measured qubits
-    measured_qubits = []
-    for instr in circuit:
-        if instr.operation.name == "measure":
-            q = circuit.qubits.index(instr.qubits[0])
-            if q not in measured_qubits:
-                measured_qubits.append(q)
+    layout = analyze_circuit_layout(circuit)
+    measured_qubits = layout.measured_qubits
+    iswitch_params = layout.iswitch_params
+    iswitch_instances = layout.iswitch_instances
+    iswitch_qubit_mapping = layout.iswitch_qubit_mapping
+    total_ancillas = layout.total_ancillas
+    n_total_qubits = layout.n_total_qubits
+    ancilla_offset = layout.ancilla_offset
+    traced_out_qubits = layout.traced_out_qubits
 
-    if not measured_qubits:
-        measured_qubits = list(range(n_qubits))
-
-    # Collect ISwitch parameter info (these become int args)
-    # Use duck-typing: check for 'iswitch' instruction name
     def _is_iswitch(op) -> bool:
         return op.name == "iswitch"
 
-    iswitch_params = {}  # param_name -> size (ordered)
-    iswitch_instances = []  # Keep track of ISwitches for sub-circuit scanning
-    iswitch_qubit_mapping = {}  # iswitch_id -> list of qubit indices in main circuit
-    for instr in circuit:
-        if _is_iswitch(instr.operation):
-            iswitch = instr.operation
-            iswitch_instances.append(iswitch)
-            qubits = [circuit.qubits.index(q) for q in instr.qubits]
-            iswitch_qubit_mapping[id(iswitch)] = qubits
-            name = iswitch.param.name
-            if name not in iswitch_params:
-                iswitch_params[name] = iswitch.size
-
-    # Scan all ISwitch sub-circuits to find max QPD measures needed
-    # We need to allocate enough ancilla qubits for the worst case
-    max_qpd_measures_per_iswitch = {}  # iswitch_id -> max count across variants
-    for iswitch in iswitch_instances:
-        max_count = 0
-        for i in range(iswitch.size):
-            sub_circuit = iswitch._selector(i)
-            count = sum(
-                1
-                for instr in sub_circuit
-                if instr.operation.name.lower() == "qpd_measure"
-            )
-            max_count = max(max_count, count)
-        max_qpd_measures_per_iswitch[id(iswitch)] = max_count
-
-    total_ancillas = sum(max_qpd_measures_per_iswitch.values())
-    n_total_qubits = n_qubits + total_ancillas
-
-    # Build ancilla offset map: iswitch_id -> starting ancilla index
-    ancilla_offset = {}
-    offset = n_qubits
-    for iswitch in iswitch_instances:
-        ancilla_offset[id(iswitch)] = offset
-        offset += max_qpd_measures_per_iswitch[id(iswitch)]
-
-    # Track which main qubits should be traced out (I observable)
-    # A qubit should use I if it has an ISwitch where ALL variants end with reset
-    # This is the wire cut prep side scenario
-    traced_out_qubits = set()
-    for iswitch in iswitch_instances:
-        qubits = iswitch_qubit_mapping[id(iswitch)]
-        # Check if ALL variants end with reset
-        all_end_with_reset = True
-        for i in range(iswitch.size):
-            sub_circuit = iswitch._selector(i)
-            if sub_circuit.data:
-                last_op = sub_circuit.data[-1].operation.name.lower()
-                if last_op != "reset":
-                    all_end_with_reset = False
-                    break
-            else:
-                all_end_with_reset = False
-                break
-        if all_end_with_reset:
-            traced_out_qubits.update(qubits)
-
-    # Also trace out any top-level qubit whose last non-barrier op is a
-    # `reset`. This lets callers bake "I observable on this qubit" into
-    # the pre-cut circuit by appending a reset — matches the wire-cut
-    # reset semantic above but at the top level.
-    last_op_per_qubit: dict[int, str] = {}
-    for instr in circuit:
-        nm = instr.operation.name.lower()
-        if nm == "barrier":
-            continue
-        for q in instr.qubits:
-            qi = circuit.qubits.index(q)
-            last_op_per_qubit[qi] = nm
-    for qi, nm in last_op_per_qubit.items():
-        if nm == "reset":
-            traced_out_qubits.add(qi)
-
-    # Find ALL parameters including those in ISwitch sub-circuits
-    all_param_names = {p.name for p in circuit.parameters}
-
-    # Also scan ISwitch sub-circuits for parameters
-    for iswitch in iswitch_instances:
-        for i in range(iswitch.size):
-            sub_circuit = iswitch._selector(i)
-            for p in sub_circuit.parameters:
-                all_param_names.add(p.name)
+    # ALL parameters including those in ISwitch sub-circuits
+    all_param_names = layout.parameter_names
 
     # Free parameters are those not used as ISwitch selectors
     free_param_names_orig = sorted(all_param_names - set(iswitch_params.keys()))
@@ -442,9 +647,16 @@ def quantum_tensor_to_cudaq(
         sanitized = orig_to_sanitized[orig_name]
         kernel_args.append(f"{sanitized}: float")
 
-    param_args = ", ".join(kernel_args)
+    # ISwitch variant group tables are module-level lists (captured by the
+    # kernel), inserted here once the instructions have been processed. Angle
+    # tables are passed at call time: the kernel takes the table row of each
+    # ISwitch value as a list[float] argument (appended to kernel_args).
+    kernel_start = len(lines)
+    table_lines: list[str] = []
+    angle_tables: list[tuple[int, np.ndarray]] = []  # (ISwitch arg index, table)
     lines.append("@cudaq.kernel")
-    lines.append(f"def {kernel_name}({param_args}):")
+    kernel_def = len(lines)
+    lines.append(None)  # kernel signature, set once the angle tables are known
     lines.append(f'    """Quantum kernel with parameterized gates."""')
     lines.append(f"    q = cudaq.qvector({n_total_qubits})")
     if total_ancillas > 0:
@@ -464,9 +676,8 @@ def quantum_tensor_to_cudaq(
         return str(p)
 
     # Process instructions
-    for instr in circuit:
+    for instr, qubits in zip(circuit, layout.instruction_qubits):
         op = instr.operation
-        qubits = [circuit.qubits.index(q) for q in instr.qubits]
 
         if op.name == "measure":
             continue
@@ -481,45 +692,86 @@ def quantum_tensor_to_cudaq(
             # (Using if instead of elif avoids AST recursion depth issues)
             iswitch = op
             param_name = iswitch.param.name
+            selector = _sanitize_param_name(param_name)
             iswitch_ancilla_start = ancilla_offset[id(iswitch)]
 
             lines.append(f"    # ISwitch on {param_name} (size={iswitch.size})")
 
-            for i in range(iswitch.size):
-                sub_circuit = iswitch._selector(i)
-                # Extract an ordered list of gates and QPD measures. Order matters:
-                # e.g. CX QPD element 4 on the target is [h, sdg, qpd_measure, h] —
-                # the trailing h must be emitted AFTER the deferred-CNOT, not before.
-                items = extract_gate_info(
-                    sub_circuit, include_qpd_measures=True
+            # Extract an ordered list of gates and QPD measures per variant. Order
+            # matters: e.g. CX QPD element 4 on the target is [h, sdg, qpd_measure, h]
+            # — the trailing h must be emitted AFTER the deferred-CNOT, not before.
+            variants = [
+                extract_gate_info(iswitch.variant(i), include_qpd_measures=True)
+                for i in range(iswitch.size)
+            ]
+
+            table_arg = None
+            if parametric_iswitches:
+                groups, angle_table = _group_variants(variants)
+                group_of = {i: g for g, members in enumerate(groups) for i in members}
+                needs_group_table = len(groups) > 1 and any(
+                    len(members) > 1 for members in groups
                 )
+                if needs_group_table:
+                    group_table = f"{kernel_name}_variants_{len(table_lines)}"
+                    table_lines.append(
+                        f"{group_table} = {[group_of[i] for i in range(iswitch.size)]}"
+                    )
+                if angle_table is not None:
+                    table_arg = f"qtpu_angles_{len(angle_tables)}"
+                    angle_tables.append((list(iswitch_params).index(param_name), angle_table))
+                    kernel_args.append(f"{table_arg}: list[float]")
+            else:
+                groups = [[i] for i in range(iswitch.size)]
 
-                # Build qubit remap for this ISwitch: sub-circuit idx -> main circuit idx
-                qubit_remap = {
-                    sub_q: qubits[sub_q] for sub_q in range(iswitch.num_qubits)
-                }
-
+            for g, members in enumerate(groups):
+                items = variants[members[0]]
+                if len(members) == 1:
+                    condition = f"if {selector} == {members[0]}:"
+                    gate_params = None
+                else:
+                    # Variants sharing their gate structure: one gate sequence
+                    # with the angles read from the angle table row of the
+                    # ISwitch value
+                    if not items:
+                        continue
+                    condition = f"if {group_table}[{selector}] == {g}:" if len(groups) > 1 else None
+                    gate_params = _variant_angle_params(items, table_arg, format_param)
+
+                # Sub-circuit qubit idx -> main circuit idx is qubits[sub_q]
                 variant_lines: list[str] = []
                 ancilla_counter = 0
-                for item in items:
+                for k, item in enumerate(items):
                     if isinstance(item, QPDMeasureInfo):
-                        target = qubit_remap.get(item.qubit, item.qubit)
+                        target = qubits[item.qubit]
                         ancilla = iswitch_ancilla_start + ancilla_counter
                         variant_lines.append(
                             f"x.ctrl(q[{target}], q[{ancilla}])  # Deferred QPD measure"
                         )
                         ancilla_counter += 1
                     else:  # CudaQGate
-                        gate_line = gates_to_cudaq_code(
-                            [item], "q", param_formatter=format_param
-                        )[0]
-                        for sub_q in range(iswitch.num_qubits):
-                            gate_line = gate_line.replace(
-                                f"q[{sub_q}]", f"q[{qubits[sub_q]}]"
+                        gate = replace(
+                            item,
+                            qubits=[qubits[q] for q in item.qubits],
+                            ctrl_qubits=(
+                                [qubits[q] for q in item.ctrl_qubits]
+                                if item.ctrl_qubits
+                                else item.ctrl_qubits
+                            ),
+                        )
+                        if gate_params is None:
+                            variant_lines.append(
+                                gates_to_cudaq_code([gate], "q", param_formatter=format_param)[0]
                             )
-                        variant_lines.append(gate_line)
+                        else:
+                            gate.params = gate_params[k]
+                            variant_lines.append(gates_to_cudaq_code([gate], "q")[0])
+
+                if condition is None:
+                    lines.extend(f"    {vl}" for vl in variant_lines)
+                    continue
 
-                lines.append(f"    if {_sanitize_param_name(param_name)} == {i}:")
+                lines.append(f"    {condition}")
 
                 if variant_lines:
                     for vl in variant_lines:
@@ -528,25 +780,28 @@ def quantum_tensor_to_cudaq(
                     lines.append("        pass  # Identity")
 
             lines.append("")
-        elif op.name.lower() == "cx":
-            lines.append(f"    x.ctrl(q[{qubits[0]}], q[{qubits[1]}])")
-        elif op.name.lower() == "cz":
-            lines.append(f"    z.ctrl(q[{qubits[0]}], q[{qubits[1]}])")
-        elif op.name.lower() in ("h", "x", "y", "z", "s", "t"):
-            lines.append(f"    {op.name.lower()}(q[{qubits[0]}])")
-        elif op.name.lower() == "sdg":
-            lines.append(f"    s.adj(q[{qubits[0]}])")
-        elif op.name.lower() == "tdg":
-            lines.append(f"    t.adj(q[{qubits[0]}])")
-        elif op.name.lower() == "sx":
-            import math
-            lines.append(f"    rx({math.pi / 2}, q[{qubits[0]}])")
-        elif op.name.lower() == "sxdg":
-            import math
-            lines.append(f"    rx({-math.pi / 2}, q[{qubits[0]}])")
-        elif op.params:
-            params_str = ", ".join(format_param(p) for p in op.params)
-            lines.append(f"    {op.name.lower()}({params_str}, q[{qubits[0]}])")
+        else:
+            # Same gate mapping as inside ISwitches and in adjoint differentiation
+            gates = gate_info(op, qubits)
+            lines.extend(
+                f"    {line}"
+                for line in gates_to_cudaq_code(gates, "q", param_formatter=format_param)
+            )
+
+    reserved = {"qtpu_angle_tables"} | {f"qtpu_angles_{t}" for t in range(len(angle_tables))}
+    clashes = reserved & (
+        {_sanitize_param_name(name) for name in iswitch_params} | set(orig_to_sanitized.values())
+    )
+    if clashes:
+        raise ValueError(f"Parameter names {sorted(clashes)} are reserved for angle tables")
+    lines[kernel_def] = f"def {kernel_name}({', '.join(kernel_args)}):"
+
+    if table_lines:
+        lines[kernel_start:kernel_start] = [
+            "# ISwitch variant group tables, indexed by the ISwitch value",
+            *table_lines,
+            "",
+        ]
 
     # Build Z observable for measured qubits AND ancilla qubits
     # Ancilla qubits hold the deferred QPD measurement outcomes
@@ -609,76 +864,45 @@ def quantum_tensor_to_cudaq(
     # Get sanitized names for free params that are args
     free_params_sanitized = [orig_to_sanitized[name] for name in free_params_as_args]
 
+    # Angle tables (parametric ISwitches) are a keyword-only argument of the
+    # generated functions; the kernel gets the table row of each element.
+    table_param = ["*", "qtpu_angle_tables: list[np.ndarray]"] if angle_tables else []
+    table_kwarg = "qtpu_angle_tables=qtpu_angle_tables" if angle_tables else ""
+    broadcast_table_args = [
+        f"qtpu_angle_tables[{t}][idx[{i}]]" for t, (i, _) in enumerate(angle_tables)
+    ]
+
     # Function signature includes free params as args (sanitized)
-    if free_params_sanitized:
-        func_args = ", ".join(f"{name}: float" for name in free_params_sanitized)
-        lines.append(f"def compute_tensor({func_args}) -> np.ndarray:")
-    else:
-        lines.append(f"def compute_tensor() -> np.ndarray:")
+    func_args = ", ".join([f"{name}: float" for name in free_params_sanitized] + table_param)
+    lines.append(f"def compute_tensor({func_args}) -> np.ndarray:")
 
-    # Use CUDA-Q broadcasting - pass list of parameter values, get all results in one call
+    # Use CUDA-Q broadcasting - pass arrays of parameter values, get all results in one call
     iswitch_param_names_sanitized = [
         _sanitize_param_name(name) for name in iswitch_params.keys()
     ]
+    num_iswitches = len(iswitch_params)
+
+    # Free parameters are broadcast as constant arrays, so every kernel
+    # argument carries one value per batch element.
+    broadcast_free_args = [
+        f"np.full(n, {name}, dtype=np.float64)" for name in free_params_sanitized
+    ]
 
     lines.append(f'    """Compute expectation values using CUDA-Q broadcasting."""')
     lines.append(f"    shape = {shape}")
     lines.append("")
 
-    if len(iswitch_params) == 1:
-        # Single ISwitch - use broadcasting with list of values
-        param_name = iswitch_param_names_sanitized[0]
-        size = list(iswitch_params.values())[0]
-
-        lines.append(f"    # Build parameter arrays for broadcasting")
-        lines.append(f"    {param_name}_values = list(range({size}))")
+    if num_iswitches > 0:
+        lines.append(f"    n = {int(np.prod(shape))}")
         lines.append("")
-
-        # Build args list for observe call
-        all_kernel_args = [f"{param_name}_values"] + free_params_sanitized
-        args = ", ".join(all_kernel_args)
-
-        lines.append(
-            f"    # Use CUDA-Q broadcasting - single call evaluates all batch elements"
-        )
-        lines.append(f"    results = cudaq.observe({kernel_name}, hamiltonian, {args})")
-        lines.append("")
-        lines.append(f"    # Extract expectation values")
-        lines.append(
-            f"    result = np.array([r.expectation() for r in results], dtype=np.float64)"
-        )
-        lines.append(f"    return result.reshape(shape)")
-
-    elif len(iswitch_params) > 1:
-        # Multiple ISwitches - use itertools.product for all combinations
-        lines.append(f"    import itertools")
-        lines.append("")
-        lines.append(f"    # Build parameter arrays for broadcasting")
-
-        range_vars = []
-        for orig_name, size in iswitch_params.items():
-            sanitized = _sanitize_param_name(orig_name)
-            lines.append(f"    {sanitized}_range = list(range({size}))")
-            range_vars.append(f"{sanitized}_range")
-
-        lines.append("")
-        lines.append(f"    # Generate all parameter combinations")
-        ranges_str = ", ".join(range_vars)
-        lines.append(f"    all_combos = list(itertools.product({ranges_str}))")
+        lines.append(f"    # Broadcast argument arrays: row i holds ISwitch index i for every")
+        lines.append(f"    # tensor element, enumerated in C order")
+        lines.append(f"    idx = np.indices(shape, dtype=np.int64).reshape({num_iswitches}, n)")
         lines.append("")
 
-        # Create separate lists for each parameter
-        for i, orig_name in enumerate(iswitch_params.keys()):
-            sanitized = _sanitize_param_name(orig_name)
-            lines.append(f"    {sanitized}_values = [c[{i}] for c in all_combos]")
-
-        lines.append("")
-
-        # Build args list for observe call
-        param_value_vars = [
-            f"{_sanitize_param_name(name)}_values" for name in iswitch_params.keys()
-        ]
-        all_kernel_args = param_value_vars + free_params_sanitized
+        all_kernel_args = (
+            [f"idx[{i}]" for i in range(num_iswitches)] + broadcast_free_args + broadcast_table_args
+        )
         args = ", ".join(all_kernel_args)
 
         lines.append(
@@ -686,9 +910,9 @@ def quantum_tensor_to_cudaq(
         )
         lines.append(f"    results = cudaq.observe({kernel_name}, hamiltonian, {args})")
         lines.append("")
-        lines.append(f"    # Extract expectation values and reshape to tensor")
+        lines.append(f"    # Extract expectation values into a preallocated array")
         lines.append(
-            f"    result = np.array([r.expectation() for r in results], dtype=np.float64)"
+            f"    result = np.fromiter((r.expectation() for r in results), dtype=np.float64, count=n)"
         )
         lines.append(f"    return result.reshape(shape)")
 
@@ -707,17 +931,107 @@ def quantum_tensor_to_cudaq(
             )
         lines.append(f"    return result")
 
+    # Generate compute_block function for chunked evaluation
+    lines.append("")
+    lines.append("")
+
+    func_args = ", ".join(
+        ["start: int", "stop: int"] + [f"{name}: float" for name in free_params_sanitized] + table_param
+    )
+    lines.append(f"def compute_block({func_args}) -> np.ndarray:")
+
+    lines.append(f'    """Compute the flattened (C order) tensor entries in [start, stop)."""')
+    lines.append(f"    shape = {shape}")
+    lines.append("")
+
+    if num_iswitches > 0:
+        lines.append(f"    n = stop - start")
+        lines.append(f"    if n <= 0:")
+        lines.append(f"        return np.empty(0, dtype=np.float64)")
+        lines.append(f"    idx = np.unravel_index(np.arange(start, stop, dtype=np.int64), shape)")
+        lines.append("")
+
+        all_kernel_args = (
+            [f"idx[{i}]" for i in range(num_iswitches)] + broadcast_free_args + broadcast_table_args
+        )
+        args = ", ".join(all_kernel_args)
+
+        lines.append(f"    results = cudaq.observe({kernel_name}, hamiltonian, {args})")
+        lines.append(
+            f"    return np.fromiter((r.expectation() for r in results), dtype=np.float64, count=n)"
+        )
+    else:
+        call_args = ", ".join(free_params_sanitized)
+        lines.append(f"    return compute_tensor({call_args}).reshape(-1)[start:stop]")
+
+    # Generate compute_batch function for parameter sweeps
+    lines.append("")
+    lines.append("")
+
+    func_args = ", ".join(
+        ["batch_size: int"] + [f"{name}: np.ndarray" for name in free_params_sanitized] + table_param
+    )
+    lines.append(f"def compute_batch({func_args}) -> np.ndarray:")
+
+    lines.append(f'    """Compute the tensor for batch_size free-parameter points at once.')
+    lines.append(f'    ')
+    lines.append(f'    Each free parameter is an array with one value per batch element.')
+    lines.append(f'    Returns an array of shape (batch_size, *shape).')
+    lines.append(f'    """')
+    lines.append(f"    shape = {shape}")
+    lines.append("")
+
+    if not free_params_sanitized:
+        lines.append(f"    # Nothing varies across the batch - evaluate once")
+        lines.append(
+            f"    return np.broadcast_to(compute_tensor({table_kwarg}), (batch_size, *shape)).copy()"
+        )
+    elif num_iswitches > 0:
+        lines.append(f"    n = {int(np.prod(shape))}")
+        lines.append(f"    idx = np.indices(shape, dtype=np.int64).reshape({num_iswitches}, n)")
+        lines.append("")
+
+        # Batch-major layout: the index space is tiled once per batch element
+        # and every free parameter value is repeated over the index space.
+        batch_kernel_args = [
+            f"np.tile(idx[{i}], batch_size)" for i in range(num_iswitches)
+        ] + [
+            f"np.repeat(np.asarray({name}, dtype=np.float64), n)"
+            for name in free_params_sanitized
+        ] + [
+            f"np.tile({arg}, (batch_size, 1))" for arg in broadcast_table_args
+        ]
+        args = ", ".join(batch_kernel_args)
+
+        lines.append(f"    results = cudaq.observe({kernel_name}, hamiltonian, {args})")
+        lines.append(
+            f"    values = np.fromiter((r.expectation() for r in results), dtype=np.float64, count=batch_size * n)"
+        )
+        lines.append(f"    return values.reshape((batch_size, *shape))")
+    else:
+        batch_kernel_args = [
+            f"np.asarray({name}, dtype=np.float64)" for name in free_params_sanitized
+        ]
+        args = ", ".join(batch_kernel_args)
+
+        lines.append(f"    results = cudaq.observe({kernel_name}, hamiltonian, {args})")
+        lines.append(
+            f"    values = np.fromiter((r.expectation() for r in results), dtype=np.float64, count=batch_size)"
+        )
+        lines.append(f"    return values.reshape((batch_size, *shape))")
+
     # Generate sample_tensor function for sampling from index space
     lines.append("")
     lines.append("")
 
     # Function signature: required params first, then optional params
     # This avoids "non-default argument follows default argument" syntax error
-    if free_params_sanitized:
-        func_args = ", ".join(f"{name}: float" for name in free_params_sanitized)
-        lines.append(f"def sample_tensor({func_args}, num_samples: int | None = None, indices: list[tuple[int, ...]] | None = None) -> list[tuple[tuple[int, ...], float]]:")
-    else:
-        lines.append(f"def sample_tensor(num_samples: int | None = None, indices: list[tuple[int, ...]] | None = None) -> list[tuple[tuple[int, ...], float]]:")
+    func_args = ", ".join(
+        [f"{name}: float" for name in free_params_sanitized]
+        + ["num_samples: int | None = None", "indices: list[tuple[int, ...]] | None = None"]
+        + table_param
+    )
+    lines.append(f"def sample_tensor({func_args}) -> list[tuple[tuple[int, ...], float]]:")
 
     lines.append(f'    """Sample from the index space and compute expectation values.')
     lines.append(f'    ')
@@ -745,7 +1059,7 @@ def quantum_tensor_to_cudaq(
     lines.append(f"        raise ValueError('Cannot provide both num_samples and indices')")
     lines.append("")
 
-    if len(iswitch_params) == 0:
+    if num_iswitches == 0:
         # No ISwitches - just return single value
         lines.append(f"    # No ISwitch parameters - single value")
         if free_params_sanitized:
@@ -755,70 +1069,39 @@ def quantum_tensor_to_cudaq(
             lines.append(f"    val = cudaq.observe({kernel_name}, hamiltonian).expectation()")
         lines.append(f"    n = num_samples if num_samples is not None else len(indices)")
         lines.append(f"    return [((), val)] * n")
-    elif len(iswitch_params) == 1:
-        # Single ISwitch - sample from one dimension
-        param_name = iswitch_param_names_sanitized[0]
-        size = list(iswitch_params.values())[0]
-
-        lines.append(f"    # Get indices to evaluate")
-        lines.append(f"    if indices is not None:")
-        lines.append(f"        sampled_indices = [idx[0] if isinstance(idx, tuple) else idx for idx in indices]")
-        lines.append(f"    else:")
-        lines.append(f"        sampled_indices = [np.random.randint(0, {size}) for _ in range(num_samples)]")
-        lines.append("")
-        lines.append(f"    # Use CUDA-Q broadcasting for all indices")
-        
-        all_kernel_args = ["sampled_indices"] + free_params_sanitized
-        args = ", ".join(all_kernel_args)
-        lines.append(f"    results = cudaq.observe({kernel_name}, hamiltonian, {args})")
-        lines.append("")
-        lines.append(f"    # Build result list of (index_tuple, value) pairs")
-        lines.append(f"    return [((idx,), r.expectation()) for idx, r in zip(sampled_indices, results)]")
     else:
-        # Multiple ISwitches - sample from multi-dimensional space
-        lines.append(f"    # Get indices to evaluate")
+        lines.append(f"    # Get indices to evaluate as an (n, {num_iswitches}) array")
         lines.append(f"    if indices is not None:")
-        lines.append(f"        sampled_indices = [tuple(idx) for idx in indices]")
+        lines.append(f"        sampled = np.asarray(indices, dtype=np.int64).reshape(-1, {num_iswitches})")
         lines.append(f"    else:")
-        lines.append(f"        sampled_indices = []")
-        lines.append(f"        for _ in range(num_samples):")
-        
-        # Build tuple of random indices
-        rand_parts = []
-        for orig_name, size in iswitch_params.items():
-            rand_parts.append(f"np.random.randint(0, {size})")
-        lines.append(f"            sampled_indices.append(({', '.join(rand_parts)},))")
+        lines.append(f"        sampled = np.random.randint(0, shape, size=(num_samples, {num_iswitches}))")
+        lines.append(f"    n = len(sampled)")
+        lines.append(f"    if n == 0:")
+        lines.append(f"        return []")
+        lines.append(f"    idx = np.ascontiguousarray(sampled.T)")
         lines.append("")
-        
-        # Create separate lists for each parameter dimension
-        for i, orig_name in enumerate(iswitch_params.keys()):
-            sanitized = _sanitize_param_name(orig_name)
-            lines.append(f"    {sanitized}_values = [idx[{i}] for idx in sampled_indices]")
-        lines.append("")
-        
-        # Build args for observe call
-        param_value_vars = [
-            f"{_sanitize_param_name(name)}_values" for name in iswitch_params.keys()
-        ]
-        all_kernel_args = param_value_vars + free_params_sanitized
+
+        all_kernel_args = (
+            [f"idx[{i}]" for i in range(num_iswitches)] + broadcast_free_args + broadcast_table_args
+        )
         args = ", ".join(all_kernel_args)
-        
+
         lines.append(f"    # Use CUDA-Q broadcasting for all indices")
         lines.append(f"    results = cudaq.observe({kernel_name}, hamiltonian, {args})")
+        lines.append(
+            f"    values = np.fromiter((r.expectation() for r in results), dtype=np.float64, count=n)"
+        )
         lines.append("")
         lines.append(f"    # Build result list of (index_tuple, value) pairs")
-        lines.append(f"    return [(idx, r.expectation()) for idx, r in zip(sampled_indices, results)]")
+        lines.append(f"    return list(zip(map(tuple, sampled.tolist()), values.tolist()))")
 
     # Generate warmup_jit function - calls kernel once with minimal input to trigger JIT
     lines.append("")
     lines.append("")
     
     # Build warmup function signature (same as compute_tensor)
-    if free_params_sanitized:
-        func_args = ", ".join(f"{name}: float = 0.0" for name in free_params_sanitized)
-        lines.append(f"def warmup_jit({func_args}) -> None:")
-    else:
-        lines.append(f"def warmup_jit() -> None:")
+    func_args = ", ".join([f"{name}: float = 0.0" for name in free_params_sanitized] + table_param)
+    lines.append(f"def warmup_jit({func_args}) -> None:")
     
     lines.append(f'    """Trigger CUDA-Q JIT compilation with a single kernel call.')
     lines.append(f'    ')
@@ -829,7 +1112,11 @@ def quantum_tensor_to_cudaq(
     # Generate single kernel call with index 0 for each ISwitch parameter
     if iswitch_param_names_sanitized:
         # Call with first index for each ISwitch param
-        warmup_args = ["0"] * len(iswitch_param_names_sanitized) + free_params_sanitized
+        warmup_args = (
+            ["0"] * len(iswitch_param_names_sanitized)
+            + free_params_sanitized
+            + [f"qtpu_angle_tables[{t}][0].tolist()" for t in range(len(angle_tables))]
+        )
         warmup_args_str = ", ".join(warmup_args)
         lines.append(f"    _ = cudaq.observe({kernel_name}, hamiltonian, {warmup_args_str}).expectation()")
     else:
@@ -863,12 +1150,14 @@ def quantum_tensor_to_cudaq(
     lines.append("")
     lines.append("    print('Computing quantum tensor...')")
 
-    # Call compute_tensor with free param args (sanitized)
-    if free_params_sanitized:
-        call_args = ", ".join(f"args.{name}" for name in free_params_sanitized)
-        lines.append(f"    tensor = compute_tensor({call_args})")
-    else:
-        lines.append("    tensor = compute_tensor()")
+    # Call compute_tensor with free param args (sanitized) and the angle
+    # tables of this circuit
+    call_args = [f"args.{name}" for name in free_params_sanitized]
+    if angle_tables:
+        tables = ", ".join(f"np.array({table.tolist()})" for _, table in angle_tables)
+        lines.append(f"    qtpu_angle_tables = [{tables}]")
+        call_args.append(table_kwarg)
+    lines.append(f"    tensor = compute_tensor({', '.join(call_args)})")
 
     lines.append(f"    print(f'Result shape: {{tensor.shape}}')")
     lines.append("    np.save(args.output, tensor)")
@@ -927,7 +1216,7 @@ def run_quantum_tensor_cudaq(
         numpy array with the given shape containing Z expectations.
     """
     param_values = param_values or {}
-    _, compute_func, free_param_names = compile_cudaq_kernel(
+    _, compute_func, free_param_names, _ = compile_cudaq_kernel(
         qtensor.circuit, qtensor.shape
     )
     return _execute_compiled_kernel(compute_func, free_param_names, param_values)
@@ -958,24 +1247,195 @@ def _execute_compiled_kernel(
         return compute_func()
 
 
-# Module-level cache for compiled kernels
-# Maps qtensor id -> (module, compute_func, free_param_names, temp_file_path)
-_compiled_kernel_cache: dict[int, tuple] = {}
-_temp_files: list[str] = []  # Track temp files for cleanup
+def _format_fingerprint_param(p, angle_placeholders: bool = False) -> str:
+    """Canonical string form of a gate parameter for fingerprinting.
+
+    With ``angle_placeholders``, numeric parameters (read from angle tables
+    by parametric kernels) are replaced by a placeholder.
+    """
+    if angle_placeholders and _is_numeric_param(p):
+        return "f:?"
+    if hasattr(p, "parameters"):  # Parameter / ParameterExpression
+        return f"p:{p}"
+    try:
+        return f"f:{float(p)!r}"
+    except (TypeError, ValueError):
+        return f"o:{p!r}"
+
+
+def _fingerprint_tokens(
+    circuit: QuantumCircuit,
+    iswitch_aliases: dict[str, str],
+    parametric_iswitches: bool = False,
+    angle_placeholders: bool = False,
+) -> list[str]:
+    """Flatten a circuit into canonical tokens for structural hashing.
+
+    ISwitch index parameters are replaced by positional aliases (in order of
+    first appearance) because they only determine the kernel's argument names,
+    not its behavior. Free parameter names are kept, since they are part of
+    the compiled function's signature.
+
+    With ``parametric_iswitches``, the numeric parameters of ISwitch variants
+    sharing their structure with another variant are tokenized as
+    placeholders, since parametric kernels read them from angle tables.
+    """
+    qubit_index = {q: i for i, q in enumerate(circuit.qubits)}
+    clbit_index = {c: i for i, c in enumerate(circuit.clbits)}
+
+    tokens = [f"n:{circuit.num_qubits}"]
+    for instr in circuit:
+        op = instr.operation
+        qubits = ",".join(str(qubit_index[q]) for q in instr.qubits)
+        clbits = ",".join(str(clbit_index[c]) for c in instr.clbits)
+
+        if op.name == "iswitch":
+            name = op.param.name
+            if name not in iswitch_aliases:
+                iswitch_aliases[name] = f"${len(iswitch_aliases)}"
+            tokens.append(f"iswitch {iswitch_aliases[name]} {op.size} [{qubits}]")
+            structures = (
+                [
+                    tuple(_fingerprint_tokens(op.variant(i), iswitch_aliases, angle_placeholders=True))
+                    for i in range(op.size)
+                ]
+                if parametric_iswitches
+                else None
+            )
+            shared = Counter(structures or ())
+            for i in range(op.size):
+                tokens.append(f"variant {i} {{")
+                if structures is not None and shared[structures[i]] > 1:
+                    tokens.extend(structures[i])
+                else:
+                    tokens.extend(_fingerprint_tokens(op.variant(i), iswitch_aliases))
+                tokens.append("}")
+            continue
+
+        params = ",".join(_format_fingerprint_param(p, angle_placeholders) for p in op.params)
+        tokens.append(f"{op.name} ({params}) [{qubits}] [{clbits}]")
+
+    return tokens
+
+
+def circuit_fingerprint(
+    circuit: QuantumCircuit,
+    shape: tuple[int, ...],
+    parametric_iswitches: bool = False,
+) -> str:
+    """Compute a canonical structural fingerprint of a circuit.
+
+    Two circuits with the same gate sequence, qubit map, ISwitch variant
+    bodies and free-parameter names get the same fingerprint, even if they
+    are distinct objects or use different ISwitch index parameters. The
+    fingerprint is stable across processes.
+
+    Args:
+        circuit: The QuantumCircuit containing ISwitch instructions.
+        shape: The output tensor shape.
+        parametric_iswitches: Fingerprint the parametric kernel of the
+            circuit (see :func:`quantum_tensor_to_cudaq`): angles read from
+            angle tables are ignored, so e.g. feature maps of different data
+            batches share one kernel.
+
+    Returns:
+        Hex digest identifying the generated kernel.
+    """
+    import hashlib
+
+    iswitch_aliases: dict[str, str] = {}
+    tokens = _fingerprint_tokens(circuit, iswitch_aliases, parametric_iswitches)
+    free_params = sorted(p.name for p in circuit.parameters if p.name not in iswitch_aliases)
+    tokens.append(f"shape:{tuple(shape)}")
+    tokens.append(f"free:{free_params}")
+    if parametric_iswitches:
+        # Same circuit, different code: keep both kernels apart in the
+        # caches and in CUDA-Q's kernel registry
+        tokens.append("parametric")
+
+    return hashlib.sha256("\n".join(tokens).encode()).hexdigest()
+
+
+# Version of the generated module format. Bump whenever the code generator
+# output changes, so persisted kernels (see kernel_store) are not reused.
+KERNEL_FORMAT_VERSION = 6
+
+
+class KernelCacheInfo(NamedTuple):
+    """Statistics of the compiled kernel cache (see :func:`kernel_cache_info`)."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+# Module-level LRU cache for compiled kernels
+# Maps circuit fingerprint -> (module, compute_func, free_param_names, num_code_lines, source_filename)
+_compiled_kernel_cache: OrderedDict[str, tuple] = OrderedDict()
+_kernel_cache_maxsize: int = 256
+_kernel_cache_hits: int = 0
+_kernel_cache_misses: int = 0
+# Guards the kernel cache and the loading of generated modules (CUDA-Q
+# kernel registration), so kernels can be compiled from several threads.
+_kernel_cache_lock = threading.RLock()
+
+
+def kernel_cache_info() -> KernelCacheInfo:
+    """Return hit/miss statistics of the compiled kernel cache."""
+    return KernelCacheInfo(
+        hits=_kernel_cache_hits,
+        misses=_kernel_cache_misses,
+        maxsize=_kernel_cache_maxsize,
+        currsize=len(_compiled_kernel_cache),
+    )
+
+
+def set_kernel_cache_maxsize(maxsize: int) -> None:
+    """Set the maximum number of kernels kept in the compiled kernel cache.
+
+    Least recently used kernels are evicted first.
+
+    Args:
+        maxsize: Maximum number of cached kernels (must be positive).
+    """
+    global _kernel_cache_maxsize
+
+    if maxsize < 1:
+        raise ValueError(f"maxsize must be positive, got {maxsize}")
+    with _kernel_cache_lock:
+        _kernel_cache_maxsize = maxsize
+        while len(_compiled_kernel_cache) > _kernel_cache_maxsize:
+            _evict_kernel(_compiled_kernel_cache.popitem(last=False)[1])
+
+
+def _evict_kernel(entry: tuple) -> None:
+    """Release the in-memory source of an evicted kernel cache entry."""
+    linecache.cache.pop(entry[4], None)
 
 
 def compile_cudaq_kernel(
     circuit: QuantumCircuit,
     shape: tuple[int, ...],
+    parametric_iswitches: bool = False,
 ) -> tuple[object, callable, list[str], int]:
     """Compile a CUDA-Q kernel for a circuit with ISwitches and cache it.
 
-    Uses importlib to load from a temp file (required by cudaq.kernel decorator
-    which needs source code access). The module is cached for fast reuse.
+    The generated module is executed from memory; its source is registered
+    with ``linecache`` so the cudaq.kernel decorator (which needs source
+    code access) finds it without a file. Kernels are cached by the
+    structural fingerprint of the circuit (see :func:`circuit_fingerprint`),
+    so structurally identical circuits share one kernel. If a persistent
+    kernel store is configured (see :mod:`qtpu.compiler.kernel_store`), it
+    is consulted before generating code, and generated modules are spilled
+    to it.
 
     Args:
         circuit: The QuantumCircuit containing ISwitch instructions.
         shape: The output tensor shape.
+        parametric_iswitches: Emit structurally equal ISwitch variants as
+            one gate sequence with angle tables (see
+            :func:`quantum_tensor_to_cudaq`).
 
     Returns:
         Tuple of (module, compute_func, free_param_names, num_code_lines) where:
@@ -985,62 +1445,131 @@ def compile_cudaq_kernel(
         - free_param_names: List of free parameter names (sanitized) that need values
         - num_code_lines: Number of lines in the generated code
     """
-    import tempfile
-    import importlib.util
-
-    # Use id of the circuit as cache key
-    cache_key = id(circuit)
-
-    if cache_key in _compiled_kernel_cache:
-        return _compiled_kernel_cache[cache_key][:4]
-
-    # Generate the code with a unique kernel name to avoid CUDA-Q global registry conflicts
-    kernel_name = f"qtpu_kernel_{cache_key}"
-    code, num_code_lines = quantum_tensor_to_cudaq(circuit, shape, kernel_name=kernel_name, param_values=None)
-
-    # Remove the main block (everything after if __name__)
-    lines = code.split("\n")
-    main_idx = next(i for i, l in enumerate(lines) if "if __name__" in l)
-    code = "\n".join(lines[:main_idx])
-
-    # Extract free parameter names from the compute_tensor signature
-    free_param_names = []
-    for line in lines:
-        if line.startswith("def compute_tensor("):
-            sig = line.split("(")[1].split(")")[0]
-            if sig.strip():
-                for param in sig.split(","):
-                    param_name = param.split(":")[0].strip()
-                    if param_name:
-                        free_param_names.append(param_name)
-            break
-
-    # Write to temp file (CUDA-Q needs source code access)
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(code)
-        temp_path = f.name
+    return _compile_cudaq_kernel(circuit, shape, parametric_iswitches)[:4]
 
-    _temp_files.append(temp_path)
 
-    # Load the module
-    spec = importlib.util.spec_from_file_location(
-        f"cudaq_kernel_{cache_key}", temp_path
-    )
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-
-    compute_func = module.compute_tensor
-
-    # Cache including temp path for potential cleanup
-    _compiled_kernel_cache[cache_key] = (
-        module,
-        compute_func,
-        free_param_names,
-        num_code_lines,
-        temp_path,
+def _load_kernel_module(code: str, module_name: str, filename: str) -> object:
+    """Execute a generated kernel module from its source, without a file.
+
+    The source is registered in ``linecache`` under ``filename`` (with no
+    modification time, so ``linecache.checkcache`` keeps it), which is
+    where ``inspect.getsource`` looks up the source of the kernels.
+    """
+    linecache.cache[filename] = (len(code), None, code.splitlines(keepends=True), filename)
+    module = types.ModuleType(module_name)
+    module.__file__ = filename
+    exec(compile(code, filename, "exec"), module.__dict__)
+    return module
+
+
+def _compile_cudaq_kernel(
+    circuit: QuantumCircuit,
+    shape: tuple[int, ...],
+    parametric_iswitches: bool = False,
+    fingerprint: str | None = None,
+) -> tuple[object, callable, list[str], int, str]:
+    """Implementation of :func:`compile_cudaq_kernel`.
+
+    Thread-safe: code generation runs concurrently, loading the generated
+    module and updating the cache is serialized. ``fingerprint`` is the
+    :func:`circuit_fingerprint` of the circuit (with the same
+    ``parametric_iswitches``), if the caller computed it.
+
+    Returns:
+        The tuple of :func:`compile_cudaq_kernel` plus the kernel source:
+        "memory" (in-process cache), "disk" (kernel store) or "codegen".
+    """
+    from qtpu.compiler.kernel_store import get_kernel_store
+
+    global _kernel_cache_hits, _kernel_cache_misses
+
+    cache_key = (
+        fingerprint
+        if fingerprint is not None
+        else circuit_fingerprint(circuit, shape, parametric_iswitches)
     )
 
-    return module, compute_func, free_param_names, num_code_lines
+    with _kernel_cache_lock:
+        if cache_key in _compiled_kernel_cache:
+            _kernel_cache_hits += 1
+            _compiled_kernel_cache.move_to_end(cache_key)
+            return (*_compiled_kernel_cache[cache_key][:4], "memory")
+
+        _kernel_cache_misses += 1
+
+    # The kernel name is derived from the fingerprint: identical structure
+    # yields identical code, and distinct structures never collide in
+    # CUDA-Q's global kernel registry.
+    kernel_name = f"qtpu_kernel_{cache_key[:16]}"
+    module_name = f"cudaq_kernel_{cache_key[:16]}"
+
+    store = get_kernel_store()
+    store_key = store.key(cache_key, KERNEL_FORMAT_VERSION) if store is not None else None
+    stored = store.load(store_key) if store is not None else None
+
+    if stored is not None:
+        path, code, meta = stored
+        source = "disk"
+        free_param_names = meta["free_param_names"]
+        num_code_lines = meta["num_code_lines"]
+        filename = str(path)
+    else:
+        source = "codegen"
+        code, num_code_lines = quantum_tensor_to_cudaq(
+            circuit,
+            shape,
+            kernel_name=kernel_name,
+            param_values=None,
+            parametric_iswitches=parametric_iswitches,
+        )
+
+        # Remove the main block (everything after if __name__)
+        lines = code.split("\n")
+        main_idx = next(i for i, l in enumerate(lines) if "if __name__" in l)
+        code = "\n".join(lines[:main_idx])
+
+        # Extract free parameter names from the compute_tensor signature
+        # (up to the keyword-only angle tables)
+        free_param_names = []
+        for line in lines:
+            if line.startswith("def compute_tensor("):
+                sig = line.split("(")[1].split(")")[0]
+                if sig.strip():
+                    for param in sig.split(","):
+                        param_name = param.split(":")[0].strip()
+                        if param_name == "*":
+                            break
+                        if param_name:
+                            free_param_names.append(param_name)
+                break
+
+        # Spill to the kernel store for other processes, if configured
+        filename = f"<{module_name}>"
+        if store is not None:
+            meta = {"free_param_names": free_param_names, "num_code_lines": num_code_lines}
+            store.store(store_key, code, meta)
+
+    with _kernel_cache_lock:
+        # Another thread may have compiled the same kernel meanwhile
+        if cache_key in _compiled_kernel_cache:
+            _compiled_kernel_cache.move_to_end(cache_key)
+            return (*_compiled_kernel_cache[cache_key][:4], "memory")
+
+        module = _load_kernel_module(code, module_name, filename)
+        compute_func = module.compute_tensor
+
+        # Cache including the source filename for releasing it on eviction
+        _compiled_kernel_cache[cache_key] = (
+            module,
+            compute_func,
+            free_param_names,
+            num_code_lines,
+            filename,
+        )
+        if len(_compiled_kernel_cache) > _kernel_cache_maxsize:
+            _evict_kernel(_compiled_kernel_cache.popitem(last=False)[1])
+
+    return module, compute_func, free_param_names, num_code_lines, source
 
 
 def get_compiled_kernel(
@@ -1058,22 +1587,24 @@ def get_compiled_kernel(
     Returns:
         Tuple of (compute_func, free_param_names)
     """
-    _, compute_func, free_param_names = compile_cudaq_kernel(circuit, shape)
+    _, compute_func, free_param_names, _ = compile_cudaq_kernel(circuit, shape)
     return compute_func, free_param_names
 
 
 def clear_kernel_cache():
-    """Clear the compiled kernel cache and remove temp files."""
-    import os
+    """Clear the compiled kernel cache and its statistics.
 
-    _compiled_kernel_cache.clear()
+    Kernels persisted in the kernel store are kept; use
+    ``get_kernel_store().clear()`` to remove those.
+    """
+    global _kernel_cache_hits, _kernel_cache_misses
 
-    for path in _temp_files:
-        try:
-            os.unlink(path)
-        except Exception:
-            pass
-    _temp_files.clear()
+    with _kernel_cache_lock:
+        for entry in _compiled_kernel_cache.values():
+            _evict_kernel(entry)
+        _compiled_kernel_cache.clear()
+        _kernel_cache_hits = 0
+        _kernel_cache_misses = 0
 
 
 def run_compiled_kernel(
@@ -1094,7 +1625,7 @@ def run_compiled_kernel(
     Returns:
         numpy array with the given shape.
     """
-    _, compute_func, free_param_names = compile_cudaq_kernel(circuit, shape)
+    _, compute_func, free_param_names, _ = compile_cudaq_kernel(circuit, shape)
     return _execute_compiled_kernel(compute_func, free_param_names, param_values or {})
 
 
@@ -1146,7 +1677,13 @@ class CompiledQuantumTensor:
         >>> result = compiled(theta=0.5)  # Pass rotation parameters
     """
 
-    def __init__(self, qtensor: "QuantumTensor", warmup: bool = True):
+    def __init__(
+        self,
+        qtensor: "QuantumTensor",
+        warmup: bool = True,
+        parametric_iswitches: bool = False,
+        fingerprint: str | None = None,
+    ):
         """Initialize a compiled quantum tensor.
 
         Args:
@@ -1154,16 +1691,29 @@ class CompiledQuantumTensor:
             warmup: If True, run a warmup execution to trigger JIT compilation
                 during initialization. This moves the JIT overhead to compile
                 time rather than first execution time.
+            parametric_iswitches: If True, ISwitch variants differing only in
+                angles share one gate sequence reading the angles from tables
+                passed at call time (see :func:`quantum_tensor_to_cudaq`).
+            fingerprint: The :func:`circuit_fingerprint` of the tensor's
+                circuit (with the same ``parametric_iswitches``), if already
+                known; computed on compilation otherwise.
         """
         from qtpu.core.qtensor import QuantumTensor
         
         self._qtensor = qtensor
+        self._parametric_iswitches = parametric_iswitches
+        self._fingerprint = fingerprint
         self._compiled_fn: callable | None = None
         self._sample_fn: callable | None = None
         self._warmup_fn: callable | None = None
+        self._block_fn: callable | None = None
+        self._batch_fn: callable | None = None
         self._free_param_names: list[str] = []
+        # Angle tables passed to the generated functions (parametric ISwitches)
+        self._table_kwargs: dict[str, list[np.ndarray]] = {}
         self._jit_warmup_done: bool = False
         self._num_code_lines: int = 0
+        self._kernel_source: str | None = None
         
         # Compile immediately
         self._ensure_compiled()
@@ -1188,9 +1738,9 @@ class CompiledQuantumTensor:
             if self._free_param_names:
                 # Provide dummy values for free parameters
                 kwargs = {name: 0.0 for name in self._free_param_names}
-                self._warmup_fn(**kwargs)
+                self._warmup_fn(**kwargs, **self._table_kwargs)
             else:
-                self._warmup_fn()
+                self._warmup_fn(**self._table_kwargs)
             self._jit_warmup_done = True
         except Exception:
             # If warmup fails, we'll just pay JIT cost on first real call
@@ -1226,23 +1776,78 @@ class CompiledQuantumTensor:
         """Number of lines in the generated CUDA-Q code."""
         return self._num_code_lines
 
+    @property
+    def kernel_source(self) -> str | None:
+        """Where the kernel came from: "memory", "disk" or "codegen"."""
+        return self._kernel_source
+
+    @property
+    def kernel_cache_hit(self) -> bool:
+        """Whether the kernel was reused from the in-memory or on-disk cache."""
+        return self._kernel_source in ("memory", "disk")
+
     def _ensure_compiled(self) -> None:
         """Compile the kernel if not already compiled."""
         if self._compiled_fn is not None:
             return
 
-        module, self._compiled_fn, self._free_param_names, self._num_code_lines = compile_cudaq_kernel(
-            self._qtensor.circuit, self._qtensor.shape
+        (
+            module,
+            self._compiled_fn,
+            self._free_param_names,
+            self._num_code_lines,
+            self._kernel_source,
+        ) = _compile_cudaq_kernel(
+            self._qtensor.circuit,
+            self._qtensor.shape,
+            self._parametric_iswitches,
+            self._fingerprint,
         )
         
-        # Get sample_tensor and warmup_jit functions if available
+        # Get sample_tensor, warmup_jit and compute_block functions if available
         self._sample_fn = getattr(module, 'sample_tensor', None)
         self._warmup_fn = getattr(module, 'warmup_jit', None)
+        self._block_fn = getattr(module, 'compute_block', None)
+        self._batch_fn = getattr(module, 'compute_batch', None)
+
+        # The kernel is shared by all circuits with its structure; the angles
+        # of this circuit are passed to it at call time
+        if self._parametric_iswitches:
+            tables = iswitch_angle_tables(self._qtensor.circuit)
+            self._table_kwargs = {"qtpu_angle_tables": tables} if tables else {}
+
+    def _bind_params(self, params: dict[str, float]) -> dict[str, float]:
+        """Map user-supplied parameter values to the compiled function's arguments."""
+        if "_chunk_size" in self._free_param_names:
+            raise ValueError(
+                "Free parameter name '_chunk_size' is reserved for the chunk size"
+            )
+        kwargs = {}
+        for name in self._free_param_names:
+            if name in params:
+                kwargs[name] = params[name]
+            else:
+                # Try to find parameter with original name (e.g., 'theta[0]' vs 'theta_0')
+                for orig_name, val in params.items():
+                    if _sanitize_param_name(orig_name) == name:
+                        kwargs[name] = val
+                        break
+                else:
+                    raise ValueError(
+                        f"Missing parameter: '{name}'. "
+                        f"Required: {self._free_param_names}"
+                    )
+        return kwargs
 
-    def __call__(self, **params: float) -> np.ndarray:
+    def __call__(self, *, _chunk_size: int | None = None, **params: float) -> np.ndarray:
         """Evaluate the compiled quantum tensor.
 
         Args:
+            _chunk_size: If given, evaluate the index space in blocks of at most
+                this many elements and write them into a preallocated output,
+                so only O(chunk_size) CUDA-Q results are alive at a time.
+                If None, evaluate all elements in a single broadcast.
+                Underscored so it cannot clash with a free parameter name.
             **params: Values for free parameters (rotation angles, etc.).
                 ISwitch parameters are handled internally.
 
@@ -1252,31 +1857,92 @@ class CompiledQuantumTensor:
         Example:
             >>> result = compiled()  # No free parameters
             >>> result = compiled(theta=0.5, phi=1.2)  # With parameters
+            >>> result = compiled(_chunk_size=4096, theta=0.5)  # Bounded memory
         """
         self._ensure_compiled()
 
-        # Build kwargs for the compiled function
-        kwargs = {}
-        for name in self._free_param_names:
-            if name in params:
-                kwargs[name] = params[name]
-            else:
-                # Try to find parameter with original name (e.g., 'theta[0]' vs 'theta_0')
-                for orig_name, val in params.items():
-                    if _sanitize_param_name(orig_name) == name:
-                        kwargs[name] = val
-                        break
-                else:
-                    if name not in kwargs:
-                        raise ValueError(
-                            f"Missing parameter: '{name}'. "
-                            f"Required: {self._free_param_names}"
-                        )
+        if _chunk_size is not None:
+            out = np.empty(int(np.prod(self.shape)), dtype=np.float64)
+            for sl, block in self.iter_blocks(_chunk_size, **params):
+                out[sl] = block
+            return out.reshape(self.shape)
 
-        if kwargs:
-            return self._compiled_fn(**kwargs)
-        else:
-            return self._compiled_fn()
+        kwargs = self._bind_params(params)
+        return self._compiled_fn(**kwargs, **self._table_kwargs)
+
+    def iter_blocks(
+        self, chunk_size: int, /, **params: float
+    ) -> Iterator[tuple[slice, np.ndarray]]:
+        """Evaluate the quantum tensor in fixed-size blocks.
+
+        The tensor is enumerated in flattened C order; each block covers a
+        contiguous range of that flattened index space.
+
+        Args:
+            chunk_size: Maximum number of elements per block.
+            **params: Values for free parameters (rotation angles, etc.).
+
+        Yields:
+            Tuples of (slice, block) where ``block`` holds the values of
+            ``result.reshape(-1)[slice]``.
+
+        Example:
+            >>> out = np.empty(qtensor.shape).reshape(-1)
+            >>> for sl, block in compiled.iter_blocks(4096, theta=0.5):
+            ...     out[sl] = block
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        self._ensure_compiled()
+
+        if self._block_fn is None:
+            raise RuntimeError(
+                "Block function not available. This may happen if the kernel "
+                "was compiled with an older version of the code generator."
+            )
+
+        kwargs = self._bind_params(params)
+        total = int(np.prod(self.shape))
+        for start in range(0, total, chunk_size):
+            stop = min(start + chunk_size, total)
+            yield slice(start, stop), self._block_fn(start, stop, **kwargs, **self._table_kwargs)
+
+    def batch(self, params_list: list[dict[str, float]]) -> np.ndarray:
+        """Evaluate the compiled quantum tensor for many parameter points.
+
+        All points are evaluated in a single CUDA-Q broadcast over the
+        (batch x index space) argument arrays.
+
+        Args:
+            params_list: One dict of free parameter values per batch element.
+
+        Returns:
+            np.ndarray: Result tensor of shape (len(params_list), *self.shape).
+
+        Example:
+            >>> results = compiled.batch([{"theta": 0.1}, {"theta": 0.2}])
+            >>> results.shape[0]
+            2
+        """
+        self._ensure_compiled()
+
+        if self._batch_fn is None:
+            raise RuntimeError(
+                "Batch function not available. This may happen if the kernel "
+                "was compiled with an older version of the code generator."
+            )
+
+        batch_size = len(params_list)
+        if batch_size == 0:
+            return np.empty((0, *self.shape), dtype=np.float64)
+
+        bound = [self._bind_params(params) for params in params_list]
+        columns = {
+            name: np.fromiter((kw[name] for kw in bound), dtype=np.float64, count=batch_size)
+            for name in self._free_param_names
+        }
+        return self._batch_fn(batch_size, **columns, **self._table_kwargs)
 
     def execute(self, **params: float) -> np.ndarray:
         """Execute the compiled quantum tensor (alias for __call__).
@@ -1343,32 +2009,20 @@ class CompiledQuantumTensor:
                 "was compiled with an older version of the code generator."
             )
 
-        # Build kwargs for the sample function
-        kwargs = {}
-        for name in self._free_param_names:
-            if name in params:
-                kwargs[name] = params[name]
-            else:
-                # Try to find parameter with original name (e.g., 'theta[0]' vs 'theta_0')
-                for orig_name, val in params.items():
-                    if _sanitize_param_name(orig_name) == name:
-                        kwargs[name] = val
-                        break
-                else:
-                    if name not in kwargs:
-                        raise ValueError(
-                            f"Missing parameter: '{name}'. "
-                            f"Required: {self._free_param_names}"
-                        )
-
-        return self._sample_fn(num_samples=num_samples, indices=indices, **kwargs)
+        kwargs = self._bind_params(params)
+        return self._sample_fn(
+            num_samples=num_samples, indices=indices, **kwargs, **self._table_kwargs
+        )
 
     def clear_cache(self) -> None:
         """Clear the compiled kernel cache, forcing recompilation on next call."""
         self._compiled_fn = None
         self._sample_fn = None
         self._warmup_fn = None
+        self._block_fn = None
+        self._batch_fn = None
         self._free_param_names = []
+        self._table_kwargs = {}
         self._jit_warmup_done = False
 
     def __repr__(self) -> str:
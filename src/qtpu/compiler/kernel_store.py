@@ -0,0 +1,247 @@
+"""Persistent, content-addressed store for generated CUDA-Q kernels.
+
+Generating CUDA-Q source for a quantum tensor and importing it is paid by
+every process that compiles the tensor. The :class:`KernelStore` keeps the
+generated modules in a directory keyed by the circuit fingerprint (see
+:func:`qtpu.compiler.codegen.circuit_fingerprint`) together with the qtpu,
+CUDA-Q and kernel format versions, so a restarted worker only has to import
+the module.
+
+Writes are atomic (temp file + ``os.replace``), so several workers can share
+one directory. The directory is bounded in size; least recently used kernels
+are evicted first.
+
+Example:
+    >>> from qtpu.compiler.kernel_store import set_kernel_store
+    >>> set_kernel_store("~/.cache/qtpu/kernels")
+    >>> compiled = qtensor.compile()  # loaded from disk if seen before
+
+The store can also be enabled through the ``QTPU_KERNEL_CACHE_DIR``
+environment variable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+try:
+    import cudaq
+except ImportError:
+    cudaq = None  # type: ignore[assignment]
+
+
+_META_PREFIX = "# qtpu-kernel-meta: "
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _qtpu_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("qtpu")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _cudaq_version() -> str:
+    if cudaq is None:
+        return "none"
+    return str(getattr(cudaq, "__version__", "unknown"))
+
+
+class KernelStore:
+    """On-disk, content-addressed store of generated CUDA-Q kernel modules.
+
+    Each kernel is a single ``<key>.py`` file whose first line carries the
+    metadata needed to use the module without regenerating it.
+
+    Args:
+        path: Directory holding the kernel files (created if missing).
+        max_bytes: Maximum total size of the stored kernels. When exceeded
+            after a write, least recently used kernels are deleted.
+    """
+
+    def __init__(self, path: str | os.PathLike, max_bytes: int = _DEFAULT_MAX_BYTES):
+        self._path = Path(path).expanduser()
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._version_tag = f"{_qtpu_version()}|{_cudaq_version()}"
+
+    @property
+    def path(self) -> Path:
+        """Directory holding the kernel files."""
+        return self._path
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum total size of the stored kernels."""
+        return self._max_bytes
+
+    def key(self, fingerprint: str, format_version: int) -> str:
+        """Content address for a kernel.
+
+        Args:
+            fingerprint: Structural circuit fingerprint.
+            format_version: Version of the code generator output format.
+
+        Returns:
+            Hex digest used as file name.
+        """
+        tag = f"{fingerprint}|{format_version}|{self._version_tag}"
+        return hashlib.sha256(tag.encode()).hexdigest()
+
+    def _file(self, key: str) -> Path:
+        return self._path / f"{key}.py"
+
+    def load(self, key: str) -> tuple[Path, str, dict] | None:
+        """Look up a stored kernel.
+
+        The source is read here, in one go with the metadata, so a kernel
+        evicted concurrently by another process is a miss, not an error.
+
+        Args:
+            key: Content address from :meth:`key`.
+
+        Returns:
+            Tuple of (file_path, source, metadata), or None if the kernel is
+            not stored or the file is unreadable.
+        """
+        file = self._file(key)
+        try:
+            code = file.read_text()
+        except OSError:
+            return None
+        header = code.partition("\n")[0]
+        if not header.startswith(_META_PREFIX):
+            return None
+        try:
+            meta = json.loads(header[len(_META_PREFIX):])
+        except json.JSONDecodeError:
+            return None
+
+        # Mark as recently used for eviction.
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+        return file, code, meta
+
+    def store(self, key: str, code: str, meta: dict) -> Path:
+        """Atomically write a kernel module to the store.
+
+        Args:
+            key: Content address from :meth:`key`.
+            code: Generated Python source of the kernel module.
+            meta: JSON-serializable metadata stored with the module.
+
+        Returns:
+            Path of the stored module.
+        """
+        file = self._file(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self._path, prefix=f".{key[:16]}-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(_META_PREFIX + json.dumps(meta) + "\n")
+                f.write(code)
+            os.replace(tmp_path, file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._evict(keep=file)
+        return file
+
+    def size_bytes(self) -> int:
+        """Total size of the stored kernels in bytes."""
+        total = 0
+        for file in self._path.glob("*.py"):
+            try:
+                total += file.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least recently used kernels until the store fits max_bytes."""
+        entries = []
+        total = 0
+        for file in self._path.glob("*.py"):
+            try:
+                st = file.stat()
+            except OSError:
+                continue  # removed concurrently
+            entries.append((st.st_mtime, st.st_size, file))
+            total += st.st_size
+
+        if total <= self._max_bytes:
+            return
+
+        for _, size, file in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            if file == keep:
+                continue
+            try:
+                file.unlink()
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self) -> None:
+        """Delete all stored kernels."""
+        for file in self._path.glob("*.py"):
+            try:
+                file.unlink()
+            except OSError:
+                pass
+
+    def __repr__(self) -> str:
+        return f"KernelStore(path='{self._path}', max_bytes={self._max_bytes})"
+
+
+_kernel_store: KernelStore | None = None
+_kernel_store_configured = False
+
+
+def set_kernel_store(
+    store: KernelStore | str | os.PathLike | None,
+    max_bytes: int = _DEFAULT_MAX_BYTES,
+) -> KernelStore | None:
+    """Configure the process-wide kernel store.
+
+    Args:
+        store: A KernelStore, a directory path, or None to disable the store.
+        max_bytes: Size bound used when a path is given.
+
+    Returns:
+        The active KernelStore, or None if disabled.
+    """
+    global _kernel_store, _kernel_store_configured
+
+    if store is not None and not isinstance(store, KernelStore):
+        store = KernelStore(store, max_bytes=max_bytes)
+    _kernel_store = store
+    _kernel_store_configured = True
+    return store
+
+
+def get_kernel_store() -> KernelStore | None:
+    """Return the process-wide kernel store.
+
+    Unless configured via :func:`set_kernel_store`, the store is created from
+    the ``QTPU_KERNEL_CACHE_DIR`` environment variable (disabled if unset).
+    """
+    global _kernel_store, _kernel_store_configured
+
+    if not _kernel_store_configured:
+        path = os.environ.get("QTPU_KERNEL_CACHE_DIR")
+        _kernel_store = KernelStore(path) if path else None
+        _kernel_store_configured = True
+    return _kernel_store
@@ -17,6 +17,8 @@ def cut(
     num_workers: int | None = None,
     n_trials: int = 100,
     seed: int | None = None,
+    time_budget: float | None = None,
+    patience: int | None = None,
 ) -> QuantumCircuit:
     """Cut a quantum circuit to optimize the quantum-classical tradeoff.
 
@@ -36,8 +38,11 @@ def cut(
             - λ>1: Prefer lower classical cost over error reduction
             The score is: normalized_error + λ * normalized_cost
         num_workers: Number of parallel worker processes. Defaults to min(8, cpu_count).
-        n_trials: Number of optimization trials to run.
+        n_trials: Maximum number of optimization trials to run.
         seed: Random seed for reproducibility.
+        time_budget: Wall-clock limit of the cut search in seconds.
+        patience: Stop the cut search once this many consecutive trials have
+            not improved the Pareto frontier.
 
     Returns:
         The cut circuit optimized according to the cost_weight, subject to constraints.
@@ -54,6 +59,9 @@ def cut(
 
         # Prefer low classical cost, must fit on 15 qubits
         cut_circuit = cut(circuit, max_size=15, cost_weight=2.0)
+
+        # Bounded compile latency: at most 2 seconds of search
+        cut_circuit = cut(circuit, max_size=10, time_budget=2.0, patience=20)
     """
     # Get the Pareto frontier
     result = get_pareto_frontier(
@@ -62,6 +70,8 @@ def cut(
         num_workers=num_workers,
         n_trials=n_trials,
         seed=seed,
+        time_budget=time_budget,
+        patience=patience,
     )
 
     if not result.pareto_frontier:
@@ -1,124 +1,270 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import cotengra as ctg
-from qiskit_addon_cutting.instructions import Move
+import numpy as np
+from qiskit.circuit.library import get_standard_gate_name_mapping
 from qiskit_addon_cutting.qpd import QPDBasis
 
 from qtpu.transforms import insert_cuts
 
 if TYPE_CHECKING:
-    from qiskit.circuit import QuantumCircuit, Qubit
+    from qiskit.circuit import Instruction, QuantumCircuit, Qubit
+
+
+# Size of a wire edge (a qubit wire between two consecutive operations)
+WIRE_EDGE_SIZE = 16
+# Size of a gate edge of an operation without a QPD decomposition
+UNCUTTABLE_EDGE_SIZE = 10**15
+
+# Standard gates by name: the only operations whose QPD is determined by
+# their name and parameters
+_STANDARD_GATES = get_standard_gate_name_mapping()
 
 
 @dataclass(frozen=True)
 class NodeInfo:
     op_idx: int  # Index of the operation in the circuit
-    abs_qubit: Qubit  # Absolute qubit in the circuit
+    abs_qubit: Qubit  # Absolute qubit in the circuit (its index in payload IRs)
     rel_qubit: int  # Relative qubit in the operation
 
 
-class HybridCircuitIR:
-    def __init__(self, circuit: QuantumCircuit) -> None:
-        node_infos: list[NodeInfo] = []
-        op_nodes: list[set[int]] = []
-        inputs: list[tuple[str, ...]] = []
-        size_dict: dict[str, int] = {}
-
-        edge_index = 200
-        current_nodes: dict[Qubit, int] = {}
-        for op_id, instr in enumerate(circuit):
+def _gate_edge_size(operation: Instruction, cache: dict) -> int:
+    """Size of the edges between the qubits of a multi-qubit operation.
 
-            op_nodes.append(set())
+    The number of terms of its QPD, cached per gate class, name and
+    parameters (the decomposition is expensive, and circuits repeat their
+    gates). Only standard gates are cached: a custom gate may share the name
+    and parameters of another with a different definition.
+    """
+    standard = _STANDARD_GATES.get(operation.name)
+    key = None
+    if standard is not None and operation.base_class is standard.base_class:
+        try:
+            key = (operation.base_class, operation.name, tuple(operation.params))
+            hash(key)
+        except TypeError:
+            key = None
+    if key is not None and key in cache:
+        return cache[key]
 
-            for i, qubit in enumerate(instr.qubits):
-                inputs.append(())
-                op_nodes[-1].add(len(inputs) - 1)
-                node_infos.append(NodeInfo(op_idx=op_id, abs_qubit=qubit, rel_qubit=i))
+    try:
+        # size = round(QPDBasis.from_instruction(operation).overhead)
+        size = len(QPDBasis.from_instruction(operation).coeffs)
+    except ValueError:
+        size = UNCUTTABLE_EDGE_SIZE
 
-                if qubit in current_nodes:
-                    inputs[current_nodes[qubit]] += (str(chr(edge_index)),)
-                    inputs[-1] += (str(chr(edge_index)),)
-                    # size_dict[str(chr(edge_index))] = round(
-                    #     QPDBasis.from_instruction(Move()).overhead
-                    # )
-                    size_dict[str(chr(edge_index))] = 16
+    if key is not None:
+        cache[key] = size
+    return size
 
-                    edge_index += 1
 
-                current_nodes[qubit] = len(inputs) - 1
+def _node_array(nodes: Iterable[int]) -> np.ndarray:
+    if isinstance(nodes, np.ndarray):
+        return nodes
+    return np.fromiter(nodes, dtype=np.intp)
 
-            try:
-                # edge_weigth = round(QPDBasis.from_instruction(instr.operation).overhead)
-                # edge_weigth = QPDBasis.from_instruction(instr.operation).overhead
 
-                edge_weigth = len(QPDBasis.from_instruction(instr.operation).coeffs)
-            except ValueError:
-                edge_weigth = 1e15
+class HybridCircuitIR:
+    """Hypergraph of a circuit for the cut search, backed by NumPy arrays.
 
-            for i in range(len(instr.qubits) - 1):
-                inputs[-i - 2] += (str(chr(edge_index)),)
-                inputs[-i - 1] += (str(chr(edge_index)),)
-                size_dict[str(chr(edge_index))] = edge_weigth
+    Every qubit of every operation is a node; nodes are numbered in circuit
+    order, so the nodes of an operation are contiguous. An edge connects two
+    nodes, either consecutive on a qubit wire (a wire edge) or consecutive
+    qubits of an operation (a gate edge). Edges are identified by integer ids
+    (their index in the edge arrays), which are the indices of the tensors
+    of the hypergraph.
+    """
 
-                edge_index += 1
+    def __init__(self, circuit: QuantumCircuit) -> None:
+        node_op: list[int] = []
+        node_qubit: list[int] = []
+        node_rel: list[int] = []
+        edges: list[tuple[int, int]] = []
+        edge_sizes: list[int] = []
+        size_cache: dict = {}
+
+        qubit_index = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+        last_nodes: dict[int, int] = {}
+        for op_id, instr in enumerate(circuit):
+            for i, qubit in enumerate(instr.qubits):
+                node = len(node_op)
+                qubit_idx = qubit_index[qubit]
+                node_op.append(op_id)
+                node_qubit.append(qubit_idx)
+                node_rel.append(i)
+
+                if qubit_idx in last_nodes:
+                    edges.append((last_nodes[qubit_idx], node))
+                    edge_sizes.append(WIRE_EDGE_SIZE)
+                last_nodes[qubit_idx] = node
+
+            if len(instr.qubits) > 1:
+                size = _gate_edge_size(instr.operation, size_cache)
+                last = len(node_op) - 1
+                for i in range(len(instr.qubits) - 1):
+                    edges.append((last - i - 1, last - i))
+                    edge_sizes.append(size)
 
         self._circuit = circuit
-        self._op_nodes = op_nodes
-        self._node_infos = node_infos
-        self._hypergraph = ctg.HyperGraph(inputs, (), size_dict)
+        self._init_arrays(
+            np.array(node_op, dtype=np.int32),
+            np.array(node_qubit, dtype=np.int32),
+            np.array(node_rel, dtype=np.int32),
+            np.array(edges, dtype=np.int32).reshape(-1, 2),
+            np.array(edge_sizes, dtype=np.int64),
+        )
+
+    def _init_arrays(
+        self,
+        node_op: np.ndarray,
+        node_qubit: np.ndarray,
+        node_rel: np.ndarray,
+        edges: np.ndarray,
+        edge_sizes: np.ndarray,
+    ) -> None:
+        num_nodes = len(node_op)
+        # node -> operation, qubit index, and qubit index within the operation
+        self._node_op = node_op
+        self._node_qubit = node_qubit
+        self._node_rel = node_rel
+        # edge id -> its two nodes (lower first), and its size
+        self._edges = edges
+        self._edge_sizes = edge_sizes
+
+        # CSR of the nodes of each operation
+        num_ops = int(node_op[-1]) + 1 if num_nodes else 0
+        self._op_ptr = np.zeros(num_ops + 1, dtype=np.intp)
+        np.cumsum(np.bincount(node_op, minlength=num_ops), out=self._op_ptr[1:])
+
+        # CSR of the edges of each node, in increasing id
+        ends = edges.ravel()
+        self._node_edges = (np.argsort(ends, kind="stable") // 2).astype(np.int32)
+        self._node_edge_ptr = np.zeros(num_nodes + 1, dtype=np.intp)
+        np.cumsum(np.bincount(ends, minlength=num_nodes), out=self._node_edge_ptr[1:])
+
+        # node -> next node on its qubit wire (-1 if it is the last)
+        self._wire_next = np.full(num_nodes, -1, dtype=np.int32)
+        wire = node_qubit[edges[:, 0]] == node_qubit[edges[:, 1]]
+        self._wire_next[edges[wire, 0]] = edges[wire, 1]
+
+        node_edges = self._node_edges.tolist()
+        ptr = self._node_edge_ptr.tolist()
+        self._inputs = [tuple(node_edges[ptr[i] : ptr[i + 1]]) for i in range(num_nodes)]
+        self._size_dict = dict(enumerate(edge_sizes.tolist()))
+
+    def to_payload(self) -> dict:
+        """Compact picklable form of the IR for the cut search workers.
+
+        Holds the node and edge arrays, but not the circuit.
+        """
+        return {
+            "node_op": self._node_op,
+            "node_qubit": self._node_qubit,
+            "node_rel": self._node_rel,
+            "edges": self._edges,
+            "edge_sizes": self._edge_sizes,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> HybridCircuitIR:
+        """Rebuild an IR from :meth:`to_payload`, without its circuit.
+
+        Qubits are identified by their index in the circuit. The IR supports
+        the cut search (contraction trees, node infos, qubit counts), but not
+        :attr:`circuit` or :meth:`cut_circuit`.
+        """
+        ir = cls.__new__(cls)
+        ir._circuit = None
+        ir._init_arrays(
+            payload["node_op"],
+            payload["node_qubit"],
+            payload["node_rel"],
+            payload["edges"],
+            payload["edge_sizes"],
+        )
+        return ir
 
     def node_info(self, node: int) -> NodeInfo:
-        return self._node_infos[node]
+        qubit = int(self._node_qubit[node])
+        return NodeInfo(
+            op_idx=int(self._node_op[node]),
+            abs_qubit=self._circuit.qubits[qubit] if self._circuit is not None else qubit,
+            rel_qubit=int(self._node_rel[node]),
+        )
 
     def node_infos(self) -> list[set[NodeInfo]]:
-        return [{info} for info in self._node_infos]
+        return [{self.node_info(node)} for node in range(self.num_nodes)]
 
     def contraction_tree(self) -> ctg.ContractionTree:
         return ctg.ContractionTree(
-            self._hypergraph.inputs,
+            self._inputs,
             (),
-            self._hypergraph.size_dict,
+            self._size_dict,
             track_flops=True,
             track_childless=True,
         )
 
-    def num_qubits(self, node_subset: set[int]) -> int:
-        return len({self._node_infos[node].abs_qubit for node in node_subset})
+    def num_qubits(self, node_subset: Iterable[int]) -> int:
+        return len(np.unique(self._node_qubit[_node_array(node_subset)]))
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self._node_op)
+
+    def ops(self, node_subset: Iterable[int]) -> np.ndarray:
+        """Sorted indices of the operations with a node in the subset."""
+        return np.unique(self._node_op[_node_array(node_subset)])
+
+    def num_op_qubits(self, op_idx: int | np.ndarray) -> int | np.ndarray:
+        """Number of qubits of the operation(s) with the given index(es)."""
+        return self._op_ptr[op_idx + 1] - self._op_ptr[op_idx]
+
+    def num_wire_segments(self, node_subset: Iterable[int]) -> int:
+        """Number of wire segments of the subset, summed over all qubits.
+
+        A segment is a maximal run of nodes of the subset connected by wire
+        edges; a qubit whose wire leaves and re-enters the subset counts twice.
+        """
+        nodes = _node_array(node_subset)
+        next_nodes = self._wire_next[nodes]
+        num_links = np.count_nonzero(np.isin(next_nodes[next_nodes >= 0], nodes))
+        return len(nodes) - num_links
 
     @property
     def circuit(self) -> QuantumCircuit:
+        """A copy of the circuit of the IR."""
+        if self._circuit is None:
+            raise ValueError("IR rebuilt from a payload has no circuit")
         return self._circuit.copy()
 
     @property
     def op_nodes(self) -> list[set[int]]:
-        return self._op_nodes.copy()
+        ptr = self._op_ptr.tolist()
+        return [set(range(ptr[i], ptr[i + 1])) for i in range(len(ptr) - 1)]
 
     @property
     def hypergraph(self) -> ctg.HyperGraph:
-        return self._hypergraph.copy()
+        return ctg.HyperGraph(self._inputs, (), self._size_dict)
 
     def cut_circuit(self, node_subsets: list[set[int]]) -> QuantumCircuit:
-        node_to_subset = {
-            node: i for i, subset in enumerate(node_subsets) for node in subset
-        }
-        cut_edges = [
-            (u, v)
-            for u, v in self._hypergraph.edges.values()
-            if node_to_subset[u] != node_to_subset[v]
-        ]
-        wire_cuts = {
-            (self._node_infos[u].op_idx, self._node_infos[u].rel_qubit)
-            for u, v in cut_edges
-            if self._node_infos[u].abs_qubit == self._node_infos[v].abs_qubit
-        }
-        gate_cuts = {
-            self._node_infos[u].op_idx
-            for u, v in cut_edges
-            if self._node_infos[u].op_idx == self._node_infos[v].op_idx
-        }
+        if self._circuit is None:
+            raise ValueError("IR rebuilt from a payload has no circuit")
+        node_to_subset = np.full(self.num_nodes, -1, dtype=np.intp)
+        for i, subset in enumerate(node_subsets):
+            node_to_subset[_node_array(subset)] = i
+
+        subset_u = node_to_subset[self._edges[:, 0]]
+        subset_v = node_to_subset[self._edges[:, 1]]
+        u, v = self._edges[subset_u != subset_v].T
+        is_wire = self._node_qubit[u] == self._node_qubit[v]
+        wire_cuts = set(
+            zip(self._node_op[u[is_wire]].tolist(), self._node_rel[u[is_wire]].tolist())
+        )
+        gate_cuts = set(self._node_op[u[~is_wire]].tolist())
         return insert_cuts(self._circuit, gate_cuts, wire_cuts)
 
     # def hybrid_tn(self, node_subsets: list[set[int]]) -> HybridTensorNetwork:
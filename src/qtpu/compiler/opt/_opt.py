@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import math
+import multiprocessing
 import os
-from concurrent.futures import ProcessPoolExecutor
+import queue
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, cast
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Iterator, cast
 
 import cotengra as ctg
 import numpy as np
 
 from qtpu.compiler.opt._ir import HybridCircuitIR
-from qtpu.compiler.opt._util import get_leafs, sampling_overhead_tree
 from qtpu.transforms import remove_operations_by_name
 
 if TYPE_CHECKING:
@@ -40,6 +42,13 @@ class OptimizationResult:
     # The IR for reconstructing circuits
     ir: HybridCircuitIR
 
+    # Number of trials the frontier was computed from
+    num_trials: int = 0
+
+    # Why the search stopped: "completed" (all trials ran), "time_budget"
+    # or "patience" (no frontier improvement in the last trials)
+    stop_reason: str = "completed"
+
     def filter(
         self,
         max_size: int | None = None,
@@ -101,7 +110,7 @@ class OptimizationResult:
         """
         if point.leafs is None:
             # No-cut case
-            return self.ir.circuit.copy()
+            return self.ir.circuit
 
         leafs = [frozenset(leaf) for leaf in point.leafs]
         return self.ir.cut_circuit(leafs)
@@ -130,74 +139,32 @@ class OptimizationResult:
         return [(p, self.get_cut_circuit(p)) for p in valid]
 
 
+def leaf_error(ir: HybridCircuitIR, leaf: frozenset[int]) -> float:
+    """Estimated error of the subcircuit of a leaf (0.01 per 2q, 0.001 per 1q op)."""
+    # Unique operations in this subcircuit
+    op_qubits = ir.num_op_qubits(ir.ops(leaf))
+    return 0.01 * np.count_nonzero(op_qubits == 2) + 0.001 * np.count_nonzero(op_qubits == 1)
+
+
 def get_max_error_from_leafs(ir: HybridCircuitIR, leafs: list[frozenset[int]]) -> float:
     """Compute max subcircuit error directly from IR and leafs.
     
     This avoids the expensive circuit_to_heinsum call by computing error
     directly from node info.
     """
-    max_error = 0.0
-    # Access internal circuit directly to avoid copy on each access
-    circuit_data = ir._circuit.data
-    
-    for leaf in leafs:
-        # Get unique operations in this subcircuit
-        op_indices = set()
-        for node in leaf:
-            info = ir.node_info(node)
-            op_indices.add(info.op_idx)
-        
-        # Sum errors for operations in this subcircuit
-        subcircuit_error = 0.0
-        for op_idx in op_indices:
-            instr = circuit_data[op_idx]
-            if instr.operation.num_qubits == 2:
-                subcircuit_error += 0.01
-            elif instr.operation.num_qubits == 1:
-                subcircuit_error += 0.001
-        
-        max_error = max(max_error, subcircuit_error)
-    
-    return max_error
+    return max((leaf_error(ir, leaf) for leaf in leafs), default=0.0)
+
+
+def leaf_width(ir: HybridCircuitIR, leaf: frozenset[int]) -> int:
+    """Width of the subcircuit of a leaf: its wire segments over all qubits."""
+    return ir.num_wire_segments(leaf)
 
 
 def get_max_subcircuit_width_fast(
     ir: HybridCircuitIR, leafs: list[frozenset[int]]
 ) -> int:
     """Fast computation of max subcircuit width directly from IR structure."""
-    max_width = 0
-
-    hg = ir._hypergraph
-    node_neighbors: dict[int, set[int]] = {i: set() for i in range(hg.num_nodes)}
-    for edge_nodes in hg.edges.values():
-        if len(edge_nodes) == 2:
-            u, v = edge_nodes
-            node_neighbors[u].add(v)
-            node_neighbors[v].add(u)
-
-    for leaf in leafs:
-        nodes = set(leaf)
-        qubit_nodes: dict = {}
-        for node in nodes:
-            info = ir.node_info(node)
-            if info.abs_qubit not in qubit_nodes:
-                qubit_nodes[info.abs_qubit] = []
-            qubit_nodes[info.abs_qubit].append((node, info.op_idx))
-
-        width = 0
-        for qubit, nodes_with_time in qubit_nodes.items():
-            nodes_with_time.sort(key=lambda x: x[1])
-            segments = 1
-            for i in range(len(nodes_with_time) - 1):
-                node1 = nodes_with_time[i][0]
-                node2 = nodes_with_time[i + 1][0]
-                if node2 not in node_neighbors[node1]:
-                    segments += 1
-            width += segments
-
-        max_width = max(max_width, width)
-
-    return max_width
+    return max((leaf_width(ir, leaf) for leaf in leafs), default=0)
 
 
 def get_max_subcircuit_nodes(leafs: list[frozenset[int]]) -> int:
@@ -270,7 +237,7 @@ def partition_and_contract_subgraph(
 
 
 # =============================================================================
-#  Parallel Trial Execution (ProcessPoolExecutor)
+#  Parallel Trial Execution (multiprocessing.Pool)
 # =============================================================================
 def _sample_params(rng: np.random.Generator) -> dict[str, Any]:
     """Sample random hyperparameters for a trial."""
@@ -287,32 +254,123 @@ def _sample_params(rng: np.random.Generator) -> dict[str, Any]:
     }
 
 
-def _run_trial_in_process(args: tuple) -> dict[str, Any]:
-    """Run a single optimization trial in a separate process.
+# Hyperparameter samplers of the cut search (see _get_pareto_frontier). The
+# adaptive "tpe" sampler is experimental: it has not been shown to find better
+# frontiers than random sampling with the same number of trials.
+_SAMPLERS = ("random", "tpe")
+
+
+class _RandomSampler:
+    """Independent uniform hyperparameters (see :func:`_sample_params`)."""
+
+    adaptive = False
+
+    def __init__(self, seed: int | None):
+        self._rng = np.random.default_rng(seed)
+
+    def ask(self, trial_id: int) -> dict[str, Any]:
+        return _sample_params(self._rng)
+
+    def tell(self, trial_id: int, value: float) -> None:
+        pass
+
 
-    This function is designed to be called via ProcessPoolExecutor to bypass
-    the GIL limitation of KaHyPar (which is CPU-bound and doesn't release GIL).
+class _TPESampler:
+    """Hyperparameters from optuna's TPE sampler, via its ask/tell interface.
 
-    Returns intermediate results at each partition step to build Pareto frontier.
+    Learns which hyperparameters yield trials of high quality (the value told,
+    to be maximized, e.g. the trial's improvement of the Pareto frontier),
+    biasing later trials toward them. The search space is the one of
+    :func:`_sample_params`; the trial's random seed (which fixes the jitter
+    of the edge weights and KaHyPar's seed) is its id, as for random
+    sampling.
     """
-    circuit, max_sampling_cost, params, trial_id = args
 
-    # Import inside the process to avoid pickling issues
-    from qtpu.compiler.opt._ir import HybridCircuitIR
-    from qtpu.compiler.opt._util import get_leafs, sampling_overhead_tree
-    from qtpu.transforms import remove_operations_by_name
+    adaptive = True
 
-    import cotengra as ctg
+    def __init__(self, seed: int | None):
+        import optuna
 
-    circuit = remove_operations_by_name(circuit, {"barrier"}, inplace=False)
-    ir = HybridCircuitIR(circuit)
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        self._study = optuna.create_study(
+            direction="maximize",
+            # constant_liar keeps concurrently asked trials apart
+            sampler=optuna.samplers.TPESampler(seed=seed, constant_liar=True),
+        )
+        self._trials: dict[int, Any] = {}
+
+    def ask(self, trial_id: int) -> dict[str, Any]:
+        trial = self._study.ask()
+        self._trials[trial_id] = trial
+        return {
+            "random_strength": trial.suggest_float("random_strength", 0.01, 0.2),
+            "imbalance": trial.suggest_float("imbalance", 0.01, 0.6),
+            "imbalance_decay": trial.suggest_float("imbalance_decay", 0.0, 1.0),
+            "parts": trial.suggest_int("parts", 2, 3),
+            "parts_decay": trial.suggest_float("parts_decay", 0.0, 1.0),
+            "weight_edges": "log",
+            "mode": trial.suggest_categorical("mode", ["direct", "recursive"]),
+            "objective": trial.suggest_categorical("objective", ["cut", "km1"]),
+            "fix_output_nodes": trial.suggest_categorical("fix_output_nodes", ["auto", ""]),
+        }
+
+    def tell(self, trial_id: int, value: float) -> None:
+        self._study.tell(self._trials.pop(trial_id), value)
+
+
+def _hypervolume(points: list[tuple[float, float]], reference: tuple[float, float]) -> float:
+    """Area dominated by (cost, error) points, bounded by the reference point."""
+    volume = 0.0
+    ref_cost, best_error = reference
+    for cost, error in sorted(points):
+        if cost >= ref_cost:
+            break
+        if error < best_error:
+            volume += (ref_cost - cost) * (best_error - error)
+            best_error = error
+    return volume
+
+
+# IR of the circuit being optimized, set once per worker process by
+# _init_trial_worker, so trials only ship their hyperparameters
+_worker_ir: HybridCircuitIR | None = None
 
+
+def _init_trial_worker(payload: dict) -> None:
+    """Process pool initializer: rebuild the IR from its payload once."""
+    global _worker_ir
+    _worker_ir = HybridCircuitIR.from_payload(payload)
+
+
+def _run_trial_in_process(args: tuple) -> dict[str, Any]:
+    """Run a single optimization trial in a worker process.
+
+    This function is designed to be called via a multiprocessing.Pool (with
+    :func:`_init_trial_worker` as initializer) to bypass the GIL limitation
+    of KaHyPar (which is CPU-bound and doesn't release GIL).
+    """
+    max_sampling_cost, params, trial_id = args
+    return _run_trial(_worker_ir, max_sampling_cost, params, trial_id)
+
+
+def _run_trial(
+    ir: HybridCircuitIR,
+    max_sampling_cost: float | None,
+    params: dict[str, Any],
+    trial_id: int,
+) -> dict[str, Any]:
+    """Run a single optimization trial on the IR.
+
+    Returns intermediate results at each partition step to build Pareto
+    frontier. Each snapshot holds the metrics after the step and the change
+    of the partition (see :func:`_snapshot_points`); the metrics are updated
+    incrementally, so a step costs O(nodes of the split leaf).
+    """
     tree = ir.contraction_tree()
 
     # Setup randomization — seed with trial_id so repeated runs of
     # get_pareto_frontier with the same outer `seed` (which fixes the
-    # hyperparameter sequence via _sample_params) produce identical
-    # frontiers trial-for-trial.
+    # hyperparameter sequence) produce identical frontiers trial-for-trial.
     rng = ctg.core.get_rng(trial_id)
     rand_size_dict = ctg.core.jitter_dict(
         tree.size_dict.copy(), params["random_strength"], rng
@@ -330,6 +388,24 @@ def _run_trial_in_process(args: tuple) -> dict[str, Any]:
         "fix_output_nodes": params["fix_output_nodes"],
     }
 
+    # Metrics are kept per leaf (subcircuit) and only the leaf split in a
+    # step is replaced by its parts. Leaves get ids in order of creation, the
+    # root (all nodes) being 0, so snapshots only record which leaf was split.
+    root = next(iter(tree.childless), None)
+    leaf_ids = {root: 0}
+    num_leaves = 1
+    leaf_widths = {0: leaf_width(ir, root)} if root is not None else {}
+    leaf_errors = {0: leaf_error(ir, root)} if root is not None else {}
+    qubit_counts: dict[frozenset[int], int] = {}
+    # Sampling cost: total size of the indices that are legs of some leaf
+    leg_counts: dict[int, int] = {}
+    sampling_cost = 0.0
+
+    def num_qubits(node: frozenset[int]) -> int:
+        if node not in qubit_counts:
+            qubit_counts[node] = ir.num_qubits(node)
+        return qubit_counts[node]
+
     # Collect snapshots at each step for Pareto frontier
     snapshots = []
 
@@ -337,11 +413,11 @@ def _run_trial_in_process(args: tuple) -> dict[str, Any]:
         if tree.is_complete():
             break
 
-        leaf = max_qubits_leaf(ir, tree)
-        if leaf is None:
+        if not tree.childless:
             break
+        leaf = max(tree.childless, key=num_qubits)
 
-        partition_and_contract_subgraph(
+        new_subgs = partition_and_contract_subgraph(
             tree,
             leaf,
             rand_size_dict,
@@ -356,24 +432,43 @@ def _run_trial_in_process(args: tuple) -> dict[str, Any]:
             "auto-hq",
         )
 
-        # Record snapshot after each partition (fast metrics only)
-        leafs = get_leafs(tree)
-        sampling_cost = sampling_overhead_tree(tree)
-        size = get_max_subcircuit_width_fast(ir, leafs)
-
-        # Track contraction cost directly from tree
-        # This is the cost of contracting the partitioning tree
+        split = None
+        if len(new_subgs) > 1:
+            split = leaf_ids.pop(leaf)
+            del leaf_widths[split], leaf_errors[split]
+            for ind in tree.get_legs(leaf):
+                leg_counts[ind] -= 1
+                if not leg_counts[ind]:
+                    del leg_counts[ind]
+                    sampling_cost -= tree.size_dict[ind]
+            for part in new_subgs:
+                leaf_ids[part] = num_leaves
+                leaf_widths[num_leaves] = leaf_width(ir, part)
+                leaf_errors[num_leaves] = leaf_error(ir, part)
+                num_leaves += 1
+                for ind in tree.get_legs(part):
+                    if ind not in leg_counts:
+                        leg_counts[ind] = 0
+                        sampling_cost += tree.size_dict[ind]
+                    leg_counts[ind] += 1
+
+        # Cost of contracting the partitioning tree. The tree is built with
+        # track_flops=True (see HybridCircuitIR.contraction_tree), so cotengra
+        # updates the total as nodes are contracted and reading it is O(1)
         try:
             c_cost = tree.contraction_cost()
         except Exception:
             c_cost = sampling_cost  # Fallback
 
+        # Record the step as a delta: the split leaf id and its parts
         snapshots.append(
             {
-                "sampling_cost": sampling_cost,
-                "size": size,
+                "sampling_cost": float(sampling_cost),
+                "size": max(leaf_widths.values(), default=0),
+                "max_error": max(leaf_errors.values(), default=0.0),
                 "c_cost": c_cost,
-                "leafs": [list(leaf) for leaf in leafs],  # Store partition for later
+                "split": split,
+                "parts": [list(part) for part in new_subgs] if split is not None else [],
             }
         )
 
@@ -414,6 +509,112 @@ def _compute_pareto_frontier(points: list[CutPoint]) -> list[CutPoint]:
     return frontier
 
 
+def _iter_trial_results(
+    ir: HybridCircuitIR,
+    max_sampling_cost: float | None,
+    sampler: _RandomSampler | _TPESampler,
+    n_trials: int,
+    num_workers: int,
+    deadline: float | None,
+) -> Iterator[dict[str, Any]]:
+    """Run the trials and yield their results in order of completion.
+
+    Hyperparameters are asked from the sampler when a trial is submitted;
+    the caller tells it the result before the generator resumes. With
+    several workers or a deadline, the trials run in a process pool: all at
+    once for a non-adaptive sampler, otherwise ``num_workers`` at a time, so
+    later trials learn from earlier ones. No result is yielded after the
+    deadline (a ``perf_counter`` value). Closing the generator early cancels
+    the trials that have not started yet and kills the running ones by
+    terminating the worker processes (KaHyPar cannot be interrupted), so no
+    core keeps working on a trial whose result is discarded and a single
+    worker does not overshoot the deadline by a trial.
+    """
+    if num_workers <= 1 and deadline is None:
+        for i in range(n_trials):
+            yield _run_trial(ir, max_sampling_cost, sampler.ask(i), i)
+        return
+    num_workers = max(num_workers, 1)
+
+    # Results and worker errors, put by the pool's result handler thread
+    outcomes: queue.SimpleQueue = queue.SimpleQueue()
+    pool = multiprocessing.Pool(
+        num_workers,
+        initializer=_init_trial_worker,
+        initargs=(ir.to_payload(),),
+    )
+    completed = False
+    try:
+        num_submitted = 0
+        num_running = 0
+
+        def submit() -> None:
+            nonlocal num_submitted, num_running
+            args = (max_sampling_cost, sampler.ask(num_submitted), num_submitted)
+            pool.apply_async(
+                _run_trial_in_process,
+                (args,),
+                callback=outcomes.put,
+                error_callback=outcomes.put,
+            )
+            num_submitted += 1
+            num_running += 1
+
+        for _ in range(num_workers if sampler.adaptive else n_trials):
+            if num_submitted < n_trials:
+                submit()
+
+        while num_running:
+            timeout = None if deadline is None else max(deadline - perf_counter(), 0.0)
+            try:
+                outcome = outcomes.get(timeout=timeout)
+            except queue.Empty:
+                return
+            num_running -= 1
+            if isinstance(outcome, BaseException):
+                raise outcome
+            yield outcome
+            if num_submitted < n_trials:
+                submit()
+        completed = True
+    finally:
+        if completed:
+            pool.close()
+        else:
+            # Kill the trials still running instead of letting them finish
+            pool.terminate()
+        pool.join()
+
+
+def _snapshot_points(ir: HybridCircuitIR, result: dict[str, Any]) -> list[CutPoint]:
+    """CutPoints of the snapshots of a trial result.
+
+    The partition of each snapshot is rebuilt from the snapshot deltas:
+    starting from one leaf with all nodes (id 0), a snapshot replaces the
+    leaf with id ``split`` by its ``parts``, which get the next ids.
+    """
+    leaves = {0: list(range(ir.num_nodes))}
+    num_leaves = 1
+    points = []
+    for snapshot in result["snapshots"]:
+        if snapshot["split"] is not None:
+            del leaves[snapshot["split"]]
+            for part in snapshot["parts"]:
+                leaves[num_leaves] = part
+                num_leaves += 1
+
+        points.append(
+            CutPoint(
+                c_cost=snapshot.get("c_cost", snapshot["sampling_cost"]),
+                max_error=snapshot["max_error"],
+                max_size=snapshot["size"],
+                sampling_cost=snapshot["sampling_cost"],
+                leafs=list(leaves.values()),
+            )
+        )
+    return points
+
+
 # =============================================================================
 #  Main API
 # =============================================================================
@@ -424,6 +625,8 @@ def get_pareto_frontier(
     num_workers: int | None = None,
     n_trials: int = 100,
     seed: int | None = None,
+    time_budget: float | None = None,
+    patience: int | None = None,
 ) -> OptimizationResult:
     """Find the Pareto frontier of c_cost vs max_error tradeoffs.
 
@@ -431,36 +634,78 @@ def get_pareto_frontier(
     where the frontier is computed on c_cost (contraction cost) vs max_error
     (estimated error in largest subcircuit).
 
+    The search is budgeted by ``n_trials`` and, optionally, a wall-clock
+    ``time_budget`` and a ``patience``: trial results are merged into the
+    frontier as they complete, and once a budget is exhausted the remaining
+    trials are cancelled: trials not started yet are dropped and running
+    ones are killed (their worker processes are terminated; with a
+    ``time_budget``, even a single worker runs in a separate process for
+    this). Without ``time_budget`` and ``patience`` the result only
+    depends on ``seed``.
+
     Args:
         circuit: The quantum circuit to optimize.
         max_sampling_cost: Maximum sampling cost to explore.
         num_workers: Number of parallel workers. Defaults to min(8, cpu_count).
-        n_trials: Number of optimization trials.
+        n_trials: Maximum number of optimization trials.
         seed: Random seed for reproducibility.
+        time_budget: Wall-clock limit of the search in seconds. Trials still
+            running at the deadline are killed and their results discarded.
+        patience: Stop once this many consecutive trials have not improved
+            the Pareto frontier.
 
     Returns:
         OptimizationResult with:
         - all_points: All collected optimization snapshots
         - pareto_frontier: Pareto-optimal points on c_cost vs max_error
         - ir: HybridCircuitIR for reconstruction
+        - num_trials, stop_reason: How much of the search ran
     """
-    if num_workers is None:
-        num_workers = min(8, os.cpu_count() or 1)
+    return _get_pareto_frontier(
+        circuit,
+        max_sampling_cost=max_sampling_cost,
+        num_workers=num_workers,
+        n_trials=n_trials,
+        seed=seed,
+        time_budget=time_budget,
+        patience=patience,
+    )
 
-    rng = np.random.default_rng(seed)
-    all_params = [_sample_params(rng) for _ in range(n_trials)]
 
-    args_list = [
-        (circuit, max_sampling_cost, params, i) for i, params in enumerate(all_params)
-    ]
+def _get_pareto_frontier(
+    circuit: QuantumCircuit,
+    *,
+    max_sampling_cost: float = 120,
+    num_workers: int | None = None,
+    n_trials: int = 100,
+    seed: int | None = None,
+    time_budget: float | None = None,
+    patience: int | None = None,
+    sampler: str = "random",
+) -> OptimizationResult:
+    """:func:`get_pareto_frontier` with a choice of hyperparameter sampler.
+
+    ``sampler`` is "random" (independent uniform draws) or the experimental
+    "tpe" (optuna's Tree-structured Parzen Estimator, which biases later
+    trials toward hyperparameters whose trials improved the frontier; with
+    several workers its result also depends on the order of completion).
+    """
+    if time_budget is not None and time_budget <= 0:
+        raise ValueError(f"time_budget must be positive, got {time_budget}")
+    if patience is not None and patience < 1:
+        raise ValueError(f"patience must be at least 1, got {patience}")
+    if sampler not in _SAMPLERS:
+        raise ValueError(f"Unknown sampler: {sampler!r}. Expected one of {_SAMPLERS}.")
 
-    if num_workers > 1:
-        with ProcessPoolExecutor(max_workers=num_workers) as executor:
-            results = list(executor.map(_run_trial_in_process, args_list))
-    else:
-        results = [_run_trial_in_process(args) for args in args_list]
+    deadline = None if time_budget is None else perf_counter() + time_budget
 
-    # Setup IR for error computation
+    if num_workers is None:
+        num_workers = min(8, os.cpu_count() or 1)
+
+    trial_sampler = _RandomSampler(seed) if sampler == "random" else _TPESampler(seed)
+
+    # The IR is built once: the workers get its compact payload once each
+    # (not the circuit with every trial) and it is reused for error computation
     circuit_clean = remove_operations_by_name(circuit, {"barrier"}, inplace=False)
     ir = HybridCircuitIR(circuit_clean)
 
@@ -469,34 +714,69 @@ def get_pareto_frontier(
         0.01 if inst.operation.num_qubits == 2 else 0.001 for inst in circuit_clean.data
     )
 
-    # Add the "no cut" baseline
-    all_points: list[CutPoint] = [
-        CutPoint(
-            c_cost=0,  # No cuts = no classical overhead
-            max_error=no_cut_error,
-            max_size=circuit_clean.num_qubits,
-            sampling_cost=0,
-            leafs=None,  # Special marker for no-cut baseline
-        )
-    ]
-
-    # Collect all snapshots and compute max_error for each (fast path)
-    for result in results:
-        for snapshot in result["snapshots"]:
-            leafs = [frozenset(leaf) for leaf in snapshot["leafs"]]
-
-            # Compute max_error directly from IR (fast - no circuit reconstruction)
-            max_error = get_max_error_from_leafs(ir, leafs)
-
-            all_points.append(
-                CutPoint(
-                    c_cost=snapshot.get("c_cost", snapshot["sampling_cost"]),
-                    max_error=max_error,
-                    max_size=snapshot["size"],
-                    sampling_cost=snapshot["sampling_cost"],
-                    leafs=snapshot["leafs"],
-                )
+    # The "no cut" baseline
+    no_cut = CutPoint(
+        c_cost=0,  # No cuts = no classical overhead
+        max_error=no_cut_error,
+        max_size=circuit_clean.num_qubits,
+        sampling_cost=0,
+        leafs=None,  # Special marker for no-cut baseline
+    )
+
+    # Merge the trial results into the frontier as they complete
+    trial_points: dict[int, list[CutPoint]] = {}
+    frontier = [no_cut]
+    num_stale = 0
+    stop_reason = "completed"
+    # Trial quality told to the sampler: the hypervolume its points add to the
+    # frontier in (log10(1 + c_cost), max_error), up to the no-cut error and a
+    # cost one decade above the most expensive point of the first trial
+    reference: tuple[float, float] | None = None
+    frontier_volume = 0.0
+    results = _iter_trial_results(
+        ir, max_sampling_cost, trial_sampler, n_trials, num_workers, deadline
+    )
+    try:
+        for result in results:
+            points = _snapshot_points(ir, result)
+            trial_points[result["trial_id"]] = points
+
+            frontier = _compute_pareto_frontier(frontier + points)
+
+            if reference is None:
+                max_cost = max((p.c_cost for p in points), default=0.0)
+                reference = (math.log10(1 + max_cost) + 1.0, no_cut_error)
+            volume = _hypervolume(
+                [(math.log10(1 + p.c_cost), p.max_error) for p in frontier], reference
             )
+            trial_sampler.tell(result["trial_id"], volume - frontier_volume)
+            frontier_volume = volume
+
+            on_frontier = {id(p) for p in frontier}
+            if any(id(p) in on_frontier for p in points):
+                num_stale = 0
+            else:
+                num_stale += 1
+
+            if len(trial_points) == n_trials:
+                break
+            if patience is not None and num_stale >= patience:
+                stop_reason = "patience"
+                break
+            if deadline is not None and perf_counter() >= deadline:
+                stop_reason = "time_budget"
+                break
+    finally:
+        results.close()
+
+    if stop_reason == "completed" and len(trial_points) < n_trials:
+        stop_reason = "time_budget"
+
+    # All points in trial order, so the result does not depend on the order
+    # in which the trials completed
+    all_points: list[CutPoint] = [no_cut]
+    for trial_id in sorted(trial_points):
+        all_points.extend(trial_points[trial_id])
 
     # Compute Pareto frontier on c_cost vs max_error
     frontier = _compute_pareto_frontier(all_points)
@@ -505,4 +785,6 @@ def get_pareto_frontier(
         all_points=all_points,
         pareto_frontier=frontier,
         ir=ir,
+        num_trials=len(trial_points),
+        stop_reason=stop_reason,
     )
@@ -163,6 +163,8 @@ class OptimizationParameters:
     num_workers: int | None = None
     n_trials: int = 100
     seed: int | None = None
+    time_budget: float | None = None  # Per quantum tensor, in seconds
+    patience: int | None = None
 
 
 def optimize(
@@ -239,6 +241,8 @@ def optimize(
                 num_workers=params.num_workers,
                 n_trials=params.n_trials,
                 seed=params.seed,
+                time_budget=params.time_budget,
+                patience=params.patience,
             )
             tensor_results.append((i, opt_result))
 
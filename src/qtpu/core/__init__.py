@@ -3,6 +3,7 @@
 This module provides the fundamental tensor types used throughout QTPU:
 
 - ISwitch: Instruction for parameterized quantum circuit selection
+- ISwitchVariantSummary: Cached metadata of one ISwitch variant
 - QuantumTensor: Tensor of quantum circuits indexed by ISwitch parameters
 - CTensor: Classical tensor with named indices
 - TensorSpec: Lightweight specification of tensor shape and indices
@@ -11,7 +12,7 @@ This module provides the fundamental tensor types used throughout QTPU:
 
 from dataclasses import dataclass
 
-from qtpu.core.iswitch import ISwitch
+from qtpu.core.iswitch import ISwitch, ISwitchVariantSummary
 from qtpu.core.qtensor import QuantumTensor
 from qtpu.core.ctensor import CTensor
 from qtpu.core.heinsum import HEinsum, rand_regular_heinsum
@@ -33,6 +34,7 @@ class TensorSpec:
 
 __all__ = [
     "ISwitch",
+    "ISwitchVariantSummary",
     "QuantumTensor",
     "CTensor",
     "TensorSpec",
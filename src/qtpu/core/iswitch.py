@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from qiskit.circuit import Instruction, Parameter, QuantumCircuit
@@ -10,8 +13,61 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 
+@dataclass(frozen=True)
+class ISwitchVariantSummary:
+    """Metadata of one ISwitch variant, derived once from its circuit.
+
+    Attributes:
+        qubits: Indices of the ISwitch qubits the variant acts on.
+        num_qpd_measures: Number of ``qpd_measure`` operations in the variant.
+        ends_with_reset: Whether the variant's last operation is a reset.
+        parameter_names: Names of the free parameters of the variant.
+    """
+
+    qubits: frozenset[int]
+    num_qpd_measures: int
+    ends_with_reset: bool
+    parameter_names: frozenset[str]
+
+    @classmethod
+    def from_circuit(cls, circuit: QuantumCircuit) -> ISwitchVariantSummary:
+        """Summarize a variant circuit.
+
+        Args:
+            circuit (QuantumCircuit): The variant circuit.
+
+        Returns:
+            ISwitchVariantSummary: The summary of the circuit.
+        """
+        qubits = set()
+        num_qpd_measures = 0
+        for instr in circuit:
+            qubits.update(circuit.find_bit(q).index for q in instr.qubits)
+            if instr.operation.name.lower() == "qpd_measure":
+                num_qpd_measures += 1
+        return cls(
+            qubits=frozenset(qubits),
+            num_qpd_measures=num_qpd_measures,
+            ends_with_reset=bool(circuit.data)
+            and circuit.data[-1].operation.name.lower() == "reset",
+            parameter_names=frozenset(p.name for p in circuit.parameters),
+        )
+
+
 class ISwitch(Instruction):
-    """ISwitch instruction for quantum tensors."""
+    """ISwitch instruction for quantum tensors.
+
+    Variant circuits are built by the selector on first use and kept in a
+    least-recently-used cache bounded by their total number of instructions,
+    so code generation and repeated decompositions, which scan all variants
+    in order, do not rebuild them. Summaries are small and kept for every
+    variant. The caches are shared by copies of the ISwitch and guarded by a
+    lock, so variants can be requested from several threads.
+    """
+
+    #: Maximum total number of instructions of the variant circuits cached per
+    #: ISwitch. The most recently used variant is always kept.
+    VARIANT_CACHE_OPS = 1 << 20
 
     def __init__(
         self,
@@ -31,6 +87,10 @@ class ISwitch(Instruction):
         """
         self._size = size
         self._selector = selector
+        self._variants: OrderedDict[int, QuantumCircuit] = OrderedDict()
+        self._cached_ops = [0]  # in a list, so copies share the count
+        self._summaries: dict[int, ISwitchVariantSummary] = {}
+        self._cache_lock = threading.RLock()
         super().__init__("iswitch", num_qubits, 0, params=(idx_param,))
 
     @property
@@ -59,6 +119,63 @@ class ISwitch(Instruction):
         """
         return self._size
 
+    def variant(self, index: int) -> QuantumCircuit:
+        """Returns the circuit selected by the given index.
+
+        The circuit is cached and shared between calls, so it must not be
+        modified.
+
+        Args:
+            index (int): The index of the variant.
+
+        Returns:
+            QuantumCircuit: The selected circuit.
+        """
+        with self._cache_lock:
+            circuit = self._variants.get(index)
+            if circuit is not None:
+                self._variants.move_to_end(index)
+                return circuit
+
+            circuit = self._selector(index)
+            self._variants[index] = circuit
+            self._cached_ops[0] += len(circuit)
+            while self._cached_ops[0] > self.VARIANT_CACHE_OPS and len(self._variants) > 1:
+                _, evicted = self._variants.popitem(last=False)
+                self._cached_ops[0] -= len(evicted)
+            return circuit
+
+    def summary(self, index: int) -> ISwitchVariantSummary:
+        """Returns the summary of the circuit selected by the given index.
+
+        Args:
+            index (int): The index of the variant.
+
+        Returns:
+            ISwitchVariantSummary: The summary of the selected circuit.
+        """
+        with self._cache_lock:
+            summary = self._summaries.get(index)
+            if summary is None:
+                summary = ISwitchVariantSummary.from_circuit(self.variant(index))
+                self._summaries[index] = summary
+            return summary
+
+    def __copy__(self) -> ISwitch:
+        # Copies share the caches and their lock (pickling drops the lock)
+        copied = self.__class__.__new__(self.__class__)
+        copied.__dict__.update(self.__dict__)
+        return copied
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_cache_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._cache_lock = threading.RLock()
+
     @staticmethod
     def from_1q_instructions(
         idx_param: Parameter, instructions: list[list[Instruction]]
@@ -92,7 +209,7 @@ class ISwitch(Instruction):
             msg = f"Parameter value {param_value} out of bounds for ISwitch of size {self.size}."
             raise ValueError(msg)
 
-        selected_circuit = self._selector(param_value)
+        selected_circuit = self.variant(param_value)
 
         if selected_circuit.num_qubits != self.num_qubits:
             msg = (
@@ -108,4 +225,4 @@ class ISwitch(Instruction):
             )
             raise ValueError(msg)
 
-        self._definition = selected_circuit
+        self._definition = selected_circuit.copy()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 import numpy as np
 from qiskit.circuit import QuantumCircuit, Parameter
@@ -33,6 +33,10 @@ class QuantumTensor:
         The shape of the tensor, representing the number of parameters for each operation.
     inds : tuple[str, ...]
         The names of the parameters in the tensor.
+
+    The tensor is a lazy view: its circuits are only built when an element is
+    accessed, so ``len``, ``size`` and iteration over indices are free of
+    circuit construction.
     """
 
     def __init__(self, circuit: QuantumCircuit) -> None:
@@ -50,8 +54,10 @@ class QuantumTensor:
         )
 
         self._circuit = circuit
+        self._params: tuple[Parameter, ...] = tuple(p for p, _ in param_to_op)
         self._shape: tuple[int, ...] = tuple(len(op) for _, op in param_to_op)
-        self._inds: tuple[str, ...] = tuple(p.name for p, _ in param_to_op)
+        self._inds: tuple[str, ...] = tuple(p.name for p in self._params)
+        self._representative: QuantumCircuit | None = None
 
     @property
     def circuit(self) -> QuantumCircuit:
@@ -80,9 +86,54 @@ class QuantumTensor:
         """
         return self._inds
 
+    @property
+    def size(self) -> int:
+        """Returns the number of circuits in the tensor.
+
+        Returns:
+            int: The product of the tensor's dimensions (1 for a scalar tensor).
+        """
+        return int(np.prod(self._shape, dtype=np.int64))
+
+    def __len__(self) -> int:
+        """Returns the number of circuits in the tensor, without building them.
+
+        Returns:
+            int: The number of circuits in the tensor.
+        """
+        return self.size
+
+    def __iter__(self) -> Iterator[QuantumCircuit]:
+        """Iterates lazily over the circuits of the tensor in C order.
+
+        Returns:
+            Iterator[QuantumCircuit]: An iterator over the circuits.
+        """
+        return self.iter_circuits()
+
+    def iter_indices(self) -> Iterator[tuple[int, ...]]:
+        """Iterates over the index tuples of the tensor in C order.
+
+        Returns:
+            Iterator[tuple[int, ...]]: An iterator over the index tuples.
+        """
+        return np.ndindex(self._shape)
+
+    def iter_circuits(self) -> Iterator[QuantumCircuit]:
+        """Iterates over the circuits of the tensor in C order, building one at a time.
+
+        Returns:
+            Iterator[QuantumCircuit]: An iterator over the circuits.
+        """
+        for index in self.iter_indices():
+            yield self[index]
+
     def __getitem__(self, index: int | tuple[int, ...]) -> QuantumCircuit:
         """Returns the circuit corresponding to the provided index.
 
+        Only the ISwitch index parameters are bound; the variant circuits are
+        built (and cached) by the ISwitches when the result is decomposed.
+
         Args:
             index (int | tuple[int, ...]): The index of the circuit to be returned.
 
@@ -94,8 +145,9 @@ class QuantumTensor:
 
         assert len(index) == len(self.shape)
 
-        param_map = dict(zip(self.inds, index, strict=False))
-        return self._circuit.assign_parameters(param_map)
+        return self._circuit.assign_parameters(
+            dict(zip(self._params, index)), flat_input=True
+        )
 
     def flat(self) -> list[QuantumCircuit]:
         """Returns the circuit tensor as a flat list.
@@ -103,31 +155,47 @@ class QuantumTensor:
         Returns:
             list[QuantumCircuit]: The circuit tensor flattened into a list.
         """
-        indices = np.ndindex(self.shape)
-        return [self[tuple(idx)] for idx in indices]
+        return list(self.iter_circuits())
 
     def get_one(self) -> QuantumCircuit:
         """Returns a single representative circuit from the tensor.
         
         Returns the circuit at index (0, 0, ..., 0), which is useful for
         estimating properties (like QPU time) that are similar across all
-        circuits in the tensor.
+        circuits in the tensor. The circuit is built once and shared between
+        calls, so it must not be modified.
         
         Returns:
             QuantumCircuit: A single circuit from the tensor.
         """
         if not self.shape:
             return self._circuit
-        index = tuple(0 for _ in self.shape)
-        return self[index]
-
-    def compile(self, warmup: bool = True) -> "CompiledQuantumTensor":
+        if self._representative is None:
+            self._representative = self[tuple(0 for _ in self.shape)]
+        return self._representative
+
+    def compile(
+        self,
+        warmup: bool = True,
+        parametric_iswitches: bool = False,
+        fingerprint: str | None = None,
+    ) -> "CompiledQuantumTensor":
         """Compile this quantum tensor for fast repeated evaluation.
 
         Compiles the quantum circuit to CUDA-Q for efficient execution.
         The compiled tensor caches the kernel, so the first call includes
         JIT compilation overhead but subsequent calls are fast.
 
+        Args:
+            warmup: Trigger the JIT compilation right away.
+            parametric_iswitches: Emit ISwitch variants that differ only in
+                angles as one gate sequence reading the angles from tables,
+                so the kernel size does not grow with the number of variants.
+            fingerprint: The circuit fingerprint (see
+                :func:`qtpu.compiler.codegen.circuit_fingerprint`, with the
+                same ``parametric_iswitches``), if the caller already
+                computed it.
+
         Returns:
             CompiledQuantumTensor: A compiled tensor with a fast __call__ method.
 
@@ -143,7 +211,12 @@ class QuantumTensor:
         """
         from qtpu.compiler.codegen import CompiledQuantumTensor
 
-        return CompiledQuantumTensor(self, warmup=warmup)
+        return CompiledQuantumTensor(
+            self,
+            warmup=warmup,
+            parametric_iswitches=parametric_iswitches,
+            fingerprint=fingerprint,
+        )
 
     @classmethod
     def from_shape(
@@ -29,6 +29,10 @@ from qtpu.runtime.backends import (
     QuantumBackend,
     CudaQBackend,
 )
+from qtpu.runtime.cache import (
+    ElementCache,
+    ElementCacheStore,
+)
 from qtpu.runtime.device import (
     Device,
     get_device,
@@ -51,6 +55,9 @@ __all__ = [
     # Backends
     "QuantumBackend",
     "CudaQBackend",
+    # Element caches
+    "ElementCache",
+    "ElementCacheStore",
     # Device
     "Device",
     "get_device",
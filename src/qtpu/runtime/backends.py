@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from time import perf_counter
 from typing import TYPE_CHECKING
 
@@ -17,6 +20,24 @@ except ImportError:
 if TYPE_CHECKING:
     from qtpu.core import QuantumTensor
     from qtpu.compiler.codegen import CompiledQuantumTensor
+    from qtpu.runtime.adjoint import AdjointDifferentiator
+    from qtpu.runtime.cache import ElementCache
+
+
+GRADIENT_METHODS = ("parameter_shift", "adjoint")
+
+
+def _parameter_shift_points(
+    params: dict[str, float], wrt: list[str] | tuple[str, ...]
+) -> list[dict[str, float]]:
+    """Shifted parameter points; rows 2k and 2k + 1 shift wrt[k] by +/- pi/2."""
+    points = []
+    for name in wrt:
+        for sign in (1.0, -1.0):
+            shifted = params.copy()
+            shifted[name] = params[name] + sign * np.pi / 2
+            points.append(shifted)
+    return points
 
 
 class QuantumBackend(ABC):
@@ -36,6 +57,14 @@ class QuantumBackend(ABC):
         """
         return 0.0
 
+    def compilation_time(self, qtensor: "QuantumTensor") -> float:
+        """Time spent compiling a quantum tensor (0 if it was not compiled)."""
+        return 0.0
+
+    def num_unique_kernels(self, qtensors: list["QuantumTensor"]) -> int:
+        """Number of distinct kernels compiled for the given quantum tensors."""
+        return 0
+
     @abstractmethod
     def evaluate(
         self,
@@ -51,6 +80,79 @@ class QuantumBackend(ABC):
         """
         ...
 
+    async def evaluate_async(
+        self,
+        qtensor: "QuantumTensor",
+        params: dict[str, float],
+        dtype: torch.dtype,
+        device: torch.device,
+    ) -> tuple[torch.Tensor, float, float]:
+        """Evaluate a quantum tensor without blocking the event loop.
+
+        Used by the ``"async"`` executor. The default runs :meth:`evaluate`
+        in a worker thread; remote backends can override this to await
+        their jobs directly.
+
+        Returns:
+            Tuple of (result, eval_time, estimated_qpu_time).
+        """
+        return await asyncio.to_thread(self.evaluate, qtensor, params, dtype, device)
+
+    def evaluate_batch(
+        self,
+        qtensor: "QuantumTensor",
+        params_list: list[dict[str, float]],
+        dtype: torch.dtype,
+        device: torch.device,
+    ) -> tuple[torch.Tensor, float, float]:
+        """Evaluate a quantum tensor for several parameter points.
+
+        The default evaluates the points one by one and stacks the results;
+        backends that can evaluate many points in one call should override it.
+
+        Returns:
+            Tuple of (result, eval_time, estimated_qpu_time), where result has
+            shape (len(params_list), *qtensor.shape).
+        """
+        results, eval_time, qpu_time = [], 0.0, 0.0
+        for params in params_list:
+            result, t_eval, t_qpu = self.evaluate(qtensor, params, dtype, device)
+            results.append(result)
+            eval_time += t_eval
+            qpu_time += t_qpu
+        if not results:
+            return torch.empty((0, *qtensor.shape), dtype=dtype, device=device), 0.0, 0.0
+        return torch.stack(results), eval_time, qpu_time
+
+    def jacobian(
+        self,
+        qtensor: "QuantumTensor",
+        params: dict[str, float],
+        wrt: list[str] | tuple[str, ...],
+        dtype: torch.dtype,
+        device: torch.device,
+    ) -> torch.Tensor:
+        """Jacobian of a quantum tensor with respect to circuit parameters.
+
+        The default uses the parameter-shift rule
+        ∂f/∂θ = (1/2)[f(θ + π/2) - f(θ - π/2)], with all 2P shifted points
+        evaluated in one :meth:`evaluate_batch` call.
+
+        Args:
+            qtensor: The quantum tensor.
+            params: Values of all circuit parameters.
+            wrt: Names of the parameters to differentiate with respect to.
+            dtype: Result dtype.
+            device: Result device.
+
+        Returns:
+            Tensor of shape (len(wrt), *qtensor.shape).
+        """
+        shifted, _, _ = self.evaluate_batch(
+            qtensor, _parameter_shift_points(params, wrt), dtype, device
+        )
+        return 0.5 * (shifted[0::2] - shifted[1::2])
+
 
 class CudaQBackend(QuantumBackend):
     """CUDA-Q backend for quantum tensor evaluation.
@@ -69,6 +171,20 @@ class CudaQBackend(QuantumBackend):
         backend_name: Fake backend name for QPU time estimation (e.g., "FakeMarrakesh").
         shots: Number of shots for time estimation.
         optimization_level: Transpilation optimization level (0-3).
+        chunk_size: If set, evaluate each quantum tensor in blocks of at most
+            this many elements to bound the memory of CUDA-Q results.
+        gradient: How :meth:`jacobian` differentiates quantum tensors:
+            "parameter_shift" (default, 2P batched evaluations) or "adjoint"
+            (one forward and one backward statevector sweep, independent of
+            the number of parameters; see :mod:`qtpu.runtime.adjoint`).
+        compile_workers: Number of threads :meth:`prepare` compiles kernels
+            with (None = ThreadPoolExecutor default, 1 = sequential).
+        parametric_iswitches: If True, generate kernels in which ISwitch
+            variants differing only in angles share one gate sequence that
+            reads the angles from tables passed at call time (e.g.
+            data-encoding feature maps), so kernel size and JIT time do not
+            grow with the number of variants, and circuits differing only in
+            these angles (e.g. other data batches) reuse the kernel.
 
     Example:
         >>> # Full simulation
@@ -79,6 +195,9 @@ class CudaQBackend(QuantumBackend):
         >>> 
         >>> # Fast mode (no simulation, no QPU estimation)
         >>> backend = CudaQBackend(simulate=False, estimate_qpu_time=False)
+        >>>
+        >>> # Adjoint gradients for training with many parameters
+        >>> backend = CudaQBackend(gradient="adjoint")
     """
 
     def __init__(
@@ -89,13 +208,25 @@ class CudaQBackend(QuantumBackend):
         backend_name: str = "FakeMarrakesh",
         shots: int = 1000,
         optimization_level: int = 3,
+        chunk_size: int | None = None,
+        gradient: str = "parameter_shift",
+        compile_workers: int | None = None,
+        parametric_iswitches: bool = False,
     ):
+        if gradient not in GRADIENT_METHODS:
+            raise ValueError(
+                f"Unknown gradient method: {gradient!r}. Expected one of {GRADIENT_METHODS}."
+            )
         self._target = target
         self._simulate = simulate
         self._estimate_qpu_time = estimate_qpu_time
         self._backend_name = backend_name
         self._shots = shots
         self._optimization_level = optimization_level
+        self._chunk_size = chunk_size
+        self._gradient = gradient
+        self._compile_workers = compile_workers
+        self._parametric_iswitches = parametric_iswitches
         self._target_set = False
 
         # Warmup only if we're actually simulating
@@ -109,8 +240,37 @@ class CudaQBackend(QuantumBackend):
         self._compiled_cache: dict[int, "CompiledQuantumTensor"] = {}
         # Track compilation times
         self._compilation_times: dict[int, float] = {}
+        # Kernel fingerprints of the tensors compiled in prepare()
+        self._fingerprints: dict[int, str] = {}
         # Cache for estimated QPU times per qtensor
         self._qpu_time_cache: dict[int, float] = {}
+        # Per-qtensor adjoint differentiators (gradient="adjoint")
+        self._adjoint_cache: dict[int, "AdjointDifferentiator"] = {}
+        # Guards the caches above against concurrent evaluations (thread and
+        # async executors), so a tensor is compiled only once
+        self._cache_lock = threading.RLock()
+
+    def __getstate__(self) -> dict:
+        # Pickled copies (e.g. for process executor workers) start with empty
+        # caches and compile their own kernels
+        state = self.__dict__.copy()
+        del state["_cache_lock"]
+        state["_target_set"] = False
+        state["_fake_backend"] = None
+        state["_dt"] = None
+        for name in (
+            "_compiled_cache",
+            "_compilation_times",
+            "_fingerprints",
+            "_qpu_time_cache",
+            "_adjoint_cache",
+        ):
+            state[name] = {}
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._cache_lock = threading.RLock()
 
     def _get_fake_backend(self):
         """Lazily initialize the fake backend for timing estimation."""
@@ -142,49 +302,133 @@ class CudaQBackend(QuantumBackend):
         """Whether actual simulation is enabled."""
         return self._simulate
 
+    @property
+    def gradient(self) -> str:
+        """Gradient method used by :meth:`jacobian`."""
+        return self._gradient
+
     @property
     def total_compilation_time(self) -> float:
         """Total time spent compiling quantum tensors."""
-        return sum(self._compilation_times.values())
+        with self._cache_lock:
+            return sum(self._compilation_times.values())
+
+    def compilation_time(self, qtensor: "QuantumTensor") -> float:
+        """Time spent compiling a quantum tensor (0 if it was not compiled)."""
+        return self._compilation_times.get(id(qtensor), 0.0)
+
+    def num_unique_kernels(self, qtensors: list["QuantumTensor"]) -> int:
+        """Number of distinct kernels compiled in :meth:`prepare` for the given tensors."""
+        return len({
+            self._fingerprints[id(qtensor)]
+            for qtensor in qtensors
+            if id(qtensor) in self._fingerprints
+        })
+
+    @property
+    def kernel_cache_hits(self) -> int:
+        """Number of compiled quantum tensors whose kernel was reused from a cache."""
+        with self._cache_lock:
+            compiled_tensors = list(self._compiled_cache.values())
+        return sum(compiled.kernel_cache_hit for compiled in compiled_tensors)
 
     @property
     def total_code_lines(self) -> int:
         """Total number of code lines in all compiled quantum tensors."""
-        return sum(compiled.num_code_lines for compiled in self._compiled_cache.values())
+        with self._cache_lock:
+            compiled_tensors = list(self._compiled_cache.values())
+        return sum(compiled.num_code_lines for compiled in compiled_tensors)
 
     def _ensure_target(self):
         """Set the CUDA-Q target if not already set."""
-        if not self._target_set:
-            current_target = cudaq.get_target().name
-            if current_target != self._target:
-                try:
-                    cudaq.set_target(self._target)
-                except Exception:
-                    pass  # Target may not be available
-            self._target_set = True
+        if self._target_set:
+            return
+        with self._cache_lock:
+            if not self._target_set:
+                current_target = cudaq.get_target().name
+                if current_target != self._target:
+                    try:
+                        cudaq.set_target(self._target)
+                    except Exception:
+                        pass  # Target may not be available
+                self._target_set = True
+
+    def _get_compiled(self, qtensor: "QuantumTensor") -> "CompiledQuantumTensor":
+        """Return the compiled quantum tensor, compiling it on the first use."""
+        compiled = self._compiled_cache.get(id(qtensor))
+        if compiled is not None:
+            return compiled
+        with self._cache_lock:
+            compiled = self._compiled_cache.get(id(qtensor))
+            if compiled is None:
+                compile_start = perf_counter()
+                compiled = qtensor.compile(
+                    warmup=self._warmup, parametric_iswitches=self._parametric_iswitches
+                )
+                self._compiled_cache[id(qtensor)] = compiled
+                self._compilation_times[id(qtensor)] = perf_counter() - compile_start
+        return compiled
 
     def prepare(self, qtensors: list["QuantumTensor"]) -> float:
-        """Prepare the backend by compiling all quantum tensors.
+        """Prepare the backend by compiling all quantum tensors ahead of time.
+
+        Tensors are grouped by kernel fingerprint (see
+        :func:`qtpu.compiler.codegen.circuit_fingerprint`). The groups are
+        compiled concurrently in a thread pool: code generation, module
+        loading and the JIT warmup of a kernel run once per group, and the
+        other tensors of a group reuse the kernel.
         
         Args:
             qtensors: List of quantum tensors to prepare.
             
         Returns:
-            Total compilation time in seconds.
+            Total compilation time in seconds (wall clock).
         """
+        from qtpu.compiler.codegen import circuit_fingerprint
+
         start = perf_counter()
         
         # Ensure CudaQ target is set
         self._ensure_target()
-        
+
+        # Group the tensors not compiled yet by kernel
+        groups: dict[str, list["QuantumTensor"]] = {}
+        seen: set[int] = set()
         for qtensor in qtensors:
             qtensor_id = id(qtensor)
-            
-            # Compile to CudaQ if not already cached
-            if qtensor_id not in self._compiled_cache:
+            if qtensor_id in self._compiled_cache or qtensor_id in seen:
+                continue
+            seen.add(qtensor_id)
+            fingerprint = circuit_fingerprint(
+                qtensor.circuit, qtensor.shape, self._parametric_iswitches
+            )
+            self._fingerprints[qtensor_id] = fingerprint
+            groups.setdefault(fingerprint, []).append(qtensor)
+
+        def compile_group(group: list["QuantumTensor"]) -> list[tuple["CompiledQuantumTensor", float]]:
+            compiled = []
+            for k, qtensor in enumerate(group):
                 compile_start = perf_counter()
-                self._compiled_cache[qtensor_id] = qtensor.compile(warmup=self._warmup)
-                self._compilation_times[qtensor_id] = perf_counter() - compile_start
+                # The kernel is shared, so it is warmed up once per group
+                compiled_qtensor = qtensor.compile(
+                    warmup=self._warmup and k == 0,
+                    parametric_iswitches=self._parametric_iswitches,
+                    fingerprint=self._fingerprints[id(qtensor)],
+                )
+                compiled.append((compiled_qtensor, perf_counter() - compile_start))
+            return compiled
+
+        if self._compile_workers == 1 or len(groups) <= 1:
+            results = [compile_group(group) for group in groups.values()]
+        else:
+            with ThreadPoolExecutor(max_workers=self._compile_workers) as pool:
+                results = list(pool.map(compile_group, groups.values()))
+
+        with self._cache_lock:
+            for group, group_results in zip(groups.values(), results):
+                for qtensor, (compiled, compile_time) in zip(group, group_results):
+                    self._compiled_cache[id(qtensor)] = compiled
+                    self._compilation_times[id(qtensor)] = compile_time
         
         return perf_counter() - start
 
@@ -201,16 +445,14 @@ class CudaQBackend(QuantumBackend):
         from qiskit.compiler import transpile
         from qtpu.transforms import remove_operations_by_name
 
-        # Get circuits
-        circuits = qtensor.flat()
-        num_circuits = len(circuits)
+        num_circuits = qtensor.size
 
         if num_circuits == 0:
             self._qpu_time_cache[qtensor_id] = 0.0
             return 0.0
 
         # Take first circuit as representative
-        circuit = circuits[0].decompose()
+        circuit = qtensor.get_one().decompose()
 
         # Bind parameters
         if circuit.parameters and params:
@@ -269,18 +511,11 @@ class CudaQBackend(QuantumBackend):
         Returns:
             Tuple of (result, eval_time, estimated_qpu_time).
         """
-        qtensor_id = id(qtensor)
-        
         # Ensure target is set
         self._ensure_target()
 
         # Get compiled tensor (compile if needed)
-        if qtensor_id not in self._compiled_cache:
-            compile_start = perf_counter()
-            self._compiled_cache[qtensor_id] = qtensor.compile(warmup=self._warmup)
-            self._compilation_times[qtensor_id] = perf_counter() - compile_start
-        
-        compiled = self._compiled_cache[qtensor_id]
+        compiled = self._get_compiled(qtensor)
 
         # Get QPU time estimate if enabled
         estimated_qpu_time = self._estimate_qpu_time_for_qtensor(qtensor, params)
@@ -292,7 +527,7 @@ class CudaQBackend(QuantumBackend):
 
         # Execute the compiled tensor with CudaQ
         exec_start = perf_counter()
-        result_np = compiled(**params)
+        result_np = compiled(_chunk_size=self._chunk_size, **params)
         exec_time = perf_counter() - exec_start
 
         # Convert to torch tensor
@@ -300,22 +535,100 @@ class CudaQBackend(QuantumBackend):
 
         return result, exec_time, estimated_qpu_time
 
+    def evaluate_batch(
+        self,
+        qtensor: "QuantumTensor",
+        params_list: list[dict[str, float]],
+        dtype: torch.dtype,
+        device: torch.device,
+    ) -> tuple[torch.Tensor, float, float]:
+        """Evaluate a quantum tensor for several parameter points.
+
+        All points are evaluated in a single CUDA-Q broadcast over the
+        (batch x index space) argument arrays.
+
+        Returns:
+            Tuple of (result, eval_time, estimated_qpu_time), where result has
+            shape (len(params_list), *qtensor.shape).
+        """
+        batch_size = len(params_list)
+
+        self._ensure_target()
+
+        compiled = self._get_compiled(qtensor)
+
+        # Every batch element runs the full set of circuits
+        estimated_qpu_time = 0.0
+        if batch_size > 0:
+            estimated_qpu_time = batch_size * self._estimate_qpu_time_for_qtensor(
+                qtensor, params_list[0]
+            )
+
+        if not self._simulate:
+            result = torch.randn((batch_size, *qtensor.shape), dtype=dtype, device=device)
+            return result, 0.0, estimated_qpu_time
+
+        exec_start = perf_counter()
+        result_np = compiled.batch(params_list)
+        exec_time = perf_counter() - exec_start
+
+        result = torch.tensor(result_np, dtype=dtype, device=device)
+
+        return result, exec_time, estimated_qpu_time
+
+    def jacobian(
+        self,
+        qtensor: "QuantumTensor",
+        params: dict[str, float],
+        wrt: list[str] | tuple[str, ...],
+        dtype: torch.dtype,
+        device: torch.device,
+    ) -> torch.Tensor:
+        """Jacobian of a quantum tensor with respect to circuit parameters.
+
+        Uses the configured ``gradient`` method.
+
+        Returns:
+            Tensor of shape (len(wrt), *qtensor.shape).
+        """
+        if self._gradient != "adjoint":
+            return super().jacobian(qtensor, params, wrt, dtype, device)
+
+        if not self._simulate:
+            return torch.randn((len(wrt), *qtensor.shape), dtype=dtype, device=device)
+
+        qtensor_id = id(qtensor)
+        with self._cache_lock:
+            if qtensor_id not in self._adjoint_cache:
+                from qtpu.runtime.adjoint import AdjointDifferentiator
+
+                self._adjoint_cache[qtensor_id] = AdjointDifferentiator(qtensor)
+            differentiator = self._adjoint_cache[qtensor_id]
+
+        _, jac = differentiator.evaluate(params, wrt)
+        return torch.tensor(jac, dtype=dtype, device=device)
+
     def sample(
         self,
         qtensor: "QuantumTensor",
-        indices: list[tuple[int, ...]],
+        indices: list[tuple[int, ...]] | np.ndarray,
         params: dict[str, float],
         dtype: torch.dtype = torch.float64,
         device: torch.device | None = None,
+        cache: "ElementCache | None" = None,
     ) -> tuple[list[tuple[tuple[int, ...], float]], float, float]:
         """Sample specific indices from a quantum tensor.
         
         Args:
             qtensor: The quantum tensor to sample from.
-            indices: List of index tuples to sample.
+            indices: List of index tuples, or an (n, num_indices) integer
+                array, to sample.
             params: Parameter values for the circuit.
             dtype: Data type for results (used if not simulating).
             device: Device for results (used if not simulating).
+            cache: Evaluated elements of ``qtensor`` at ``params``. Only
+                indices missing from the cache are run, and their values
+                are added to it.
             
         Returns:
             Tuple of (samples, eval_time, estimated_qpu_time) where:
@@ -323,16 +636,23 @@ class CudaQBackend(QuantumBackend):
             - eval_time: Wall-clock execution time
             - estimated_qpu_time: Estimated QPU time for sampling these indices
         """
-        qtensor_id = id(qtensor)
-        
         self._ensure_target()
 
-        if qtensor_id not in self._compiled_cache:
-            compile_start = perf_counter()
-            self._compiled_cache[qtensor_id] = qtensor.compile(warmup=self._warmup)
-            self._compilation_times[qtensor_id] = perf_counter() - compile_start
-        
-        compiled = self._compiled_cache[qtensor_id]
+        if cache is not None:
+            index_array = np.asarray(indices, dtype=np.int64).reshape(-1, len(qtensor.shape))
+            requested = np.ravel_multi_index(tuple(index_array.T), qtensor.shape)
+            missing = cache.missing(np.unique(requested))
+            exec_time = estimated_qpu_time = 0.0
+            if len(missing) > 0:
+                new_indices = np.stack(np.unravel_index(missing, qtensor.shape), axis=1)
+                new_samples, exec_time, estimated_qpu_time = self.sample(
+                    qtensor, new_indices, params, dtype, device
+                )
+                cache.add_samples(new_samples)
+            samples = list(zip(map(tuple, index_array.tolist()), cache.lookup(requested).tolist()))
+            return samples, exec_time, estimated_qpu_time
+
+        compiled = self._get_compiled(qtensor)
         
         # Estimate QPU time for sampling (proportional to number of indices)
         estimated_qpu_time = self._estimate_qpu_time_for_sampling(qtensor, params, len(indices))
@@ -372,7 +692,7 @@ class CudaQBackend(QuantumBackend):
             _ = self._estimate_qpu_time_for_qtensor(qtensor, params)
         
         # Get total time for full tensor and compute per-circuit time
-        full_num_circuits = int(np.prod(qtensor.shape)) if qtensor.shape else 1
+        full_num_circuits = qtensor.size
         if qtensor_id in self._qpu_time_cache and full_num_circuits > 0:
             full_time = self._qpu_time_cache[qtensor_id]
             per_circuit_time = full_time / full_num_circuits
@@ -382,6 +702,9 @@ class CudaQBackend(QuantumBackend):
 
     def clear_cache(self):
         """Clear all caches."""
-        self._compiled_cache.clear()
-        self._compilation_times.clear()
-        self._qpu_time_cache.clear()
+        with self._cache_lock:
+            self._compiled_cache.clear()
+            self._compilation_times.clear()
+            self._fingerprints.clear()
+            self._qpu_time_cache.clear()
+            self._adjoint_cache.clear()
@@ -23,6 +23,8 @@ from qtpu.compiler.codegen import quantum_tensor_to_cudaq
 from qtpu.runtime.timing import TimingBreakdown
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from qiskit import QuantumCircuit
     from qtpu.core import HEinsum, QuantumTensor
 
@@ -120,21 +122,22 @@ def estimate_qpu_time(
     return single_time * len(circuits)
 
 
-def _expand_iswitch_circuits(qtensor: "QuantumTensor") -> list["QuantumCircuit"]:
+def _expand_iswitch_circuits(qtensor: "QuantumTensor") -> Iterator["QuantumCircuit"]:
     """Expand a QuantumTensor with ISwitches into individual circuits.
     
     For a QuantumTensor with shape (n1, n2, ...), this generates
     n1 * n2 * ... individual circuits, one for each index combination.
+    Circuits are generated lazily; ``qtensor.size`` gives their number.
     
     Args:
         qtensor: QuantumTensor potentially containing ISwitch instructions.
         
     Returns:
-        List of QuantumCircuits (decomposed), one per tensor element.
+        Iterator over QuantumCircuits (decomposed), one per tensor element.
     """
-    # flat() returns circuits with ISwitches bound to specific indices
+    # iter_circuits() yields circuits with ISwitches bound to specific indices
     # decompose() expands the ISwitches into actual gate sequences
-    return [circuit.decompose() for circuit in qtensor.flat()]
+    return (circuit.decompose() for circuit in qtensor.iter_circuits())
 
 
 def run_naive(
@@ -184,7 +187,7 @@ def run_naive(
     
     for qtensor in heinsum.quantum_tensors:
         circuits = _expand_iswitch_circuits(qtensor)
-        circuit_shapes.append((qtensor.shape, len(circuits)))
+        circuit_shapes.append((qtensor.shape, qtensor.size))
         
         # Process each circuit ONE BY ONE (naive pattern)
         for i, circuit in enumerate(circuits):
@@ -289,7 +292,7 @@ def run_batch(
     
     for qtensor in heinsum.quantum_tensors:
         circuits = _expand_iswitch_circuits(qtensor)
-        circuit_shapes.append((qtensor.shape, len(circuits)))
+        circuit_shapes.append((qtensor.shape, qtensor.size))
         
         for circuit in circuits:
             # Bind parameters if needed
@@ -344,6 +347,7 @@ def run_heinsum(
     input_tensors: list[torch.Tensor] | None = None,
     circuit_params: dict[str, float] | None = None,
     skip_execution: bool = True,
+    parametric_iswitches: bool = False,
 ) -> tuple[torch.Tensor, TimingBreakdown]:
     """Execute HEinsum using the optimized runtime.
     
@@ -359,6 +363,9 @@ def run_heinsum(
         skip_execution: If True, skip actual quantum simulation and return
             dummy results. This is useful for benchmarking compile time
             without the overhead of simulation for large circuits.
+        parametric_iswitches: Compile ISwitch variants that differ only in
+            angles to one gate sequence with angle tables (see
+            :class:`qtpu.runtime.CudaQBackend`).
             
     Returns:
         Tuple of (result_tensor, timing_breakdown)
@@ -371,6 +378,7 @@ def run_heinsum(
         target="qpp-cpu",
         simulate=not skip_execution,
         estimate_qpu_time=True,
+        parametric_iswitches=parametric_iswitches,
     )
     
     runtime = HEinsumRuntime(heinsum, backend=backend, dtype=torch.float64)
@@ -0,0 +1,95 @@
+"""Caches of evaluated quantum tensor elements.
+
+Approximate (Monte Carlo) contraction evaluates quantum tensors entry by
+entry. The same entries recur across samples, sampling rounds and repeated
+runs at the same parameters, so evaluated entries are kept in an
+:class:`ElementCache` and only previously unseen entries are run.
+:class:`ElementCacheStore` holds one cache per quantum tensor and parameter
+set, evicting the least recently used ones.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+
+import numpy as np
+
+
+class ElementCache:
+    """Evaluated entries of one quantum tensor at one parameter set.
+
+    Entries are stored as sorted flat (C order) indices with their values,
+    so a batch of entries can be looked up with one ``np.searchsorted``.
+
+    Args:
+        shape: Shape of the quantum tensor.
+    """
+
+    def __init__(self, shape: tuple[int, ...]):
+        self.shape = tuple(shape)
+        self.flat_indices = np.empty(0, dtype=np.int64)
+        self.values = np.empty(0, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.flat_indices)
+
+    def add(self, flat: np.ndarray, values: np.ndarray) -> None:
+        """Add entries that are not cached yet."""
+        if len(flat) == 0:
+            return
+        flat_indices = np.concatenate([self.flat_indices, np.asarray(flat, dtype=np.int64)])
+        values = np.concatenate([self.values, np.asarray(values, dtype=np.float64)])
+        order = np.argsort(flat_indices, kind="stable")
+        self.flat_indices = flat_indices[order]
+        self.values = values[order]
+
+    def add_samples(self, samples: list[tuple[tuple[int, ...], float]]) -> None:
+        """Add (index_tuple, value) pairs as returned by ``sample``."""
+        if not samples:
+            return
+        indices = np.asarray([idx for idx, _ in samples], dtype=np.int64).reshape(len(samples), -1)
+        values = np.asarray([val for _, val in samples], dtype=np.float64)
+        self.add(np.ravel_multi_index(tuple(indices.T), self.shape), values)
+
+    def missing(self, flat: np.ndarray) -> np.ndarray:
+        """The given flat indices whose entries are not cached."""
+        return flat[~np.isin(flat, self.flat_indices)]
+
+    def lookup(self, flat: np.ndarray) -> np.ndarray:
+        """Values at the given flat indices; entries not cached are 0."""
+        if len(self.flat_indices) == 0:
+            return np.zeros(np.shape(flat), dtype=np.float64)
+        pos = np.minimum(np.searchsorted(self.flat_indices, flat), len(self.flat_indices) - 1)
+        return np.where(self.flat_indices[pos] == flat, self.values[pos], 0.0)
+
+
+class ElementCacheStore:
+    """Least-recently-used store of element caches.
+
+    Args:
+        max_entries: Maximum number of element caches kept, e.g. the number
+            of quantum tensors times the number of parameter sets.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._caches: OrderedDict[Hashable, ElementCache] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._caches)
+
+    def get(self, key: Hashable, shape: tuple[int, ...]) -> ElementCache:
+        """Return the cache for ``key``, creating an empty one if needed."""
+        cache = self._caches.get(key)
+        if cache is None:
+            cache = self._caches[key] = ElementCache(shape)
+            while len(self._caches) > self.max_entries:
+                self._caches.popitem(last=False)
+        else:
+            self._caches.move_to_end(key)
+        return cache
+
+    def clear(self) -> None:
+        """Drop all cached elements."""
+        self._caches.clear()
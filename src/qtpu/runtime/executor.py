@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import itertools
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass
 from time import perf_counter
 from typing import TYPE_CHECKING, Callable
 
 import cotengra as ctg
+from cotengra.contract import extract_contractions, node_from_single
 import numpy as np
 import torch
 from torch.autograd import Function
@@ -15,9 +17,13 @@ from qtpu.runtime.backends import (
     QuantumBackend,
     CudaQBackend,
 )
+from qtpu.runtime.cache import ElementCache, ElementCacheStore
 from qtpu.runtime.device import get_device, Device
+from qtpu.runtime.parallel import FragmentExecutor
 from qtpu.runtime.timing import TimingBreakdown
 
+SAMPLING_METHODS = ("uniform", "importance")
+
 if TYPE_CHECKING:
     from qtpu.core import HEinsum, QuantumTensor
 
@@ -25,7 +31,13 @@ if TYPE_CHECKING:
 class _QuantumTensorFunction(Function):
     """PyTorch autograd function for differentiable quantum tensor evaluation.
 
-    Uses the parameter-shift rule for gradient computation.
+    Gradients come from :meth:`QuantumBackend.jacobian`: the parameter-shift
+    rule with all 2P shifted points in one batched call by default, or e.g.
+    adjoint differentiation for ``CudaQBackend(gradient="adjoint")``.
+
+    The forward pass takes the tensor's values if they were already
+    evaluated (e.g. concurrently with other fragments), else it evaluates
+    them with the backend.
     """
 
     @staticmethod
@@ -35,6 +47,8 @@ class _QuantumTensorFunction(Function):
         backend: QuantumBackend,
         dtype: torch.dtype,
         device: torch.device,
+        jacobian_cache: _JacobianCache | None,
+        result: torch.Tensor | None,
         param_names: tuple[str, ...],
         *param_values: torch.Tensor,
     ) -> torch.Tensor:
@@ -42,50 +56,211 @@ class _QuantumTensorFunction(Function):
         ctx.backend = backend
         ctx.dtype = dtype
         ctx.device = device
+        ctx.jacobian_cache = jacobian_cache
         ctx.param_names = param_names
         ctx.save_for_backward(*param_values)
 
-        params = {
-            name: float(val.detach().cpu())
-            for name, val in zip(param_names, param_values)
-        }
-
-        result, _, _ = backend.evaluate(qtensor, params, dtype, device)
+        if result is None:
+            params = {
+                name: float(val.detach().cpu())
+                for name, val in zip(param_names, param_values)
+            }
+            result, _, _ = backend.evaluate(qtensor, params, dtype, device)
         return result.clone()
 
     @staticmethod
     def backward(ctx, grad_output: torch.Tensor):
-        """Parameter-shift gradient: ∂f/∂θ = (1/2)[f(θ + π/2) - f(θ - π/2)]"""
+        """Vector-Jacobian product with the backend's Jacobian."""
         qtensor = ctx.qtensor
         backend = ctx.backend
-        dtype = ctx.dtype
-        device = ctx.device
+        jacobian_cache = ctx.jacobian_cache
         param_names = ctx.param_names
         param_values = ctx.saved_tensors
 
-        shift = np.pi / 2
-        grads = []
-
         base_params = {
             name: float(val.detach().cpu())
             for name, val in zip(param_names, param_values)
         }
 
-        for i, name in enumerate(param_names):
-            params_plus = base_params.copy()
-            params_plus[name] = base_params[name] + shift
-            result_plus, _, _ = backend.evaluate(qtensor, params_plus, dtype, device)
+        # Only differentiate parameters that need a gradient (inputs 7.. are the values)
+        active = [i for i in range(len(param_names)) if ctx.needs_input_grad[7 + i]]
+        grads: list[torch.Tensor | None] = [None] * len(param_names)
+        if not active:
+            return (None, None, None, None, None, None, None) + tuple(grads)
+
+        wrt = tuple(param_names[i] for i in active)
+        if jacobian_cache is not None:
+            jac = jacobian_cache.jacobian(qtensor, backend, base_params, wrt, ctx.dtype, ctx.device)
+        else:
+            jac = backend.jacobian(qtensor, base_params, wrt, ctx.dtype, ctx.device)
+
+        summed = (jac * grad_output.unsqueeze(0)).reshape(len(active), -1).sum(dim=1)
+        for k, i in enumerate(active):
+            grads[i] = summed[k].reshape(param_values[i].shape)
+
+        # None for: qtensor, backend, dtype, device, jacobian_cache, result, param_names
+        return (None, None, None, None, None, None, None) + tuple(grads)
 
-            params_minus = base_params.copy()
-            params_minus[name] = base_params[name] - shift
-            result_minus, _, _ = backend.evaluate(qtensor, params_minus, dtype, device)
 
-            param_grad = 0.5 * (result_plus - result_minus)
-            grad = (grad_output * param_grad).sum()
-            grads.append(grad.reshape(param_values[i].shape))
+class _JacobianCache:
+    """Jacobians shared between structurally identical quantum tensors.
 
-        # None for: qtensor, backend, dtype, device, param_names
-        return (None, None, None, None, None) + tuple(grads)
+    Quantum tensors with the same circuit fingerprint (e.g. repeated
+    fragments of a layered ansatz) that depend on the same parameters have
+    identical Jacobians, so each (fingerprint, parameter point) is
+    differentiated once per forward/backward cycle.
+    """
+
+    def __init__(self):
+        self._fingerprints: dict[int, str] = {}
+        self._results: dict[tuple, torch.Tensor] = {}
+
+    def _fingerprint(self, qtensor: "QuantumTensor") -> str:
+        key = id(qtensor)
+        if key not in self._fingerprints:
+            from qtpu.compiler.codegen import circuit_fingerprint
+
+            self._fingerprints[key] = circuit_fingerprint(qtensor.circuit, qtensor.shape)
+        return self._fingerprints[key]
+
+    def jacobian(
+        self,
+        qtensor: "QuantumTensor",
+        backend: QuantumBackend,
+        params: dict[str, float],
+        wrt: tuple[str, ...],
+        dtype: torch.dtype,
+        device: torch.device,
+    ) -> torch.Tensor:
+        """Return the cached Jacobian or compute it with ``backend.jacobian``."""
+        key = (self._fingerprint(qtensor), tuple(sorted(params.items())), wrt)
+        if key not in self._results:
+            self._results[key] = backend.jacobian(qtensor, params, wrt, dtype, device)
+        return self._results[key]
+
+    def clear(self) -> None:
+        """Drop cached results (fingerprints stay valid)."""
+        self._results.clear()
+
+
+def _free_param_names(qtensor: "QuantumTensor") -> frozenset[str]:
+    """Names of the circuit parameters a quantum tensor depends on.
+
+    Includes parameters inside ISwitch variants and excludes the ISwitch
+    index parameters.
+    """
+    names = {p.name for p in qtensor.circuit.parameters}
+    for instr in qtensor.circuit:
+        op = instr.operation
+        if op.name == "iswitch":
+            for i in range(op.size):
+                names.update(op.summary(i).parameter_names)
+    return frozenset(names - set(qtensor.inds))
+
+
+@dataclass
+class _TensorSamplePlan:
+    """Index bookkeeping of one einsum operand for approximate contraction.
+
+    Attributes:
+        shape: Shape of the operand.
+        outer_shape: Shape of its outer (not contracted away) dimensions.
+        inner_cols: Sample-matrix column of each inner dimension.
+        inner_strides: C-order strides of the inner dimensions.
+        outer_offsets: Flat offsets of all outer index combinations, in
+            C order over ``outer_shape``; empty for operands without inner
+            dimensions, which are never gathered.
+    """
+
+    shape: tuple[int, ...]
+    outer_shape: tuple[int, ...]
+    inner_cols: np.ndarray
+    inner_strides: np.ndarray
+    outer_offsets: np.ndarray
+
+    @property
+    def has_inner(self) -> bool:
+        """Whether the operand has inner dimensions."""
+        return len(self.inner_cols) > 0
+
+    def flat_indices(self, samples: np.ndarray) -> np.ndarray:
+        """(num_samples, outer_size) flat indices touched by each sample."""
+        base = samples[:, self.inner_cols] @ self.inner_strides
+        return base[:, None] + self.outer_offsets[None, :]
+
+    def gather(self, operand: np.ndarray | ElementCache, samples: np.ndarray) -> np.ndarray:
+        """(num_samples, *outer_shape) slices of ``operand`` at each sample."""
+        flat = self.flat_indices(samples)
+        if isinstance(operand, ElementCache):
+            values = operand.lookup(flat)
+        else:
+            values = np.ascontiguousarray(operand).reshape(-1)[flat]
+        return values.reshape((len(samples), *self.outer_shape))
+
+
+@dataclass
+class _SamplePlan:
+    """Precomputed plan of the approximate (Monte Carlo) contraction.
+
+    Attributes:
+        inner_indices: Sorted inner index chars (columns of the sample matrix).
+        inner_sizes: Size of each inner index.
+        inner_volume: Number of inner index combinations.
+        inner_proposals: Importance-sampling distribution of each inner
+            index, proportional to the product of the |coefficient|
+            marginals of the classical tensors carrying it (uniform for
+            indices that no classical tensor carries).
+        tensors: Per-operand plans, in einsum operand order.
+        sampled_expr: Einsum over the gathered operands, with a leading
+            sample axis on operands with inner indices and on the output.
+        output_shape: Shape of the contraction result.
+    """
+
+    inner_indices: list[str]
+    inner_sizes: list[int]
+    inner_volume: int
+    inner_proposals: list[np.ndarray]
+    tensors: list[_TensorSamplePlan]
+    sampled_expr: str
+    output_shape: tuple[int, ...]
+
+    def draw(self, num_samples: int, importance: bool = False) -> tuple[np.ndarray, np.ndarray]:
+        """Draw inner index assignments.
+
+        Args:
+            num_samples: Number of assignments to draw.
+            importance: Draw each inner index from ``inner_proposals``
+                instead of uniformly.
+
+        Returns:
+            Tuple of the (num_samples, num_inner) assignments and the
+            inverse sampling probability of each assignment.
+        """
+        if not importance:
+            samples = np.random.randint(
+                0, self.inner_sizes, size=(num_samples, len(self.inner_sizes))
+            )
+            return samples, np.full(num_samples, float(self.inner_volume))
+
+        columns = [np.random.choice(len(q), size=num_samples, p=q) for q in self.inner_proposals]
+        prob = np.ones(num_samples, dtype=np.float64)
+        for q, column in zip(self.inner_proposals, columns):
+            prob *= q[column]
+        return np.stack(columns, axis=1), 1.0 / prob
+
+
+def _estimator_variance(total: np.ndarray, sq_total: np.ndarray, n: int) -> np.ndarray:
+    """Variance of the mean of ``n`` samples from their sum and sum of squares."""
+    if n < 2:
+        return np.full(np.shape(total), np.inf)
+    sample_var = np.maximum(sq_total - total * total / n, 0.0) / (n - 1)
+    return sample_var / n
+
+
+def _as_stat(value: np.ndarray) -> float | np.ndarray:
+    """Scalar statistics as float, per-element statistics as arrays."""
+    value = np.asarray(value)
+    return float(value) if value.ndim == 0 else value
 
 
 class HEinsumRuntime:
@@ -103,6 +278,13 @@ class HEinsumRuntime:
         backend: Quantum backend - "simulator", "fake_qpu", or QuantumBackend instance.
         device: Device for classical computation (None = auto-select).
         dtype: Data type for tensors.
+        executor: How independent quantum tensors are evaluated: "serial"
+            (default), "thread", "process", "async", or a
+            ``concurrent.futures.Executor``. See :mod:`qtpu.runtime.parallel`.
+        max_workers: Number of workers for thread and process executors.
+        cache_shifts: If True, gradients (e.g. parameter-shift evaluations)
+            are shared between structurally identical quantum tensors
+            during backward.
 
     Example:
         >>> runtime = HEinsumRuntime(heinsum, backend="fake_qpu", device="cuda")
@@ -123,10 +305,18 @@ class HEinsumRuntime:
         backend: str | QuantumBackend = "cudaq",
         device: str | Device | torch.device | None = None,
         dtype: torch.dtype = torch.float64,
+        executor: str | Executor = "serial",
+        max_workers: int | None = None,
+        cache_shifts: bool = False,
     ):
         self.heinsum = heinsum
         self.dtype = dtype
         self.device = get_device(device)
+        self._executor_spec = executor
+        self._max_workers = max_workers
+        self._fragment_executor: FragmentExecutor | None = None
+        self._jacobian_cache = _JacobianCache() if cache_shifts else None
+        self._free_params: dict[int, frozenset[str]] = {}
 
         # Initialize quantum backend
         if isinstance(backend, str):
@@ -137,11 +327,16 @@ class HEinsumRuntime:
         # Compilation state
         self._tree: ctg.ContractionTree | None = None
         self._contract_fn: Callable | None = None
+        self._contractions: tuple | None = None
+        self._opt_kwargs: dict | None = None
+        self._batch_trees: dict[int, ctg.ContractionTree] = {}
+        self._sample_plan: _SamplePlan | None = None
         self._prepared = False
 
         # Caching
         self._quantum_cache: dict[int, torch.Tensor] = {}
         self._cache_enabled = False
+        self._element_caches = ElementCacheStore()
 
     def _create_backend(self, name: str) -> QuantumBackend:
         """Create a quantum backend by name."""
@@ -210,12 +405,17 @@ class HEinsumRuntime:
             if slicing_opts:
                 opt_kwargs["slicing_reconf_opts"] = slicing_opts
 
+            self._opt_kwargs = dict(opt_kwargs)
             opt = ctg.HyperOptimizer(**opt_kwargs)
             try:
                 self._tree = opt.search(inputs, output, self.heinsum.size_dict)
             except (KeyError, ValueError):
                 self._tree = None
         self._prep_timing.optimization_time = perf_counter() - opt_start
+        self._contractions = None
+        self._batch_trees.clear()
+        self._sample_plan = None  # built on the first execute_approximate()
+        self._element_caches.clear()
 
         # Build contraction function
         if self._tree is not None:
@@ -234,8 +434,18 @@ class HEinsumRuntime:
 
         # Prepare quantum backend (compiles circuits for CudaQ-based backends)
         backend_prep_start = perf_counter()
+        hits_before = getattr(self._backend, "kernel_cache_hits", 0)
         compile_time = self._backend.prepare(self.heinsum.quantum_tensors)
         self._prep_timing.circuit_compilation_time = compile_time
+        self._prep_timing.kernel_cache_hits = (
+            getattr(self._backend, "kernel_cache_hits", 0) - hits_before
+        )
+        self._prep_timing.fragment_compilation_times = [
+            self._backend.compilation_time(qtensor) for qtensor in self.heinsum.quantum_tensors
+        ]
+        self._prep_timing.num_unique_kernels = self._backend.num_unique_kernels(
+            self.heinsum.quantum_tensors
+        )
 
         self._prep_timing.total_time = perf_counter() - total_start
         self._prepared = True
@@ -289,8 +499,9 @@ class HEinsumRuntime:
         return self
 
     def clear_cache(self) -> "HEinsumRuntime":
-        """Clear the quantum tensor cache."""
+        """Clear the quantum tensor cache and the sampled element caches."""
         self._quantum_cache.clear()
+        self._element_caches.clear()
         self._cache_enabled = False
         return self
 
@@ -302,12 +513,19 @@ class HEinsumRuntime:
         self,
         input_tensors: list[torch.Tensor] | None = None,
         circuit_params: dict[str, torch.Tensor] | None = None,
+        streaming: bool = False,
     ) -> tuple[torch.Tensor, TimingBreakdown]:
         """Execute the hybrid einsum contraction.
 
         Args:
             input_tensors: Runtime input tensors.
             circuit_params: Circuit parameters (rotation angles, etc.).
+            streaming: If True, walk the contraction tree and perform each
+                pairwise contraction as soon as its operands are available,
+                overlapping classical work with the evaluation of the
+                remaining quantum tensors. Most useful with a non-serial
+                ``executor``. Falls back to the regular path for sliced or
+                tree-less contractions and when gradients are required.
 
         Returns:
             Tuple of:
@@ -325,13 +543,22 @@ class HEinsumRuntime:
             backend=self._backend.name,
         )
 
+        if streaming and self._can_stream(circuit_params):
+            result = self._execute_streaming(input_tensors, circuit_params, timing)
+            return result, timing
+
         total_start = perf_counter()
 
         # Evaluate quantum tensors
-        quantum_results, q_eval_time, q_qpu_time, n_circuits = self._eval_quantum(
-            circuit_params
-        )
+        (
+            quantum_results,
+            q_eval_time,
+            q_qpu_time,
+            n_circuits,
+            q_critical_path_time,
+        ) = self._eval_quantum(circuit_params)
         timing.quantum_eval_time = q_eval_time
+        timing.quantum_critical_path_time = q_critical_path_time
         timing.quantum_estimated_qpu_time = q_qpu_time
         timing.num_circuits = n_circuits
 
@@ -360,14 +587,285 @@ class HEinsumRuntime:
 
         return result, timing
 
+    def execute_batch(
+        self,
+        circuit_params: list[dict[str, float | torch.Tensor]],
+        input_tensors: list[torch.Tensor] | None = None,
+    ) -> tuple[torch.Tensor, TimingBreakdown]:
+        """Execute the hybrid einsum for many circuit parameter points at once.
+
+        Every quantum tensor gets a leading batch axis and is evaluated for
+        all parameter points in one backend call (a single CUDA-Q broadcast
+        per quantum tensor). The batched operands are then contracted in a
+        single pass, with the batch axis kept as an output index.
+
+        The result is not differentiable with respect to the circuit
+        parameters; use :meth:`execute` for gradients.
+
+        Args:
+            circuit_params: One dict of circuit parameters per batch element.
+            input_tensors: Runtime input tensors, shared by all batch elements.
+
+        Returns:
+            Tuple of:
+            - result: Tensor of shape (len(circuit_params), *output_shape)
+            - timing: Timing breakdown for the whole batch
+
+        Example:
+            >>> thetas = torch.linspace(0, np.pi, 256)
+            >>> results, timing = runtime.execute_batch(
+            ...     [{"theta": t} for t in thetas]
+            ... )
+        """
+        if not self._prepared:
+            self.prepare()
+
+        input_tensors = input_tensors or []
+        batch_size = len(circuit_params)
+        if batch_size == 0:
+            raise ValueError("circuit_params must contain at least one parameter set")
+
+        timing = TimingBreakdown(
+            device=str(self.device),
+            backend=self._backend.name,
+        )
+        total_start = perf_counter()
+
+        params_list = [
+            {
+                k: float(v.detach().cpu()) if isinstance(v, torch.Tensor) else float(v)
+                for k, v in params.items()
+            }
+            for params in circuit_params
+        ]
+
+        # Evaluate quantum tensors, one batched call per tensor
+        quantum_results: list[torch.Tensor | None] = [None] * len(self.heinsum.quantum_tensors)
+        futures: dict[int, Future] = {}
+        for i, qtensor in enumerate(self.heinsum.quantum_tensors):
+            if self._cache_enabled and i in self._quantum_cache:
+                cached = self._quantum_cache[i]
+                quantum_results[i] = cached.expand(batch_size, *cached.shape)
+                continue
+
+            timing.num_circuits += batch_size * qtensor.size
+            futures[i] = self._get_fragment_executor().submit_batch(
+                i, params_list, self.dtype, self.device
+            )
+
+        for i, future in futures.items():
+            result, eval_time, qpu_time, wall_time = future.result()
+            quantum_results[i] = result.to(dtype=self.dtype, device=self.device)
+            timing.quantum_eval_time += eval_time
+            timing.quantum_estimated_qpu_time += qpu_time
+            timing.quantum_critical_path_time = max(
+                timing.quantum_critical_path_time, wall_time
+            )
+
+        # Prepare classical tensors
+        transfer_start = perf_counter()
+        classical_tensors = [
+            ct.data.to(dtype=self.dtype, device=self.device)
+            for ct in self.heinsum.classical_tensors
+        ]
+        input_tensors = [
+            t.to(dtype=self.dtype, device=self.device) for t in input_tensors
+        ]
+        timing.data_transfer_time = perf_counter() - transfer_start
+
+        # Contract all batch elements in one pass
+        operands = quantum_results + classical_tensors + input_tensors
+
+        contract_start = perf_counter()
+        if not self.heinsum.quantum_tensors:
+            # Nothing depends on the circuit parameters
+            result = self._contract_fn(operands)
+            result = result.expand(batch_size, *result.shape)
+        else:
+            result = self._contract_batched(operands, batch_size)
+        timing.classical_contraction_time = perf_counter() - contract_start
+
+        timing.total_time = perf_counter() - total_start
+
+        return result, timing
+
+    def _batched_expr(self) -> tuple[list[str], str, str]:
+        """Einsum inputs and output with a batch index on the quantum tensors.
+
+        Returns:
+            Tuple of (inputs, output, batch_index).
+        """
+        batch_index = self._unused_symbol()
+
+        inputs, output = ctg.utils.eq_to_inputs_output(self.heinsum.einsum_expr)
+        num_quantum = len(self.heinsum.quantum_tensors)
+        inputs = [
+            batch_index + "".join(term) if pos < num_quantum else "".join(term)
+            for pos, term in enumerate(inputs)
+        ]
+        return inputs, batch_index + "".join(output), batch_index
+
+    def _contract_batched(self, operands: list[torch.Tensor], batch_size: int) -> torch.Tensor:
+        """Contract operands whose quantum tensors carry a leading batch axis."""
+        inputs, output, batch_index = self._batched_expr()
+
+        if self._tree is None:
+            return torch.einsum(f"{','.join(inputs)}->{output}", *operands)
+
+        # The batch size changes the optimal path, so trees are cached per size
+        tree = self._batch_trees.get(batch_size)
+        if tree is None:
+            size_dict = dict(self.heinsum.size_dict)
+            size_dict[batch_index] = batch_size
+            opt = ctg.HyperOptimizer(**(self._opt_kwargs or {"on_trial_error": "ignore"}))
+            tree = opt.search(inputs, output, size_dict)
+            self._batch_trees[batch_size] = tree
+
+        return tree.contract(operands, backend="torch")
+
+    def _can_stream(self, circuit_params: dict[str, torch.Tensor]) -> bool:
+        """Whether the streaming execution path applies."""
+        if self._tree is None or self._tree.nslices > 1:
+            return False
+        return not any(
+            isinstance(v, torch.Tensor) and v.requires_grad
+            for v in circuit_params.values()
+        )
+
+    def _execute_streaming(
+        self,
+        input_tensors: list[torch.Tensor],
+        circuit_params: dict[str, torch.Tensor],
+        timing: TimingBreakdown,
+    ) -> torch.Tensor:
+        """Contract the tree step by step as quantum operands arrive."""
+        total_start = perf_counter()
+
+        if self._contractions is None:
+            self._contractions = extract_contractions(self._tree)
+
+        float_params = {
+            k: float(v.detach().cpu()) if isinstance(v, torch.Tensor) else float(v)
+            for k, v in circuit_params.items()
+        }
+
+        # Submit all quantum tensors first so they run while we contract.
+        qtensors = self.heinsum.quantum_tensors
+        futures: dict[Future, int] = {}
+        ready: dict[int, torch.Tensor] = {}
+        for i, qtensor in enumerate(qtensors):
+            if self._cache_enabled and i in self._quantum_cache:
+                ready[i] = self._quantum_cache[i]
+            else:
+                timing.num_circuits += qtensor.size
+                future = self._get_fragment_executor().submit(
+                    i, float_params, self.dtype, self.device
+                )
+                futures[future] = i
+
+        transfer_start = perf_counter()
+        offset = len(qtensors)
+        for j, ct in enumerate(self.heinsum.classical_tensors):
+            ready[offset + j] = ct.data.to(dtype=self.dtype, device=self.device)
+        offset += len(self.heinsum.classical_tensors)
+        for j, t in enumerate(input_tensors):
+            ready[offset + j] = t.to(dtype=self.dtype, device=self.device)
+        timing.data_transfer_time = perf_counter() - transfer_start
+
+        # Single-term simplifications apply to leaves, pairwise steps are
+        # indexed by their children so each can fire once both are present.
+        preprocessing: dict[frozenset, str] = {}
+        step_of: dict[frozenset, tuple] = {}
+        for step in self._contractions:
+            p, l, r = step[:3]
+            if l is None and r is None:
+                preprocessing[p] = step[4]
+            else:
+                step_of[l] = step
+                step_of[r] = step
+
+        temps: dict[frozenset, torch.Tensor] = {}
+        result = None
+        contraction_time = 0.0
+        overlap_time = 0.0
+
+        def add_node(node: frozenset, array: torch.Tensor) -> None:
+            nonlocal result, contraction_time, overlap_time
+
+            stack = [(node, array)]
+            while stack:
+                node, array = stack.pop()
+                step = step_of.get(node)
+                if step is None:
+                    result = array  # root of the tree
+                    continue
+                p, l, r, tdot, arg, perm = step
+                sibling = r if node == l else l
+                if sibling not in temps:
+                    temps[node] = array
+                    continue
+
+                start = perf_counter()
+                l_array = array if node == l else temps.pop(l)
+                r_array = array if node == r else temps.pop(r)
+                if tdot:
+                    p_array = torch.tensordot(l_array, r_array, dims=arg)
+                    if perm:
+                        p_array = p_array.permute(perm)
+                else:
+                    p_array = torch.einsum(arg, l_array, r_array)
+                elapsed = perf_counter() - start
+                contraction_time += elapsed
+                if any(not f.done() for f in pending):
+                    overlap_time += elapsed
+                stack.append((p, p_array))
+
+        def add_leaf(i: int, array: torch.Tensor) -> None:
+            nonlocal contraction_time
+
+            leaf = node_from_single(i)
+            if leaf in preprocessing:
+                start = perf_counter()
+                array = torch.einsum(preprocessing[leaf], array)
+                contraction_time += perf_counter() - start
+            add_node(leaf, array)
+
+        pending = set(futures)
+        for i, array in ready.items():
+            add_leaf(i, array)
+
+        critical_path_time = 0.0
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                array, eval_time, qpu_time, wall_time = future.result()
+                timing.quantum_eval_time += eval_time
+                timing.quantum_estimated_qpu_time += qpu_time
+                critical_path_time = max(critical_path_time, wall_time)
+                add_leaf(futures[future], array.to(dtype=self.dtype, device=self.device))
+
+        timing.quantum_critical_path_time = critical_path_time
+        timing.classical_contraction_time = contraction_time
+        timing.quantum_classical_overlap_time = overlap_time
+        timing.total_time = perf_counter() - total_start
+        return result
+
     def _eval_quantum(
         self,
         params: dict[str, torch.Tensor],
-    ) -> tuple[list[torch.Tensor], float, float, int]:
+    ) -> tuple[list[torch.Tensor], float, float, int, float]:
         """Evaluate all quantum tensors.
 
+        All uncached fragments are evaluated concurrently by the fragment
+        executor. Fragments depending on parameters that require a gradient
+        are then wrapped in the autograd function, which only runs the
+        backend again for the backward pass.
+
         Returns:
-            Tuple of (results, eval_time, estimated_qpu_time, num_circuits)
+            Tuple of (results, eval_time, estimated_qpu_time, num_circuits,
+            critical_path_time), where the critical path is the slowest single
+            fragment - the lower bound on quantum wall time.
         """
         requires_grad = (
             any(
@@ -382,41 +880,80 @@ class HEinsumRuntime:
             for k, v in params.items()
         }
 
-        results = []
+        results: list[torch.Tensor | None] = [None] * len(self.heinsum.quantum_tensors)
+        futures: dict[int, Future] = {}
         total_eval_time = 0.0
         total_qpu_time = 0.0
         total_circuits = 0
 
+        if requires_grad and self._jacobian_cache is not None:
+            self._jacobian_cache.clear()
+
         for i, qtensor in enumerate(self.heinsum.quantum_tensors):
             if self._cache_enabled and i in self._quantum_cache:
-                results.append(self._quantum_cache[i])
+                results[i] = self._quantum_cache[i]
                 continue
 
+            total_circuits += qtensor.size
+            futures[i] = self._get_fragment_executor().submit(
+                i, float_params, self.dtype, self.device
+            )
+
+        critical_path_time = 0.0
+        for i, future in futures.items():
+            result, eval_time, qpu_time, wall_time = future.result()
+            result = result.to(dtype=self.dtype, device=self.device)
+            total_eval_time += eval_time
+            total_qpu_time += qpu_time
+            critical_path_time = max(critical_path_time, wall_time)
+
+            # Only parameters the tensor depends on are shifted during backward
+            param_names = ()
             if requires_grad:
+                qtensor = self.heinsum.quantum_tensors[i]
+                if i not in self._free_params:
+                    self._free_params[i] = _free_param_names(qtensor)
+                param_names = tuple(
+                    sorted(name for name in params if name in self._free_params[i])
+                )
+
+            if param_names:
                 # Use autograd function
-                param_names = tuple(sorted(params.keys()))
-                param_values = [params[name] for name in param_names]
+                param_values = [
+                    params[name] if isinstance(params[name], torch.Tensor)
+                    else torch.tensor(params[name], dtype=self.dtype)
+                    for name in param_names
+                ]
                 result = _QuantumTensorFunction.apply(
                     qtensor,
                     self._backend,
                     self.dtype,
                     self.device,
+                    self._jacobian_cache,
+                    result,
                     param_names,
                     *param_values,
                 )
-                results.append(result)
-                total_circuits += int(np.prod(qtensor.shape)) if qtensor.shape else 1
-            else:
-                # Backend.evaluate returns (result, eval_time, qpu_time)
-                result, eval_time, qpu_time = self._backend.evaluate(
-                    qtensor, float_params, self.dtype, self.device
-                )
-                results.append(result)
-                total_eval_time += eval_time
-                total_qpu_time += qpu_time
-                total_circuits += int(np.prod(qtensor.shape)) if qtensor.shape else 1
+            results[i] = result
+
+        return results, total_eval_time, total_qpu_time, total_circuits, critical_path_time
+
+    def _get_fragment_executor(self) -> FragmentExecutor:
+        """Create the fragment executor on first use."""
+        if self._fragment_executor is None:
+            self._fragment_executor = FragmentExecutor(
+                self._executor_spec,
+                self._backend,
+                self.heinsum.quantum_tensors,
+                max_workers=self._max_workers,
+            )
+        return self._fragment_executor
 
-        return results, total_eval_time, total_qpu_time, total_circuits
+    def close(self) -> None:
+        """Shut down worker pools owned by this runtime."""
+        if self._fragment_executor is not None:
+            self._fragment_executor.shutdown()
+            self._fragment_executor = None
 
     def _contract_sliced(self, operands: list[torch.Tensor]) -> torch.Tensor:
         """Contract with slicing for large tensor networks."""
@@ -440,6 +977,9 @@ class HEinsumRuntime:
         input_tensors: list[torch.Tensor] | None = None,
         circuit_params: dict[str, torch.Tensor] | None = None,
         seed: int | None = None,
+        sampling: str = "uniform",
+        target_std_error: float | None = None,
+        max_samples: int | None = None,
     ) -> tuple[torch.Tensor, TimingBreakdown, dict]:
         """Execute approximate tensor network contraction via Monte Carlo sampling.
 
@@ -457,11 +997,35 @@ class HEinsumRuntime:
         This is useful for large tensor networks where exact contraction is
         infeasible. The error decreases as O(1/sqrt(num_samples)).
 
+        With ``sampling="importance"``, each inner index is drawn
+        proportionally to the |coefficient| marginals of the classical
+        tensors (e.g. QPD coefficients) that carry it, and every sample is
+        reweighted by its inverse sampling probability. The estimator stays
+        unbiased, and samples concentrate on the assignments with large
+        coefficients, which usually dominate the result.
+
+        With ``target_std_error``, samples are drawn in rounds of
+        ``num_samples`` until the standard error of every output element is
+        at most the target, or ``max_samples`` samples were drawn. Quantum
+        tensor entries evaluated in earlier rounds are reused, so later
+        rounds only run circuits for entries that were not sampled before.
+
+        Evaluated entries are also kept across calls, per quantum tensor and
+        parameter set, so repeated approximate runs at the same parameters
+        only evaluate entries that no earlier run sampled. The element
+        caches are dropped by :meth:`prepare` and :meth:`clear_cache`.
+
         Args:
-            num_samples: Number of Monte Carlo samples to take.
+            num_samples: Number of Monte Carlo samples to take (per round
+                if ``target_std_error`` is given).
             input_tensors: Runtime input tensors (must have no inner indices).
             circuit_params: Circuit parameters (rotation angles, etc.).
             seed: Random seed for reproducibility.
+            sampling: "uniform" or "importance" (see above).
+            target_std_error: Standard error at which to stop drawing
+                samples. None takes exactly ``num_samples`` samples.
+            max_samples: Sample budget with ``target_std_error``. Defaults to
+                100 rounds.
 
         Returns:
             Tuple of:
@@ -471,8 +1035,17 @@ class HEinsumRuntime:
                 - "inner_indices": List of inner index names
                 - "inner_volume": Total number of inner index combinations
                 - "num_samples": Number of samples used
+                - "num_rounds": Number of sampling rounds
+                - "num_circuits": Number of circuits evaluated
+                - "converged": Whether ``target_std_error`` was reached
+                  (None without a target)
                 - "samples": List of sampled index assignments
-                - "values": List of (sample_contribution, weight) for each sample
+                - "values": List of (sample_contribution, weight) for each
+                  sample, where weight is the inverse sampling probability
+                  relative to uniform sampling
+                - "variance": Variance of the estimator (per output element)
+                - "std_error": Standard error of the estimator (per output
+                  element)
 
         Example:
             >>> runtime = HEinsumRuntime(heinsum, backend="cudaq")
@@ -484,6 +1057,20 @@ class HEinsumRuntime:
             ... )
             >>> print(f"Inner volume: {stats['inner_volume']}, Samples: {stats['num_samples']}")
         """
+        if sampling not in SAMPLING_METHODS:
+            raise ValueError(
+                f"Unknown sampling method: {sampling!r}. Expected one of {SAMPLING_METHODS}."
+            )
+        if num_samples < 1:
+            raise ValueError(f"num_samples must be positive, got {num_samples}")
+        if target_std_error is not None and target_std_error <= 0:
+            raise ValueError(f"target_std_error must be positive, got {target_std_error}")
+        if max_samples is not None and max_samples < 1:
+            raise ValueError(f"max_samples must be positive, got {max_samples}")
+        if target_std_error is None:
+            max_samples = num_samples
+        elif max_samples is None:
+            max_samples = 100 * num_samples
         if not self._prepared:
             self.prepare()
 
@@ -503,17 +1090,20 @@ class HEinsumRuntime:
             for k, v in circuit_params.items()
         }
 
-        # Parse einsum expression to find inner indices
-        inner_info = self._get_inner_index_info()
-        inner_indices = inner_info["inner_indices"]
-        inner_sizes = inner_info["inner_sizes"]
-        inner_volume = inner_info["inner_volume"]
-        tensor_inner_inds = inner_info["tensor_inner_inds"]
+        if self._sample_plan is None:
+            self._sample_plan = self._build_sample_plan()
+        plan = self._sample_plan
+        inner_indices = plan.inner_indices
+        inner_volume = plan.inner_volume
 
         stats = {
             "inner_indices": list(inner_indices),
             "inner_volume": inner_volume,
-            "num_samples": num_samples,
+            "num_samples": 0,
+            "num_rounds": 0,
+            "num_circuits": 0,
+            "converged": None,
+            "sampling": sampling,
             "samples": [],
             "values": [],
         }
@@ -521,70 +1111,15 @@ class HEinsumRuntime:
         # If no inner indices, fall back to exact contraction
         if not inner_indices:
             result, timing = self.execute(input_tensors, circuit_params)
+            stats["num_circuits"] = timing.num_circuits
+            stats["variance"] = stats["std_error"] = 0.0
             return result, timing, stats
 
         # Sample inner index assignments
         if seed is not None:
             np.random.seed(seed)
 
-        sampling_start = perf_counter()
-
-        # Generate random samples from the inner index space
-        inner_ind_list = list(inner_indices)
-        inner_dims = [inner_sizes[ind] for ind in inner_ind_list]
-
-        # Sample indices
-        sampled_inner_assignments = []
-        for _ in range(num_samples):
-            assignment = tuple(np.random.randint(0, dim) for dim in inner_dims)
-            sampled_inner_assignments.append(assignment)
-
-        stats["samples"] = sampled_inner_assignments
-        timing.data_transfer_time = perf_counter() - sampling_start
-
-        # For each quantum tensor, determine which indices need to be sampled
-        quantum_eval_start = perf_counter()
-
-        # Build index mappings for each tensor
-        qtensor_samples_map = self._build_tensor_sample_indices(
-            self.heinsum.quantum_tensors,
-            tensor_inner_inds,
-            inner_ind_list,
-            sampled_inner_assignments,
-        )
-
-        # Sample quantum tensors
-        quantum_sample_results = []
-        total_circuits = 0
-        total_qpu_time = 0.0
-        total_eval_time = 0.0
-        for i, qtensor in enumerate(self.heinsum.quantum_tensors):
-            if i in qtensor_samples_map and qtensor_samples_map[i]:
-                indices_to_sample = qtensor_samples_map[i]
-                samples, eval_time, qpu_time = self._backend.sample(
-                    qtensor, indices_to_sample, float_params, self.dtype, self.device
-                )
-                # Convert to dict for fast lookup
-                sample_dict = {idx: val for idx, val in samples}
-                quantum_sample_results.append(sample_dict)
-                total_circuits += len(indices_to_sample)
-                total_eval_time += eval_time
-                total_qpu_time += qpu_time
-            else:
-                # No inner indices for this tensor - evaluate fully
-                result, eval_time, qpu_time = self._backend.evaluate(
-                    qtensor, float_params, self.dtype, self.device
-                )
-                quantum_sample_results.append(result.numpy())
-                total_circuits += int(np.prod(qtensor.shape)) if qtensor.shape else 1
-                total_eval_time += eval_time
-                total_qpu_time += qpu_time
-
-        timing.quantum_eval_time = total_eval_time
-        timing.quantum_estimated_qpu_time = total_qpu_time
-        timing.num_circuits = total_circuits
-
-        # Prepare classical tensors (full tensors)
+        # Classical operands are fixed across rounds
         transfer_start = perf_counter()
         classical_tensors = [
             ct.data.to(dtype=self.dtype, device=self.device).numpy()
@@ -595,335 +1130,259 @@ class HEinsumRuntime:
         ]
         timing.data_transfer_time += perf_counter() - transfer_start
 
-        # Perform Monte Carlo contraction
-        contract_start = perf_counter()
-        result = self._monte_carlo_contract(
-            sampled_inner_assignments,
-            inner_ind_list,
-            inner_volume,
-            quantum_sample_results,
-            classical_tensors,
-            input_arrays,
-            tensor_inner_inds,
-            stats,
-        )
-        timing.classical_contraction_time = perf_counter() - contract_start
+        # Quantum tensors with inner indices are sampled entry by entry into
+        # element caches that persist across rounds and calls; the others
+        # are evaluated fully, once
+        quantum_operands = []
+        for i, (tensor_plan, qtensor) in enumerate(
+            zip(plan.tensors, self.heinsum.quantum_tensors)
+        ):
+            if tensor_plan.has_inner:
+                # Keyed by the parameters the tensor depends on only
+                if i not in self._free_params:
+                    self._free_params[i] = _free_param_names(qtensor)
+                key = (i, tuple(sorted(
+                    (name, value) for name, value in float_params.items()
+                    if name in self._free_params[i]
+                )))
+                quantum_operands.append(self._element_caches.get(key, qtensor.shape))
+                continue
+            result, eval_time, qpu_time = self._backend.evaluate(
+                qtensor, float_params, self.dtype, self.device
+            )
+            quantum_operands.append(result.numpy())
+            timing.num_circuits += qtensor.size
+            timing.quantum_eval_time += eval_time
+            timing.quantum_estimated_qpu_time += qpu_time
+
+        weighted_sum = np.zeros(plan.output_shape, dtype=np.float64)
+        weighted_sq_sum = np.zeros(plan.output_shape, dtype=np.float64)
+        total_samples = 0
+        while total_samples < max_samples:
+            round_size = min(num_samples, max_samples - total_samples)
+
+            # Sample indices: one row per sample, one column per inner index
+            sampling_start = perf_counter()
+            sampled_inner, sample_weights = plan.draw(
+                round_size, importance=sampling == "importance"
+            )
+            stats["samples"].extend(map(tuple, sampled_inner.tolist()))
+            timing.data_transfer_time += perf_counter() - sampling_start
+
+            self._sample_quantum_entries(plan, sampled_inner, quantum_operands, float_params, timing)
+
+            # Perform Monte Carlo contraction
+            contract_start = perf_counter()
+            round_sum, round_sq_sum, sample_values = self._monte_carlo_contract(
+                plan,
+                sampled_inner,
+                sample_weights,
+                quantum_operands + classical_tensors + input_arrays,
+            )
+            weighted_sum += round_sum
+            weighted_sq_sum += round_sq_sum
+            total_samples += round_size
+            variance = _estimator_variance(weighted_sum, weighted_sq_sum, total_samples)
+            timing.classical_contraction_time += perf_counter() - contract_start
+
+            relative_weights = sample_weights / inner_volume
+            stats["values"].extend(zip(sample_values.tolist(), relative_weights.tolist()))
+            stats["num_rounds"] += 1
+
+            if target_std_error is not None and np.sqrt(variance.max()) <= target_std_error:
+                stats["converged"] = True
+                break
+        else:
+            if target_std_error is not None:
+                stats["converged"] = False
+
+        stats["num_samples"] = total_samples
+        stats["num_circuits"] = timing.num_circuits
+        stats["variance"] = _as_stat(variance)
+        stats["std_error"] = _as_stat(np.sqrt(variance))
 
         # Convert result to torch tensor
-        result = torch.tensor(result, dtype=self.dtype, device=self.device)
+        result = torch.tensor(weighted_sum / total_samples, dtype=self.dtype, device=self.device)
 
         timing.total_time = perf_counter() - total_start
 
         return result, timing, stats
 
-    def _get_inner_index_info(self) -> dict:
-        """Extract information about inner (contracted) indices.
-
-        Returns:
-            Dictionary with:
-            - inner_indices: set of inner index names (char form)
-            - inner_sizes: dict mapping inner index char to size
-            - inner_volume: total product of inner index sizes
-            - tensor_inner_inds: list of (tensor_idx, inner_ind_positions) tuples
-        """
-        inputs, output = ctg.utils.eq_to_inputs_output(self.heinsum.einsum_expr)
-
-        # All indices appearing in inputs
-        all_inds = set()
-        for inp in inputs:
-            all_inds.update(inp)
-
-        # Inner indices = all - output
-        output_inds = set(output)
-        inner_indices = all_inds - output_inds
-
-        # Get sizes for inner indices
-        inner_sizes = {ind: self.heinsum.size_dict[ind] for ind in inner_indices}
-        inner_volume = 1
-        for size in inner_sizes.values():
-            inner_volume *= size
-
-        # For each tensor, find which positions correspond to inner indices
-        all_tensors = (
-            list(self.heinsum.quantum_tensors)
-            + list(self.heinsum.classical_tensors)
-            + list(self.heinsum.input_tensors)
-        )
-
-        tensor_inner_inds = []
-        for i, inp in enumerate(inputs):
-            positions = {}
-            for pos, ind in enumerate(inp):
-                if ind in inner_indices:
-                    positions[ind] = pos
-            tensor_inner_inds.append(positions)
-
-        return {
-            "inner_indices": inner_indices,
-            "inner_sizes": inner_sizes,
-            "inner_volume": inner_volume,
-            "tensor_inner_inds": tensor_inner_inds,
-        }
-
-    def _build_tensor_sample_indices(
+    def _sample_quantum_entries(
         self,
-        tensors: list,
-        tensor_inner_inds: list[dict],
-        inner_ind_list: list[str],
-        sampled_assignments: list[tuple],
-    ) -> dict[int, list[tuple]]:
-        """Build the set of tensor indices to sample for each quantum tensor.
-
-        For each quantum tensor with inner indices, we need to know which
-        full tensor indices to sample. This maps the inner index assignments
-        to the appropriate tensor indices.
-
-        Args:
-            tensors: List of tensors (quantum tensors).
-            tensor_inner_inds: For each tensor position in einsum, dict mapping
-                inner index char to position in tensor.
-            inner_ind_list: Ordered list of inner index names.
-            sampled_assignments: List of sampled inner index assignments.
-
-        Returns:
-            Dict mapping tensor index to list of tensor indices to sample.
+        plan: _SamplePlan,
+        sampled_inner: np.ndarray,
+        quantum_operands: list,
+        params: dict[str, float],
+        timing: TimingBreakdown,
+    ) -> None:
+        """Evaluate the quantum tensor entries touched by new samples.
+
+        The backend only runs entries missing from the ElementCache
+        operands and adds them to the caches in place.
         """
-        result = {}
-        n_quantum = len(tensors)
-
-        for tensor_idx in range(n_quantum):
-            inner_pos_map = tensor_inner_inds[tensor_idx]
-
-            if not inner_pos_map:
-                # No inner indices for this tensor
+        for tensor_plan, qtensor, operand in zip(
+            plan.tensors, self.heinsum.quantum_tensors, quantum_operands
+        ):
+            if not tensor_plan.has_inner:
                 continue
+            # Unique flat indices of all entries touched by any sample
+            flat = operand.missing(np.unique(tensor_plan.flat_indices(sampled_inner)))
+            if len(flat) == 0:
+                continue
+            indices_to_sample = np.stack(np.unravel_index(flat, qtensor.shape), axis=1)
+            num_cached = len(operand)
+            _, eval_time, qpu_time = self._backend.sample(
+                qtensor, indices_to_sample, params, self.dtype, self.device, cache=operand
+            )
+            timing.num_circuits += len(operand) - num_cached
+            timing.quantum_eval_time += eval_time
+            timing.quantum_estimated_qpu_time += qpu_time
+
+    def _build_sample_plan(self) -> _SamplePlan:
+        """Precompute the index bookkeeping of approximate contraction.
+
+        Inner indices are the contracted ones (not in the output), in sorted
+        order; they define the columns of the sample matrix. For every
+        einsum operand, the plan stores the strides of its inner dimensions
+        and the flat offsets of all combinations of its outer dimensions, so
+        the flat indices touched by any number of samples follow from a
+        single matrix product and broadcast add. Operands without inner
+        dimensions are used whole and get no offsets.
+        """
+        inputs, output = ctg.utils.eq_to_inputs_output(self.heinsum.einsum_expr)
+        size_dict = self.heinsum.size_dict
 
-            tensor = tensors[tensor_idx]
-            tensor_shape = tensor.shape
-            n_dims = len(tensor_shape)
-
-            # For each sample, build the full tensor index
-            # We need to enumerate over outer indices of this tensor
-            indices_to_sample = set()
-
-            for assignment in sampled_assignments:
-                # Build assignment dict: inner_ind -> value
-                assign_dict = {
-                    inner_ind_list[i]: assignment[i] for i in range(len(inner_ind_list))
-                }
-
-                # Get the tensor's einsum indices (from parsed expression)
-                inputs, _ = ctg.utils.eq_to_inputs_output(self.heinsum.einsum_expr)
-                tensor_inds = inputs[tensor_idx]
-
-                # Build the partial index (just inner indices known)
-                # For outer indices of this tensor, we need all combinations
-                outer_positions = []
-                outer_sizes = []
-                inner_values = [None] * n_dims
-
-                for pos, ind in enumerate(tensor_inds):
-                    if ind in assign_dict:
-                        inner_values[pos] = assign_dict[ind]
-                    else:
-                        outer_positions.append(pos)
-                        outer_sizes.append(tensor_shape[pos])
-
-                # Generate all combinations of outer indices
-                if outer_positions:
-                    for outer_vals in itertools.product(
-                        *[range(s) for s in outer_sizes]
-                    ):
-                        full_idx = list(inner_values)
-                        for i, pos in enumerate(outer_positions):
-                            full_idx[pos] = outer_vals[i]
-                        indices_to_sample.add(tuple(full_idx))
-                else:
-                    indices_to_sample.add(tuple(inner_values))
-
-            result[tensor_idx] = list(indices_to_sample)
+        output_inds = set(output)
+        inner_indices = sorted({c for inp in inputs for c in inp} - output_inds)
+        inner_col = {ind: col for col, ind in enumerate(inner_indices)}
+        inner_sizes = [size_dict[ind] for ind in inner_indices]
 
-        return result
+        sample_ind = self._unused_symbol()
+        tensors = []
+        terms = []
+        for inp in inputs:
+            shape = tuple(size_dict[c] for c in inp)
+            strides = np.array(
+                [int(np.prod(shape[pos + 1:])) for pos in range(len(shape))], dtype=np.int64
+            )
+            inner_pos = [pos for pos, c in enumerate(inp) if c in inner_col]
+            outer_pos = [pos for pos, c in enumerate(inp) if c not in inner_col]
+            outer_shape = tuple(shape[pos] for pos in outer_pos)
+
+            if not inner_pos:
+                outer_offsets = np.zeros(0, dtype=np.int64)
+            elif not outer_pos:
+                outer_offsets = np.zeros(1, dtype=np.int64)
+            else:
+                outer_idx = np.indices(outer_shape, dtype=np.int64).reshape(len(outer_pos), -1)
+                outer_offsets = strides[outer_pos] @ outer_idx
+
+            tensors.append(
+                _TensorSamplePlan(
+                    shape=shape,
+                    outer_shape=outer_shape,
+                    inner_cols=np.array([inner_col[inp[pos]] for pos in inner_pos], dtype=np.int64),
+                    inner_strides=strides[inner_pos],
+                    outer_offsets=outer_offsets,
+                )
+            )
+            outer = "".join(inp[pos] for pos in outer_pos)
+            terms.append(sample_ind + outer if inner_pos else outer)
+
+        # Importance proposals from the |coefficient| marginals of the
+        # classical tensors, which are known ahead of execution
+        proposals = [np.ones(size, dtype=np.float64) for size in inner_sizes]
+        num_quantum = len(self.heinsum.quantum_tensors)
+        for ctensor, inp in zip(self.heinsum.classical_tensors, inputs[num_quantum:]):
+            magnitudes = np.abs(ctensor.data.detach().cpu().numpy().astype(np.float64))
+            for pos, c in enumerate(inp):
+                if c in inner_col:
+                    other_axes = tuple(a for a in range(len(inp)) if a != pos)
+                    proposals[inner_col[c]] *= magnitudes.sum(axis=other_axes)
+        for col, proposal in enumerate(proposals):
+            total = proposal.sum()
+            proposals[col] = proposal / total if total > 0 else np.full(len(proposal), 1 / len(proposal))
+
+        return _SamplePlan(
+            inner_indices=inner_indices,
+            inner_sizes=inner_sizes,
+            inner_volume=int(np.prod(inner_sizes)),
+            inner_proposals=proposals,
+            tensors=tensors,
+            sampled_expr=",".join(terms) + "->" + sample_ind + "".join(output),
+            output_shape=tuple(size_dict[c] for c in output),
+        )
 
     def _monte_carlo_contract(
         self,
-        sampled_assignments: list[tuple],
-        inner_ind_list: list[str],
-        inner_volume: int,
-        quantum_results: list,
-        classical_arrays: list[np.ndarray],
-        input_arrays: list[np.ndarray],
-        tensor_inner_inds: list[dict],
-        stats: dict,
-    ) -> np.ndarray:
+        plan: _SamplePlan,
+        sampled_assignments: np.ndarray,
+        sample_weights: np.ndarray,
+        operands: list,
+        max_chunk_elements: int = 1 << 24,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Perform Monte Carlo contraction over sampled inner indices.
 
-        For each sampled inner index assignment:
-        1. Extract the slice of each tensor at that inner index
-        2. Contract the remaining outer indices
-        3. Accumulate the result
-        4. Scale by (inner_volume / num_samples)
+        For every operand with inner indices, the slices at all sampled
+        inner assignments are gathered into one array with a leading sample
+        axis. A single einsum then contracts the outer indices of all
+        samples at once (in chunks of samples to bound memory). Each
+        per-sample contribution is weighted by its inverse sampling
+        probability, so the mean of the weighted contributions is an
+        unbiased estimate of the full contraction.
 
         Args:
-            sampled_assignments: List of sampled (inner_idx_1, inner_idx_2, ...) tuples.
-            inner_ind_list: Ordered list of inner index chars.
-            inner_volume: Total number of inner index combinations.
-            quantum_results: List of either dict (sampled) or ndarray (full).
-            classical_arrays: List of classical numpy arrays.
-            input_arrays: List of input numpy arrays.
-            tensor_inner_inds: For each tensor position, dict mapping inner ind to pos.
-            stats: Stats dict to update with sample values.
+            plan: The sample plan from :meth:`_build_sample_plan`.
+            sampled_assignments: (num_samples, num_inner) array of sampled
+                inner index values, columns ordered as ``plan.inner_indices``.
+            sample_weights: Inverse sampling probability of each sample.
+            operands: Einsum operands: ElementCache (sampled quantum
+                tensors) or full numpy arrays.
+            max_chunk_elements: Bound on the elements of a gathered operand
+                (or of the per-sample results) per chunk.
 
         Returns:
-            Approximate contraction result as numpy array.
+            Tuple of the sum and the sum of squares of the weighted
+            contributions (output shape), and the unweighted contribution of
+            each sample summed over the output.
         """
-        inputs, output = ctg.utils.eq_to_inputs_output(self.heinsum.einsum_expr)
-        n_quantum = len(quantum_results)
-        n_classical = len(classical_arrays)
-        n_input = len(input_arrays)
-
-        # Convert inner_ind_list to set for fast lookup
-        inner_ind_set = set(inner_ind_list)
-
-        # Build the reduced einsum expression (with inner indices removed)
-        reduced_inputs = []
-        for i, inp in enumerate(inputs):
-            reduced = "".join(c for c in inp if c not in inner_ind_set)
-            reduced_inputs.append(reduced)
-        # output is a tuple of chars, convert to string
-        output_str = "".join(output)
-        reduced_expr = ",".join(reduced_inputs) + "->" + output_str
-
-        # Determine output shape
-        output_shape = (
-            tuple(self.heinsum.size_dict[c] for c in output) if output else ()
-        )
-
-        # Accumulator for Monte Carlo sum
-        result_sum = np.zeros(output_shape, dtype=np.float64)
-
-        for assignment in sampled_assignments:
-            # Build assignment dict: inner_ind -> value
-            assign_dict = {
-                inner_ind_list[i]: assignment[i] for i in range(len(inner_ind_list))
-            }
-
-            # Extract slices from all tensors
-            sliced_operands = []
-
-            # Process each tensor
-            for tensor_idx in range(n_quantum + n_classical + n_input):
-                inner_pos_map = tensor_inner_inds[tensor_idx]
-                tensor_inds = inputs[tensor_idx]
-
-                if tensor_idx < n_quantum:
-                    # Quantum tensor
-                    q_result = quantum_results[tensor_idx]
-                    if isinstance(q_result, dict):
-                        # Sampled results - need to build sliced tensor
-                        # Determine outer shape
-                        outer_inds = [c for c in tensor_inds if c not in inner_ind_set]
-                        outer_shape = (
-                            tuple(self.heinsum.size_dict[c] for c in outer_inds)
-                            if outer_inds
-                            else ()
-                        )
-
-                        if outer_shape:
-                            sliced = np.zeros(outer_shape, dtype=np.float64)
-                            # Fill in from sampled results
-                            for full_idx, val in q_result.items():
-                                # Extract outer portion of full_idx
-                                outer_idx = tuple(
-                                    full_idx[pos]
-                                    for pos, c in enumerate(tensor_inds)
-                                    if c not in inner_ind_set
-                                )
-                                # Check if this sample matches our inner assignment
-                                matches = True
-                                for ind, pos in inner_pos_map.items():
-                                    if full_idx[pos] != assign_dict[ind]:
-                                        matches = False
-                                        break
-                                if matches:
-                                    sliced[outer_idx] = val
-                            sliced_operands.append(sliced)
-                        else:
-                            # Scalar output - find matching sample
-                            val = 0.0
-                            full_idx = tuple(assign_dict.get(c, 0) for c in tensor_inds)
-                            if full_idx in q_result:
-                                val = q_result[full_idx]
-                            sliced_operands.append(np.array(val))
-                    else:
-                        # Full tensor result
-                        sliced = self._slice_tensor(
-                            q_result, tensor_inds, inner_pos_map, assign_dict
-                        )
-                        sliced_operands.append(sliced)
-
-                elif tensor_idx < n_quantum + n_classical:
-                    # Classical tensor
-                    c_idx = tensor_idx - n_quantum
-                    sliced = self._slice_tensor(
-                        classical_arrays[c_idx], tensor_inds, inner_pos_map, assign_dict
-                    )
-                    sliced_operands.append(sliced)
-
-                else:
-                    # Input tensor
-                    i_idx = tensor_idx - n_quantum - n_classical
-                    sliced = self._slice_tensor(
-                        input_arrays[i_idx], tensor_inds, inner_pos_map, assign_dict
-                    )
-                    sliced_operands.append(sliced)
-
-            # Contract the sliced operands
-            if len(sliced_operands) == 1:
-                contribution = sliced_operands[0]
-            else:
-                contribution = np.einsum(reduced_expr, *sliced_operands)
-
-            # Accumulate
-            result_sum += contribution
-            stats["values"].append((float(np.sum(contribution)), 1.0))
-
-        # Scale by volume / num_samples (Monte Carlo estimator)
         num_samples = len(sampled_assignments)
-        result = result_sum * (inner_volume / num_samples)
-
-        return result
-
-    def _slice_tensor(
-        self,
-        tensor: np.ndarray,
-        tensor_inds: tuple[str, ...],
-        inner_pos_map: dict[str, int],
-        assign_dict: dict[str, int],
-    ) -> np.ndarray:
-        """Extract a slice of a tensor by fixing inner indices.
-
-        Args:
-            tensor: The tensor to slice.
-            tensor_inds: Index characters for each dimension.
-            inner_pos_map: Dict mapping inner index char to position.
-            assign_dict: Dict mapping inner index char to assigned value.
-
-        Returns:
-            Sliced tensor with inner dimensions removed.
-        """
-        if not inner_pos_map:
-            return tensor
-
-        # Build slice tuple
-        slices = []
-        for pos, ind in enumerate(tensor_inds):
-            if ind in assign_dict:
-                slices.append(assign_dict[ind])
-            else:
-                slices.append(slice(None))
-
-        return tensor[tuple(slices)]
+        largest = max(
+            [len(t.outer_offsets) for t in plan.tensors if t.has_inner]
+            + [int(np.prod(plan.output_shape))]
+        )
+        chunk = max(1, max_chunk_elements // largest)
+
+        weighted_sum = np.zeros(plan.output_shape, dtype=np.float64)
+        weighted_sq_sum = np.zeros(plan.output_shape, dtype=np.float64)
+        sample_sums = np.empty(num_samples, dtype=np.float64)
+        path = None
+        for start in range(0, num_samples, chunk):
+            block = sampled_assignments[start:start + chunk]
+            gathered = [
+                tensor_plan.gather(operand, block) if tensor_plan.has_inner else operand
+                for tensor_plan, operand in zip(plan.tensors, operands)
+            ]
+            if path is None:
+                path = np.einsum_path(plan.sampled_expr, *gathered, optimize="greedy")[0]
+            contributions = np.einsum(plan.sampled_expr, *gathered, optimize=path)
+
+            weights = sample_weights[start:start + len(block)]
+            weighted = contributions * weights.reshape((-1,) + (1,) * len(plan.output_shape))
+            weighted_sum += weighted.sum(axis=0)
+            weighted_sq_sum += np.square(weighted).sum(axis=0)
+            sample_sums[start:start + len(block)] = contributions.reshape(len(block), -1).sum(axis=1)
+
+        return weighted_sum, weighted_sq_sum, sample_sums
+
+    def _unused_symbol(self) -> str:
+        """An index symbol that does not occur in the einsum expression."""
+        expr = self.heinsum.einsum_expr
+        i = 0
+        while ctg.get_symbol(i) in expr:
+            i += 1
+        return ctg.get_symbol(i)
 
     # -------------------------------------------------------------------------
     # Properties
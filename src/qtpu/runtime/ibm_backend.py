@@ -192,20 +192,17 @@ class IBMBackend(QuantumBackend):
 
         eval_start = perf_counter()
 
-        # Get all flat circuits
-        flat_circuits = qtensor.flat()
-        n_circuits = len(flat_circuits)
+        n_circuits = qtensor.size
 
         if n_circuits == 0:
             result = torch.zeros(qtensor.shape, dtype=dtype, device=device)
             return result, 0.0, 0.0
 
-        # Decompose ISwitches into concrete gates
-        decomposed = [c.decompose() for c in flat_circuits]
-
-        # Bind parameters
+        # Build the flat circuits one at a time, decompose ISwitches into
+        # concrete gates and bind parameters
         bound = []
-        for circ in decomposed:
+        for circ in qtensor.iter_circuits():
+            circ = circ.decompose()
             if circ.parameters and params:
                 param_names = {p.name for p in circ.parameters}
                 to_bind = {k: v for k, v in params.items() if k in param_names}
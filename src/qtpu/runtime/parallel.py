@@ -0,0 +1,305 @@
+"""Concurrent evaluation of independent quantum tensors.
+
+The quantum tensors of an HEinsum (e.g. the fragments produced by
+``circuit_to_heinsum``) are independent of each other, so they can be
+evaluated concurrently. :class:`FragmentExecutor` wraps a
+``concurrent.futures`` executor and submits one backend evaluation per
+quantum tensor.
+
+Supported executors:
+    - ``"serial"``: evaluate inline in the calling thread (default).
+    - ``"thread"``: thread pool; suited for simulators that release the GIL.
+    - ``"process"``: process pool started with ``forkserver`` (or ``spawn``),
+      never ``fork``, since CUDA-Q, CUDA and OpenMP are not fork-safe once
+      initialized. Each worker unpickles a fresh copy of the backend (see
+      ``CudaQBackend.__getstate__``) and the quantum tensors, and compiles
+      its own kernels on first use. The backend must be picklable, and
+      scripts using this executor need an ``if __name__ == "__main__"``
+      guard.
+    - ``"async"``: asyncio event loop in a background thread, awaiting
+      :meth:`QuantumBackend.evaluate_async` - suited for remote backends.
+    - Any ``concurrent.futures.Executor`` instance.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import torch
+from qiskit.circuit import QuantumCircuit
+
+from qtpu.core import ISwitch, QuantumTensor
+
+if TYPE_CHECKING:
+    from qtpu.runtime.backends import QuantumBackend
+
+
+EXECUTOR_KINDS = ("serial", "thread", "process", "async")
+
+
+class _InlineExecutor(Executor):
+    """Executor that runs every task immediately in the calling thread."""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+class _AsyncioExecutor(Executor):
+    """Executor that runs coroutine functions on a background event loop."""
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        return asyncio.run_coroutine_threadsafe(fn(*args, **kwargs), self._loop)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if wait:
+            self._thread.join()
+
+
+class _VariantTable:
+    """Picklable ISwitch selector returning prebuilt variant circuits."""
+
+    def __init__(self, variants: tuple[QuantumCircuit, ...]):
+        self._variants = variants
+
+    def __call__(self, index: int) -> QuantumCircuit:
+        return self._variants[index]
+
+
+def _portable_circuit(circuit: QuantumCircuit, memo: dict[int, ISwitch]) -> QuantumCircuit:
+    """Copy a circuit with ISwitch selectors (often closures) replaced by variant tables."""
+    portable = circuit.copy_empty_like()
+    for instr in circuit:
+        op = instr.operation
+        if isinstance(op, ISwitch):
+            if id(op) not in memo:
+                variants = tuple(_portable_circuit(op.variant(i), memo) for i in range(op.size))
+                memo[id(op)] = ISwitch(op.param, op.num_qubits, op.size, _VariantTable(variants))
+            op = memo[id(op)]
+        portable.append(op, instr.qubits, instr.clbits, copy=False)
+    return portable
+
+
+def _portable_qtensors(qtensors: list[QuantumTensor]) -> list[QuantumTensor]:
+    """Picklable copies of quantum tensors for process pool workers."""
+    memo: dict[int, ISwitch] = {}
+    return [QuantumTensor(_portable_circuit(qtensor.circuit, memo)) for qtensor in qtensors]
+
+
+# State installed in worker processes by _init_worker.
+_worker_backend: QuantumBackend | None = None
+_worker_qtensors: list[QuantumTensor] = []
+
+
+def _init_worker(backend: QuantumBackend, qtensors: list[QuantumTensor]) -> None:
+    global _worker_backend, _worker_qtensors
+
+    _worker_backend = backend
+    _worker_qtensors = qtensors
+
+
+def _evaluate_in_worker(
+    index: int, params: dict[str, float], dtype: torch.dtype
+) -> tuple[torch.Tensor, float, float, float]:
+    return _timed_evaluate(
+        _worker_backend, _worker_qtensors[index], params, dtype, torch.device("cpu")
+    )
+
+
+def _timed_evaluate(
+    backend: QuantumBackend,
+    qtensor: QuantumTensor,
+    params: dict[str, float],
+    dtype: torch.dtype,
+    device: torch.device,
+) -> tuple[torch.Tensor, float, float, float]:
+    start = perf_counter()
+    result, eval_time, qpu_time = backend.evaluate(qtensor, params, dtype, device)
+    return result, eval_time, qpu_time, perf_counter() - start
+
+
+def _evaluate_batch_in_worker(
+    index: int, params_list: list[dict[str, float]], dtype: torch.dtype
+) -> tuple[torch.Tensor, float, float, float]:
+    return _timed_evaluate_batch(
+        _worker_backend, _worker_qtensors[index], params_list, dtype, torch.device("cpu")
+    )
+
+
+def _timed_evaluate_batch(
+    backend: QuantumBackend,
+    qtensor: QuantumTensor,
+    params_list: list[dict[str, float]],
+    dtype: torch.dtype,
+    device: torch.device,
+) -> tuple[torch.Tensor, float, float, float]:
+    start = perf_counter()
+    result, eval_time, qpu_time = backend.evaluate_batch(qtensor, params_list, dtype, device)
+    return result, eval_time, qpu_time, perf_counter() - start
+
+
+async def _timed_evaluate_batch_async(
+    backend: QuantumBackend,
+    qtensor: QuantumTensor,
+    params_list: list[dict[str, float]],
+    dtype: torch.dtype,
+    device: torch.device,
+) -> tuple[torch.Tensor, float, float, float]:
+    return await asyncio.to_thread(
+        _timed_evaluate_batch, backend, qtensor, params_list, dtype, device
+    )
+
+
+async def _timed_evaluate_async(
+    backend: QuantumBackend,
+    qtensor: QuantumTensor,
+    params: dict[str, float],
+    dtype: torch.dtype,
+    device: torch.device,
+) -> tuple[torch.Tensor, float, float, float]:
+    start = perf_counter()
+    result, eval_time, qpu_time = await backend.evaluate_async(qtensor, params, dtype, device)
+    return result, eval_time, qpu_time, perf_counter() - start
+
+
+class FragmentExecutor:
+    """Submits quantum tensor evaluations to a pluggable executor.
+
+    Args:
+        executor: One of ``"serial"``, ``"thread"``, ``"process"``, ``"async"``
+            or a ``concurrent.futures.Executor`` instance (not owned, i.e.
+            not shut down by :meth:`shutdown`).
+        backend: The quantum backend used for evaluation.
+        qtensors: The quantum tensors that will be evaluated, addressed by
+            their position.
+        max_workers: Number of workers for thread and process pools.
+    """
+
+    def __init__(
+        self,
+        executor: str | Executor,
+        backend: QuantumBackend,
+        qtensors: list[QuantumTensor],
+        max_workers: int | None = None,
+    ):
+        self._backend = backend
+        self._qtensors = qtensors
+        self._kind = executor if isinstance(executor, str) else "custom"
+        self._owned = isinstance(executor, str)
+
+        if executor == "serial":
+            self._executor: Executor = _InlineExecutor()
+        elif executor == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        elif executor == "process":
+            # Workers start from a fresh interpreter rather than a fork of
+            # this process, whose CUDA-Q/CUDA/OpenMP state is not fork-safe
+            start_method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=_init_worker,
+                initargs=(backend, _portable_qtensors(qtensors)),
+            )
+        elif executor == "async":
+            self._executor = _AsyncioExecutor()
+        elif isinstance(executor, Executor):
+            self._executor = executor
+        else:
+            raise ValueError(
+                f"Unknown executor: {executor!r}. "
+                f"Expected one of {EXECUTOR_KINDS} or a concurrent.futures.Executor."
+            )
+
+    @property
+    def kind(self) -> str:
+        """Executor kind ("serial", "thread", "process", "async" or "custom")."""
+        return self._kind
+
+    def submit(
+        self,
+        index: int,
+        params: dict[str, float],
+        dtype: torch.dtype,
+        device: torch.device,
+    ) -> Future:
+        """Submit the evaluation of one quantum tensor.
+
+        Args:
+            index: Position of the quantum tensor in ``qtensors``.
+            params: Circuit parameter values.
+            dtype: Result dtype.
+            device: Result device.
+
+        Returns:
+            Future resolving to (result, eval_time, qpu_time, wall_time), where
+            wall_time is the time spent in the backend call for this tensor.
+            For process pools the result is on the CPU.
+        """
+        if self._kind == "process":
+            return self._executor.submit(_evaluate_in_worker, index, params, dtype)
+        if self._kind == "async":
+            return self._executor.submit(
+                _timed_evaluate_async, self._backend, self._qtensors[index], params, dtype, device
+            )
+        return self._executor.submit(
+            _timed_evaluate, self._backend, self._qtensors[index], params, dtype, device
+        )
+
+    def submit_batch(
+        self,
+        index: int,
+        params_list: list[dict[str, float]],
+        dtype: torch.dtype,
+        device: torch.device,
+    ) -> Future:
+        """Submit the batched evaluation of one quantum tensor.
+
+        Args:
+            index: Position of the quantum tensor in ``qtensors``.
+            params_list: One dict of circuit parameter values per batch element.
+            dtype: Result dtype.
+            device: Result device.
+
+        Returns:
+            Future resolving to (result, eval_time, qpu_time, wall_time), where
+            result has a leading batch axis of length ``len(params_list)``.
+        """
+        if self._kind == "process":
+            return self._executor.submit(_evaluate_batch_in_worker, index, params_list, dtype)
+        if self._kind == "async":
+            return self._executor.submit(
+                _timed_evaluate_batch_async,
+                self._backend,
+                self._qtensors[index],
+                params_list,
+                dtype,
+                device,
+            )
+        return self._executor.submit(
+            _timed_evaluate_batch, self._backend, self._qtensors[index], params_list, dtype, device
+        )
+
+    def shutdown(self) -> None:
+        """Shut down the underlying executor if it is owned by this object."""
+        if self._owned:
+            self._executor.shutdown(wait=True)
@@ -14,12 +14,24 @@ class TimingBreakdown:
         circuit_generation_time: Time to generate/instantiate quantum circuits.
         circuit_compilation_time: Time to compile circuits (e.g., CUDA-Q JIT).
         optimization_time: Time for tensor network optimization (path finding).
+        kernel_cache_hits: Number of compiled kernels reused from the in-memory
+            or on-disk kernel cache instead of being generated.
+        fragment_compilation_times: Compilation time of each quantum tensor,
+            in HEinsum order (compilation runs concurrently, so these can
+            sum to more than circuit_compilation_time).
+        num_unique_kernels: Number of distinct kernels the quantum tensors
+            were compiled to.
         
         # Per-execution costs
-        quantum_eval_time: Wall-clock time spent evaluating quantum circuits.
+        quantum_eval_time: Time spent evaluating quantum circuits, summed over
+            all quantum tensors.
+        quantum_critical_path_time: Evaluation time of the slowest quantum
+            tensor, i.e. the quantum wall time with unlimited parallelism.
         quantum_estimated_qpu_time: Estimated time on real QPU hardware.
         classical_contraction_time: Time spent on tensor contraction.
         data_transfer_time: Time spent moving data (e.g., CPU <-> GPU).
+        quantum_classical_overlap_time: Contraction time spent while quantum
+            tensors were still being evaluated (streaming execution only).
         
         # Totals
         num_circuits: Total number of circuits evaluated.
@@ -34,15 +46,20 @@ class TimingBreakdown:
     circuit_generation_time: float = 0.0
     circuit_compilation_time: float = 0.0
     optimization_time: float = 0.0
+    kernel_cache_hits: int = 0
+    fragment_compilation_times: list[float] = field(default_factory=list)
+    num_unique_kernels: int = 0
     
     # Quantum timing (per-execution)
     quantum_eval_time: float = 0.0
+    quantum_critical_path_time: float = 0.0
     quantum_estimated_qpu_time: float = 0.0
     num_circuits: int = 0
     
     # Classical timing (per-execution)
     classical_contraction_time: float = 0.0
     data_transfer_time: float = 0.0
+    quantum_classical_overlap_time: float = 0.0
     
     # Memory
     peak_memory_bytes: int = 0
@@ -98,13 +115,18 @@ class TimingBreakdown:
             "circuit_compilation_time": self.circuit_compilation_time,
             "optimization_time": self.optimization_time,
             "preprocessing_time": self.preprocessing_time,
+            "kernel_cache_hits": self.kernel_cache_hits,
+            "fragment_compilation_times": list(self.fragment_compilation_times),
+            "num_unique_kernels": self.num_unique_kernels,
             # Quantum
             "quantum_eval_time": self.quantum_eval_time,
+            "quantum_critical_path_time": self.quantum_critical_path_time,
             "quantum_estimated_qpu_time": self.quantum_estimated_qpu_time,
             "num_circuits": self.num_circuits,
             # Classical
             "classical_contraction_time": self.classical_contraction_time,
             "data_transfer_time": self.data_transfer_time,
+            "quantum_classical_overlap_time": self.quantum_classical_overlap_time,
             # Code size
             "total_code_lines": self.total_code_lines,
             # Totals
@@ -130,13 +152,16 @@ class TimingBreakdown:
             "Timing Breakdown:",
             f"  Preprocessing: {self.preprocessing_time*1000:.1f}ms",
             f"    - Circuit generation: {self.circuit_generation_time*1000:.1f}ms",
-            f"    - Circuit compilation: {self.circuit_compilation_time*1000:.1f}ms",
+            f"    - Circuit compilation: {self.circuit_compilation_time*1000:.1f}ms"
+            f" ({self.num_unique_kernels} unique kernels, {self.kernel_cache_hits} kernel cache hits)",
             f"    - Optimization: {self.optimization_time*1000:.1f}ms",
             f"  Quantum: {self.quantum_eval_time*1000:.1f}ms ({self.num_circuits} circuits)",
+            f"    - Critical path: {self.quantum_critical_path_time*1000:.1f}ms",
             f"    - Estimated QPU time: {self.quantum_estimated_qpu_time*1000:.1f}ms",
             f"  Classical: {self.classical_time*1000:.1f}ms",
             f"    - Contraction: {self.classical_contraction_time*1000:.1f}ms",
             f"    - Data transfer: {self.data_transfer_time*1000:.1f}ms",
+            f"    - Overlapped with quantum: {self.quantum_classical_overlap_time*1000:.1f}ms",
             f"  Total: {self.total_time*1000:.1f}ms",
         ]
         return "\n".join(lines)